@@ -0,0 +1,62 @@
+"""
+Generate the hand evaluator lookup tables.
+
+The Cactus-Kev tables used by deeppoker.core.hand are pure functions of the
+hand-ranking rules, so they are generated once and checked in as
+``_hand_tables.py`` instead of being rebuilt on every import.
+
+Regenerate after changing the rank scale or the reference evaluator:
+
+    python -m deeppoker.core._gen_tables
+"""
+
+from pathlib import Path
+
+from deeppoker.core.hand import _build_lookup_tables
+
+
+TABLES_PATH = Path(__file__).with_name("_hand_tables.py")
+
+HEADER = '''"""
+Precomputed hand evaluator lookup tables.
+
+Generated by ``python -m deeppoker.core._gen_tables`` - do not edit by hand.
+"""
+
+'''
+
+
+def render_tables() -> str:
+    """Render the lookup tables as Python source."""
+    flush_ranks, unique5_ranks, paired_ranks = _build_lookup_tables()
+    lines = [HEADER]
+    
+    for name, table, comment in (
+        ("FLUSH_RANKS", flush_ranks, "Flush rank by 13-bit rank mask"),
+        ("UNIQUE5_RANKS", unique5_ranks, "Non-flush five-distinct-rank rank by rank mask"),
+    ):
+        lines.append(f"# {comment}\n{name} = {{\n")
+        lines.extend(
+            f"    {mask}: {rank},\n"
+            for mask, rank in enumerate(table) if rank is not None
+        )
+        lines.append("}\n\n")
+    
+    lines.append("# Rank of hands with a repeated rank, by product of rank primes\n")
+    lines.append("PAIRED_RANKS = {\n")
+    lines.extend(
+        f"    {product}: {rank},\n"
+        for product, rank in sorted(paired_ranks.items())
+    )
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main() -> None:
+    """Write the tables next to this module."""
+    TABLES_PATH.write_text(render_tables(), encoding="utf-8")
+    print(f"Wrote {TABLES_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7479 @@
+"""
+Precomputed hand evaluator lookup tables.
+
+Generated by ``python -m deeppoker.core._gen_tables`` - do not edit by hand.
+"""
+
+# Flush rank by 13-bit rank mask
+FLUSH_RANKS = {
+    31: 1000008,
+    47: 4221545,
+    55: 4219348,
+    59: 4219179,
+    61: 4219166,
+    62: 1000007,
+    79: 4192984,
+    87: 4190787,
+    91: 4190618,
+    93: 4190605,
+    94: 4190604,
+    103: 4188590,
+    107: 4188421,
+    109: 4188408,
+    110: 4188407,
+    115: 4188252,
+    117: 4188239,
+    118: 4188238,
+    121: 4188226,
+    122: 4188225,
+    124: 1000006,
+    143: 4164423,
+    151: 4162226,
+    155: 4162057,
+    157: 4162044,
+    158: 4162043,
+    167: 4160029,
+    171: 4159860,
+    173: 4159847,
+    174: 4159846,
+    179: 4159691,
+    181: 4159678,
+    182: 4159677,
+    185: 4159665,
+    186: 4159664,
+    188: 4159663,
+    199: 4157832,
+    203: 4157663,
+    205: 4157650,
+    206: 4157649,
+    211: 4157494,
+    213: 4157481,
+    214: 4157480,
+    217: 4157468,
+    218: 4157467,
+    220: 4157466,
+    227: 4157325,
+    229: 4157312,
+    230: 4157311,
+    233: 4157299,
+    234: 4157298,
+    236: 4157297,
+    241: 4157286,
+    242: 4157285,
+    244: 4157284,
+    248: 1000005,
+    271: 4135862,
+    279: 4133665,
+    283: 4133496,
+    285: 4133483,
+    286: 4133482,
+    295: 4131468,
+    299: 4131299,
+    301: 4131286,
+    302: 4131285,
+    307: 4131130,
+    309: 4131117,
+    310: 4131116,
+    313: 4131104,
+    314: 4131103,
+    316: 4131102,
+    327: 4129271,
+    331: 4129102,
+    333: 4129089,
+    334: 4129088,
+    339: 4128933,
+    341: 4128920,
+    342: 4128919,
+    345: 4128907,
+    346: 4128906,
+    348: 4128905,
+    355: 4128764,
+    357: 4128751,
+    358: 4128750,
+    361: 4128738,
+    362: 4128737,
+    364: 4128736,
+    369: 4128725,
+    370: 4128724,
+    372: 4128723,
+    376: 4128722,
+    391: 4127074,
+    395: 4126905,
+    397: 4126892,
+    398: 4126891,
+    403: 4126736,
+    405: 4126723,
+    406: 4126722,
+    409: 4126710,
+    410: 4126709,
+    412: 4126708,
+    419: 4126567,
+    421: 4126554,
+    422: 4126553,
+    425: 4126541,
+    426: 4126540,
+    428: 4126539,
+    433: 4126528,
+    434: 4126527,
+    436: 4126526,
+    440: 4126525,
+    451: 4126398,
+    453: 4126385,
+    454: 4126384,
+    457: 4126372,
+    458: 4126371,
+    460: 4126370,
+    465: 4126359,
+    466: 4126358,
+    468: 4126357,
+    472: 4126356,
+    481: 4126346,
+    482: 4126345,
+    484: 4126344,
+    488: 4126343,
+    496: 1000004,
+    527: 4107301,
+    535: 4105104,
+    539: 4104935,
+    541: 4104922,
+    542: 4104921,
+    551: 4102907,
+    555: 4102738,
+    557: 4102725,
+    558: 4102724,
+    563: 4102569,
+    565: 4102556,
+    566: 4102555,
+    569: 4102543,
+    570: 4102542,
+    572: 4102541,
+    583: 4100710,
+    587: 4100541,
+    589: 4100528,
+    590: 4100527,
+    595: 4100372,
+    597: 4100359,
+    598: 4100358,
+    601: 4100346,
+    602: 4100345,
+    604: 4100344,
+    611: 4100203,
+    613: 4100190,
+    614: 4100189,
+    617: 4100177,
+    618: 4100176,
+    620: 4100175,
+    625: 4100164,
+    626: 4100163,
+    628: 4100162,
+    632: 4100161,
+    647: 4098513,
+    651: 4098344,
+    653: 4098331,
+    654: 4098330,
+    659: 4098175,
+    661: 4098162,
+    662: 4098161,
+    665: 4098149,
+    666: 4098148,
+    668: 4098147,
+    675: 4098006,
+    677: 4097993,
+    678: 4097992,
+    681: 4097980,
+    682: 4097979,
+    684: 4097978,
+    689: 4097967,
+    690: 4097966,
+    692: 4097965,
+    696: 4097964,
+    707: 4097837,
+    709: 4097824,
+    710: 4097823,
+    713: 4097811,
+    714: 4097810,
+    716: 4097809,
+    721: 4097798,
+    722: 4097797,
+    724: 4097796,
+    728: 4097795,
+    737: 4097785,
+    738: 4097784,
+    740: 4097783,
+    744: 4097782,
+    752: 4097781,
+    775: 4096316,
+    779: 4096147,
+    781: 4096134,
+    782: 4096133,
+    787: 4095978,
+    789: 4095965,
+    790: 4095964,
+    793: 4095952,
+    794: 4095951,
+    796: 4095950,
+    803: 4095809,
+    805: 4095796,
+    806: 4095795,
+    809: 4095783,
+    810: 4095782,
+    812: 4095781,
+    817: 4095770,
+    818: 4095769,
+    820: 4095768,
+    824: 4095767,
+    835: 4095640,
+    837: 4095627,
+    838: 4095626,
+    841: 4095614,
+    842: 4095613,
+    844: 4095612,
+    849: 4095601,
+    850: 4095600,
+    852: 4095599,
+    856: 4095598,
+    865: 4095588,
+    866: 4095587,
+    868: 4095586,
+    872: 4095585,
+    880: 4095584,
+    899: 4095471,
+    901: 4095458,
+    902: 4095457,
+    905: 4095445,
+    906: 4095444,
+    908: 4095443,
+    913: 4095432,
+    914: 4095431,
+    916: 4095430,
+    920: 4095429,
+    929: 4095419,
+    930: 4095418,
+    932: 4095417,
+    936: 4095416,
+    944: 4095415,
+    961: 4095406,
+    962: 4095405,
+    964: 4095404,
+    968: 4095403,
+    976: 4095402,
+    992: 1000003,
+    1039: 4078740,
+    1047: 4076543,
+    1051: 4076374,
+    1053: 4076361,
+    1054: 4076360,
+    1063: 4074346,
+    1067: 4074177,
+    1069: 4074164,
+    1070: 4074163,
+    1075: 4074008,
+    1077: 4073995,
+    1078: 4073994,
+    1081: 4073982,
+    1082: 4073981,
+    1084: 4073980,
+    1095: 4072149,
+    1099: 4071980,
+    1101: 4071967,
+    1102: 4071966,
+    1107: 4071811,
+    1109: 4071798,
+    1110: 4071797,
+    1113: 4071785,
+    1114: 4071784,
+    1116: 4071783,
+    1123: 4071642,
+    1125: 4071629,
+    1126: 4071628,
+    1129: 4071616,
+    1130: 4071615,
+    1132: 4071614,
+    1137: 4071603,
+    1138: 4071602,
+    1140: 4071601,
+    1144: 4071600,
+    1159: 4069952,
+    1163: 4069783,
+    1165: 4069770,
+    1166: 4069769,
+    1171: 4069614,
+    1173: 4069601,
+    1174: 4069600,
+    1177: 4069588,
+    1178: 4069587,
+    1180: 4069586,
+    1187: 4069445,
+    1189: 4069432,
+    1190: 4069431,
+    1193: 4069419,
+    1194: 4069418,
+    1196: 4069417,
+    1201: 4069406,
+    1202: 4069405,
+    1204: 4069404,
+    1208: 4069403,
+    1219: 4069276,
+    1221: 4069263,
+    1222: 4069262,
+    1225: 4069250,
+    1226: 4069249,
+    1228: 4069248,
+    1233: 4069237,
+    1234: 4069236,
+    1236: 4069235,
+    1240: 4069234,
+    1249: 4069224,
+    1250: 4069223,
+    1252: 4069222,
+    1256: 4069221,
+    1264: 4069220,
+    1287: 4067755,
+    1291: 4067586,
+    1293: 4067573,
+    1294: 4067572,
+    1299: 4067417,
+    1301: 4067404,
+    1302: 4067403,
+    1305: 4067391,
+    1306: 4067390,
+    1308: 4067389,
+    1315: 4067248,
+    1317: 4067235,
+    1318: 4067234,
+    1321: 4067222,
+    1322: 4067221,
+    1324: 4067220,
+    1329: 4067209,
+    1330: 4067208,
+    1332: 4067207,
+    1336: 4067206,
+    1347: 4067079,
+    1349: 4067066,
+    1350: 4067065,
+    1353: 4067053,
+    1354: 4067052,
+    1356: 4067051,
+    1361: 4067040,
+    1362: 4067039,
+    1364: 4067038,
+    1368: 4067037,
+    1377: 4067027,
+    1378: 4067026,
+    1380: 4067025,
+    1384: 4067024,
+    1392: 4067023,
+    1411: 4066910,
+    1413: 4066897,
+    1414: 4066896,
+    1417: 4066884,
+    1418: 4066883,
+    1420: 4066882,
+    1425: 4066871,
+    1426: 4066870,
+    1428: 4066869,
+    1432: 4066868,
+    1441: 4066858,
+    1442: 4066857,
+    1444: 4066856,
+    1448: 4066855,
+    1456: 4066854,
+    1473: 4066845,
+    1474: 4066844,
+    1476: 4066843,
+    1480: 4066842,
+    1488: 4066841,
+    1504: 4066840,
+    1543: 4065558,
+    1547: 4065389,
+    1549: 4065376,
+    1550: 4065375,
+    1555: 4065220,
+    1557: 4065207,
+    1558: 4065206,
+    1561: 4065194,
+    1562: 4065193,
+    1564: 4065192,
+    1571: 4065051,
+    1573: 4065038,
+    1574: 4065037,
+    1577: 4065025,
+    1578: 4065024,
+    1580: 4065023,
+    1585: 4065012,
+    1586: 4065011,
+    1588: 4065010,
+    1592: 4065009,
+    1603: 4064882,
+    1605: 4064869,
+    1606: 4064868,
+    1609: 4064856,
+    1610: 4064855,
+    1612: 4064854,
+    1617: 4064843,
+    1618: 4064842,
+    1620: 4064841,
+    1624: 4064840,
+    1633: 4064830,
+    1634: 4064829,
+    1636: 4064828,
+    1640: 4064827,
+    1648: 4064826,
+    1667: 4064713,
+    1669: 4064700,
+    1670: 4064699,
+    1673: 4064687,
+    1674: 4064686,
+    1676: 4064685,
+    1681: 4064674,
+    1682: 4064673,
+    1684: 4064672,
+    1688: 4064671,
+    1697: 4064661,
+    1698: 4064660,
+    1700: 4064659,
+    1704: 4064658,
+    1712: 4064657,
+    1729: 4064648,
+    1730: 4064647,
+    1732: 4064646,
+    1736: 4064645,
+    1744: 4064644,
+    1760: 4064643,
+    1795: 4064544,
+    1797: 4064531,
+    1798: 4064530,
+    1801: 4064518,
+    1802: 4064517,
+    1804: 4064516,
+    1809: 4064505,
+    1810: 4064504,
+    1812: 4064503,
+    1816: 4064502,
+    1825: 4064492,
+    1826: 4064491,
+    1828: 4064490,
+    1832: 4064489,
+    1840: 4064488,
+    1857: 4064479,
+    1858: 4064478,
+    1860: 4064477,
+    1864: 4064476,
+    1872: 4064475,
+    1888: 4064474,
+    1921: 4064466,
+    1922: 4064465,
+    1924: 4064464,
+    1928: 4064463,
+    1936: 4064462,
+    1952: 4064461,
+    1984: 1000002,
+    2063: 4050179,
+    2071: 4047982,
+    2075: 4047813,
+    2077: 4047800,
+    2078: 4047799,
+    2087: 4045785,
+    2091: 4045616,
+    2093: 4045603,
+    2094: 4045602,
+    2099: 4045447,
+    2101: 4045434,
+    2102: 4045433,
+    2105: 4045421,
+    2106: 4045420,
+    2108: 4045419,
+    2119: 4043588,
+    2123: 4043419,
+    2125: 4043406,
+    2126: 4043405,
+    2131: 4043250,
+    2133: 4043237,
+    2134: 4043236,
+    2137: 4043224,
+    2138: 4043223,
+    2140: 4043222,
+    2147: 4043081,
+    2149: 4043068,
+    2150: 4043067,
+    2153: 4043055,
+    2154: 4043054,
+    2156: 4043053,
+    2161: 4043042,
+    2162: 4043041,
+    2164: 4043040,
+    2168: 4043039,
+    2183: 4041391,
+    2187: 4041222,
+    2189: 4041209,
+    2190: 4041208,
+    2195: 4041053,
+    2197: 4041040,
+    2198: 4041039,
+    2201: 4041027,
+    2202: 4041026,
+    2204: 4041025,
+    2211: 4040884,
+    2213: 4040871,
+    2214: 4040870,
+    2217: 4040858,
+    2218: 4040857,
+    2220: 4040856,
+    2225: 4040845,
+    2226: 4040844,
+    2228: 4040843,
+    2232: 4040842,
+    2243: 4040715,
+    2245: 4040702,
+    2246: 4040701,
+    2249: 4040689,
+    2250: 4040688,
+    2252: 4040687,
+    2257: 4040676,
+    2258: 4040675,
+    2260: 4040674,
+    2264: 4040673,
+    2273: 4040663,
+    2274: 4040662,
+    2276: 4040661,
+    2280: 4040660,
+    2288: 4040659,
+    2311: 4039194,
+    2315: 4039025,
+    2317: 4039012,
+    2318: 4039011,
+    2323: 4038856,
+    2325: 4038843,
+    2326: 4038842,
+    2329: 4038830,
+    2330: 4038829,
+    2332: 4038828,
+    2339: 4038687,
+    2341: 4038674,
+    2342: 4038673,
+    2345: 4038661,
+    2346: 4038660,
+    2348: 4038659,
+    2353: 4038648,
+    2354: 4038647,
+    2356: 4038646,
+    2360: 4038645,
+    2371: 4038518,
+    2373: 4038505,
+    2374: 4038504,
+    2377: 4038492,
+    2378: 4038491,
+    2380: 4038490,
+    2385: 4038479,
+    2386: 4038478,
+    2388: 4038477,
+    2392: 4038476,
+    2401: 4038466,
+    2402: 4038465,
+    2404: 4038464,
+    2408: 4038463,
+    2416: 4038462,
+    2435: 4038349,
+    2437: 4038336,
+    2438: 4038335,
+    2441: 4038323,
+    2442: 4038322,
+    2444: 4038321,
+    2449: 4038310,
+    2450: 4038309,
+    2452: 4038308,
+    2456: 4038307,
+    2465: 4038297,
+    2466: 4038296,
+    2468: 4038295,
+    2472: 4038294,
+    2480: 4038293,
+    2497: 4038284,
+    2498: 4038283,
+    2500: 4038282,
+    2504: 4038281,
+    2512: 4038280,
+    2528: 4038279,
+    2567: 4036997,
+    2571: 4036828,
+    2573: 4036815,
+    2574: 4036814,
+    2579: 4036659,
+    2581: 4036646,
+    2582: 4036645,
+    2585: 4036633,
+    2586: 4036632,
+    2588: 4036631,
+    2595: 4036490,
+    2597: 4036477,
+    2598: 4036476,
+    2601: 4036464,
+    2602: 4036463,
+    2604: 4036462,
+    2609: 4036451,
+    2610: 4036450,
+    2612: 4036449,
+    2616: 4036448,
+    2627: 4036321,
+    2629: 4036308,
+    2630: 4036307,
+    2633: 4036295,
+    2634: 4036294,
+    2636: 4036293,
+    2641: 4036282,
+    2642: 4036281,
+    2644: 4036280,
+    2648: 4036279,
+    2657: 4036269,
+    2658: 4036268,
+    2660: 4036267,
+    2664: 4036266,
+    2672: 4036265,
+    2691: 4036152,
+    2693: 4036139,
+    2694: 4036138,
+    2697: 4036126,
+    2698: 4036125,
+    2700: 4036124,
+    2705: 4036113,
+    2706: 4036112,
+    2708: 4036111,
+    2712: 4036110,
+    2721: 4036100,
+    2722: 4036099,
+    2724: 4036098,
+    2728: 4036097,
+    2736: 4036096,
+    2753: 4036087,
+    2754: 4036086,
+    2756: 4036085,
+    2760: 4036084,
+    2768: 4036083,
+    2784: 4036082,
+    2819: 4035983,
+    2821: 4035970,
+    2822: 4035969,
+    2825: 4035957,
+    2826: 4035956,
+    2828: 4035955,
+    2833: 4035944,
+    2834: 4035943,
+    2836: 4035942,
+    2840: 4035941,
+    2849: 4035931,
+    2850: 4035930,
+    2852: 4035929,
+    2856: 4035928,
+    2864: 4035927,
+    2881: 4035918,
+    2882: 4035917,
+    2884: 4035916,
+    2888: 4035915,
+    2896: 4035914,
+    2912: 4035913,
+    2945: 4035905,
+    2946: 4035904,
+    2948: 4035903,
+    2952: 4035902,
+    2960: 4035901,
+    2976: 4035900,
+    3008: 4035899,
+    3079: 4034800,
+    3083: 4034631,
+    3085: 4034618,
+    3086: 4034617,
+    3091: 4034462,
+    3093: 4034449,
+    3094: 4034448,
+    3097: 4034436,
+    3098: 4034435,
+    3100: 4034434,
+    3107: 4034293,
+    3109: 4034280,
+    3110: 4034279,
+    3113: 4034267,
+    3114: 4034266,
+    3116: 4034265,
+    3121: 4034254,
+    3122: 4034253,
+    3124: 4034252,
+    3128: 4034251,
+    3139: 4034124,
+    3141: 4034111,
+    3142: 4034110,
+    3145: 4034098,
+    3146: 4034097,
+    3148: 4034096,
+    3153: 4034085,
+    3154: 4034084,
+    3156: 4034083,
+    3160: 4034082,
+    3169: 4034072,
+    3170: 4034071,
+    3172: 4034070,
+    3176: 4034069,
+    3184: 4034068,
+    3203: 4033955,
+    3205: 4033942,
+    3206: 4033941,
+    3209: 4033929,
+    3210: 4033928,
+    3212: 4033927,
+    3217: 4033916,
+    3218: 4033915,
+    3220: 4033914,
+    3224: 4033913,
+    3233: 4033903,
+    3234: 4033902,
+    3236: 4033901,
+    3240: 4033900,
+    3248: 4033899,
+    3265: 4033890,
+    3266: 4033889,
+    3268: 4033888,
+    3272: 4033887,
+    3280: 4033886,
+    3296: 4033885,
+    3331: 4033786,
+    3333: 4033773,
+    3334: 4033772,
+    3337: 4033760,
+    3338: 4033759,
+    3340: 4033758,
+    3345: 4033747,
+    3346: 4033746,
+    3348: 4033745,
+    3352: 4033744,
+    3361: 4033734,
+    3362: 4033733,
+    3364: 4033732,
+    3368: 4033731,
+    3376: 4033730,
+    3393: 4033721,
+    3394: 4033720,
+    3396: 4033719,
+    3400: 4033718,
+    3408: 4033717,
+    3424: 4033716,
+    3457: 4033708,
+    3458: 4033707,
+    3460: 4033706,
+    3464: 4033705,
+    3472: 4033704,
+    3488: 4033703,
+    3520: 4033702,
+    3587: 4033617,
+    3589: 4033604,
+    3590: 4033603,
+    3593: 4033591,
+    3594: 4033590,
+    3596: 4033589,
+    3601: 4033578,
+    3602: 4033577,
+    3604: 4033576,
+    3608: 4033575,
+    3617: 4033565,
+    3618: 4033564,
+    3620: 4033563,
+    3624: 4033562,
+    3632: 4033561,
+    3649: 4033552,
+    3650: 4033551,
+    3652: 4033550,
+    3656: 4033549,
+    3664: 4033548,
+    3680: 4033547,
+    3713: 4033539,
+    3714: 4033538,
+    3716: 4033537,
+    3720: 4033536,
+    3728: 4033535,
+    3744: 4033534,
+    3776: 4033533,
+    3841: 4033526,
+    3842: 4033525,
+    3844: 4033524,
+    3848: 4033523,
+    3856: 4033522,
+    3872: 4033521,
+    3904: 4033520,
+    3968: 1000001,
+    4111: 1000009,
+    4119: 4019421,
+    4123: 4019252,
+    4125: 4019239,
+    4126: 4019238,
+    4135: 4017224,
+    4139: 4017055,
+    4141: 4017042,
+    4142: 4017041,
+    4147: 4016886,
+    4149: 4016873,
+    4150: 4016872,
+    4153: 4016860,
+    4154: 4016859,
+    4156: 4016858,
+    4167: 4015027,
+    4171: 4014858,
+    4173: 4014845,
+    4174: 4014844,
+    4179: 4014689,
+    4181: 4014676,
+    4182: 4014675,
+    4185: 4014663,
+    4186: 4014662,
+    4188: 4014661,
+    4195: 4014520,
+    4197: 4014507,
+    4198: 4014506,
+    4201: 4014494,
+    4202: 4014493,
+    4204: 4014492,
+    4209: 4014481,
+    4210: 4014480,
+    4212: 4014479,
+    4216: 4014478,
+    4231: 4012830,
+    4235: 4012661,
+    4237: 4012648,
+    4238: 4012647,
+    4243: 4012492,
+    4245: 4012479,
+    4246: 4012478,
+    4249: 4012466,
+    4250: 4012465,
+    4252: 4012464,
+    4259: 4012323,
+    4261: 4012310,
+    4262: 4012309,
+    4265: 4012297,
+    4266: 4012296,
+    4268: 4012295,
+    4273: 4012284,
+    4274: 4012283,
+    4276: 4012282,
+    4280: 4012281,
+    4291: 4012154,
+    4293: 4012141,
+    4294: 4012140,
+    4297: 4012128,
+    4298: 4012127,
+    4300: 4012126,
+    4305: 4012115,
+    4306: 4012114,
+    4308: 4012113,
+    4312: 4012112,
+    4321: 4012102,
+    4322: 4012101,
+    4324: 4012100,
+    4328: 4012099,
+    4336: 4012098,
+    4359: 4010633,
+    4363: 4010464,
+    4365: 4010451,
+    4366: 4010450,
+    4371: 4010295,
+    4373: 4010282,
+    4374: 4010281,
+    4377: 4010269,
+    4378: 4010268,
+    4380: 4010267,
+    4387: 4010126,
+    4389: 4010113,
+    4390: 4010112,
+    4393: 4010100,
+    4394: 4010099,
+    4396: 4010098,
+    4401: 4010087,
+    4402: 4010086,
+    4404: 4010085,
+    4408: 4010084,
+    4419: 4009957,
+    4421: 4009944,
+    4422: 4009943,
+    4425: 4009931,
+    4426: 4009930,
+    4428: 4009929,
+    4433: 4009918,
+    4434: 4009917,
+    4436: 4009916,
+    4440: 4009915,
+    4449: 4009905,
+    4450: 4009904,
+    4452: 4009903,
+    4456: 4009902,
+    4464: 4009901,
+    4483: 4009788,
+    4485: 4009775,
+    4486: 4009774,
+    4489: 4009762,
+    4490: 4009761,
+    4492: 4009760,
+    4497: 4009749,
+    4498: 4009748,
+    4500: 4009747,
+    4504: 4009746,
+    4513: 4009736,
+    4514: 4009735,
+    4516: 4009734,
+    4520: 4009733,
+    4528: 4009732,
+    4545: 4009723,
+    4546: 4009722,
+    4548: 4009721,
+    4552: 4009720,
+    4560: 4009719,
+    4576: 4009718,
+    4615: 4008436,
+    4619: 4008267,
+    4621: 4008254,
+    4622: 4008253,
+    4627: 4008098,
+    4629: 4008085,
+    4630: 4008084,
+    4633: 4008072,
+    4634: 4008071,
+    4636: 4008070,
+    4643: 4007929,
+    4645: 4007916,
+    4646: 4007915,
+    4649: 4007903,
+    4650: 4007902,
+    4652: 4007901,
+    4657: 4007890,
+    4658: 4007889,
+    4660: 4007888,
+    4664: 4007887,
+    4675: 4007760,
+    4677: 4007747,
+    4678: 4007746,
+    4681: 4007734,
+    4682: 4007733,
+    4684: 4007732,
+    4689: 4007721,
+    4690: 4007720,
+    4692: 4007719,
+    4696: 4007718,
+    4705: 4007708,
+    4706: 4007707,
+    4708: 4007706,
+    4712: 4007705,
+    4720: 4007704,
+    4739: 4007591,
+    4741: 4007578,
+    4742: 4007577,
+    4745: 4007565,
+    4746: 4007564,
+    4748: 4007563,
+    4753: 4007552,
+    4754: 4007551,
+    4756: 4007550,
+    4760: 4007549,
+    4769: 4007539,
+    4770: 4007538,
+    4772: 4007537,
+    4776: 4007536,
+    4784: 4007535,
+    4801: 4007526,
+    4802: 4007525,
+    4804: 4007524,
+    4808: 4007523,
+    4816: 4007522,
+    4832: 4007521,
+    4867: 4007422,
+    4869: 4007409,
+    4870: 4007408,
+    4873: 4007396,
+    4874: 4007395,
+    4876: 4007394,
+    4881: 4007383,
+    4882: 4007382,
+    4884: 4007381,
+    4888: 4007380,
+    4897: 4007370,
+    4898: 4007369,
+    4900: 4007368,
+    4904: 4007367,
+    4912: 4007366,
+    4929: 4007357,
+    4930: 4007356,
+    4932: 4007355,
+    4936: 4007354,
+    4944: 4007353,
+    4960: 4007352,
+    4993: 4007344,
+    4994: 4007343,
+    4996: 4007342,
+    5000: 4007341,
+    5008: 4007340,
+    5024: 4007339,
+    5056: 4007338,
+    5127: 4006239,
+    5131: 4006070,
+    5133: 4006057,
+    5134: 4006056,
+    5139: 4005901,
+    5141: 4005888,
+    5142: 4005887,
+    5145: 4005875,
+    5146: 4005874,
+    5148: 4005873,
+    5155: 4005732,
+    5157: 4005719,
+    5158: 4005718,
+    5161: 4005706,
+    5162: 4005705,
+    5164: 4005704,
+    5169: 4005693,
+    5170: 4005692,
+    5172: 4005691,
+    5176: 4005690,
+    5187: 4005563,
+    5189: 4005550,
+    5190: 4005549,
+    5193: 4005537,
+    5194: 4005536,
+    5196: 4005535,
+    5201: 4005524,
+    5202: 4005523,
+    5204: 4005522,
+    5208: 4005521,
+    5217: 4005511,
+    5218: 4005510,
+    5220: 4005509,
+    5224: 4005508,
+    5232: 4005507,
+    5251: 4005394,
+    5253: 4005381,
+    5254: 4005380,
+    5257: 4005368,
+    5258: 4005367,
+    5260: 4005366,
+    5265: 4005355,
+    5266: 4005354,
+    5268: 4005353,
+    5272: 4005352,
+    5281: 4005342,
+    5282: 4005341,
+    5284: 4005340,
+    5288: 4005339,
+    5296: 4005338,
+    5313: 4005329,
+    5314: 4005328,
+    5316: 4005327,
+    5320: 4005326,
+    5328: 4005325,
+    5344: 4005324,
+    5379: 4005225,
+    5381: 4005212,
+    5382: 4005211,
+    5385: 4005199,
+    5386: 4005198,
+    5388: 4005197,
+    5393: 4005186,
+    5394: 4005185,
+    5396: 4005184,
+    5400: 4005183,
+    5409: 4005173,
+    5410: 4005172,
+    5412: 4005171,
+    5416: 4005170,
+    5424: 4005169,
+    5441: 4005160,
+    5442: 4005159,
+    5444: 4005158,
+    5448: 4005157,
+    5456: 4005156,
+    5472: 4005155,
+    5505: 4005147,
+    5506: 4005146,
+    5508: 4005145,
+    5512: 4005144,
+    5520: 4005143,
+    5536: 4005142,
+    5568: 4005141,
+    5635: 4005056,
+    5637: 4005043,
+    5638: 4005042,
+    5641: 4005030,
+    5642: 4005029,
+    5644: 4005028,
+    5649: 4005017,
+    5650: 4005016,
+    5652: 4005015,
+    5656: 4005014,
+    5665: 4005004,
+    5666: 4005003,
+    5668: 4005002,
+    5672: 4005001,
+    5680: 4005000,
+    5697: 4004991,
+    5698: 4004990,
+    5700: 4004989,
+    5704: 4004988,
+    5712: 4004987,
+    5728: 4004986,
+    5761: 4004978,
+    5762: 4004977,
+    5764: 4004976,
+    5768: 4004975,
+    5776: 4004974,
+    5792: 4004973,
+    5824: 4004972,
+    5889: 4004965,
+    5890: 4004964,
+    5892: 4004963,
+    5896: 4004962,
+    5904: 4004961,
+    5920: 4004960,
+    5952: 4004959,
+    6016: 4004958,
+    6151: 4004042,
+    6155: 4003873,
+    6157: 4003860,
+    6158: 4003859,
+    6163: 4003704,
+    6165: 4003691,
+    6166: 4003690,
+    6169: 4003678,
+    6170: 4003677,
+    6172: 4003676,
+    6179: 4003535,
+    6181: 4003522,
+    6182: 4003521,
+    6185: 4003509,
+    6186: 4003508,
+    6188: 4003507,
+    6193: 4003496,
+    6194: 4003495,
+    6196: 4003494,
+    6200: 4003493,
+    6211: 4003366,
+    6213: 4003353,
+    6214: 4003352,
+    6217: 4003340,
+    6218: 4003339,
+    6220: 4003338,
+    6225: 4003327,
+    6226: 4003326,
+    6228: 4003325,
+    6232: 4003324,
+    6241: 4003314,
+    6242: 4003313,
+    6244: 4003312,
+    6248: 4003311,
+    6256: 4003310,
+    6275: 4003197,
+    6277: 4003184,
+    6278: 4003183,
+    6281: 4003171,
+    6282: 4003170,
+    6284: 4003169,
+    6289: 4003158,
+    6290: 4003157,
+    6292: 4003156,
+    6296: 4003155,
+    6305: 4003145,
+    6306: 4003144,
+    6308: 4003143,
+    6312: 4003142,
+    6320: 4003141,
+    6337: 4003132,
+    6338: 4003131,
+    6340: 4003130,
+    6344: 4003129,
+    6352: 4003128,
+    6368: 4003127,
+    6403: 4003028,
+    6405: 4003015,
+    6406: 4003014,
+    6409: 4003002,
+    6410: 4003001,
+    6412: 4003000,
+    6417: 4002989,
+    6418: 4002988,
+    6420: 4002987,
+    6424: 4002986,
+    6433: 4002976,
+    6434: 4002975,
+    6436: 4002974,
+    6440: 4002973,
+    6448: 4002972,
+    6465: 4002963,
+    6466: 4002962,
+    6468: 4002961,
+    6472: 4002960,
+    6480: 4002959,
+    6496: 4002958,
+    6529: 4002950,
+    6530: 4002949,
+    6532: 4002948,
+    6536: 4002947,
+    6544: 4002946,
+    6560: 4002945,
+    6592: 4002944,
+    6659: 4002859,
+    6661: 4002846,
+    6662: 4002845,
+    6665: 4002833,
+    6666: 4002832,
+    6668: 4002831,
+    6673: 4002820,
+    6674: 4002819,
+    6676: 4002818,
+    6680: 4002817,
+    6689: 4002807,
+    6690: 4002806,
+    6692: 4002805,
+    6696: 4002804,
+    6704: 4002803,
+    6721: 4002794,
+    6722: 4002793,
+    6724: 4002792,
+    6728: 4002791,
+    6736: 4002790,
+    6752: 4002789,
+    6785: 4002781,
+    6786: 4002780,
+    6788: 4002779,
+    6792: 4002778,
+    6800: 4002777,
+    6816: 4002776,
+    6848: 4002775,
+    6913: 4002768,
+    6914: 4002767,
+    6916: 4002766,
+    6920: 4002765,
+    6928: 4002764,
+    6944: 4002763,
+    6976: 4002762,
+    7040: 4002761,
+    7171: 4002690,
+    7173: 4002677,
+    7174: 4002676,
+    7177: 4002664,
+    7178: 4002663,
+    7180: 4002662,
+    7185: 4002651,
+    7186: 4002650,
+    7188: 4002649,
+    7192: 4002648,
+    7201: 4002638,
+    7202: 4002637,
+    7204: 4002636,
+    7208: 4002635,
+    7216: 4002634,
+    7233: 4002625,
+    7234: 4002624,
+    7236: 4002623,
+    7240: 4002622,
+    7248: 4002621,
+    7264: 4002620,
+    7297: 4002612,
+    7298: 4002611,
+    7300: 4002610,
+    7304: 4002609,
+    7312: 4002608,
+    7328: 4002607,
+    7360: 4002606,
+    7425: 4002599,
+    7426: 4002598,
+    7428: 4002597,
+    7432: 4002596,
+    7440: 4002595,
+    7456: 4002594,
+    7488: 4002593,
+    7552: 4002592,
+    7681: 4002586,
+    7682: 4002585,
+    7684: 4002584,
+    7688: 4002583,
+    7696: 4002582,
+    7712: 4002581,
+    7744: 4002580,
+    7808: 4002579,
+    7936: 0,
+}
+
+# Non-flush five-distinct-rank rank by rank mask
+UNIQUE5_RANKS = {
+    31: 5000008,
+    47: 9221545,
+    55: 9219348,
+    59: 9219179,
+    61: 9219166,
+    62: 5000007,
+    79: 9192984,
+    87: 9190787,
+    91: 9190618,
+    93: 9190605,
+    94: 9190604,
+    103: 9188590,
+    107: 9188421,
+    109: 9188408,
+    110: 9188407,
+    115: 9188252,
+    117: 9188239,
+    118: 9188238,
+    121: 9188226,
+    122: 9188225,
+    124: 5000006,
+    143: 9164423,
+    151: 9162226,
+    155: 9162057,
+    157: 9162044,
+    158: 9162043,
+    167: 9160029,
+    171: 9159860,
+    173: 9159847,
+    174: 9159846,
+    179: 9159691,
+    181: 9159678,
+    182: 9159677,
+    185: 9159665,
+    186: 9159664,
+    188: 9159663,
+    199: 9157832,
+    203: 9157663,
+    205: 9157650,
+    206: 9157649,
+    211: 9157494,
+    213: 9157481,
+    214: 9157480,
+    217: 9157468,
+    218: 9157467,
+    220: 9157466,
+    227: 9157325,
+    229: 9157312,
+    230: 9157311,
+    233: 9157299,
+    234: 9157298,
+    236: 9157297,
+    241: 9157286,
+    242: 9157285,
+    244: 9157284,
+    248: 5000005,
+    271: 9135862,
+    279: 9133665,
+    283: 9133496,
+    285: 9133483,
+    286: 9133482,
+    295: 9131468,
+    299: 9131299,
+    301: 9131286,
+    302: 9131285,
+    307: 9131130,
+    309: 9131117,
+    310: 9131116,
+    313: 9131104,
+    314: 9131103,
+    316: 9131102,
+    327: 9129271,
+    331: 9129102,
+    333: 9129089,
+    334: 9129088,
+    339: 9128933,
+    341: 9128920,
+    342: 9128919,
+    345: 9128907,
+    346: 9128906,
+    348: 9128905,
+    355: 9128764,
+    357: 9128751,
+    358: 9128750,
+    361: 9128738,
+    362: 9128737,
+    364: 9128736,
+    369: 9128725,
+    370: 9128724,
+    372: 9128723,
+    376: 9128722,
+    391: 9127074,
+    395: 9126905,
+    397: 9126892,
+    398: 9126891,
+    403: 9126736,
+    405: 9126723,
+    406: 9126722,
+    409: 9126710,
+    410: 9126709,
+    412: 9126708,
+    419: 9126567,
+    421: 9126554,
+    422: 9126553,
+    425: 9126541,
+    426: 9126540,
+    428: 9126539,
+    433: 9126528,
+    434: 9126527,
+    436: 9126526,
+    440: 9126525,
+    451: 9126398,
+    453: 9126385,
+    454: 9126384,
+    457: 9126372,
+    458: 9126371,
+    460: 9126370,
+    465: 9126359,
+    466: 9126358,
+    468: 9126357,
+    472: 9126356,
+    481: 9126346,
+    482: 9126345,
+    484: 9126344,
+    488: 9126343,
+    496: 5000004,
+    527: 9107301,
+    535: 9105104,
+    539: 9104935,
+    541: 9104922,
+    542: 9104921,
+    551: 9102907,
+    555: 9102738,
+    557: 9102725,
+    558: 9102724,
+    563: 9102569,
+    565: 9102556,
+    566: 9102555,
+    569: 9102543,
+    570: 9102542,
+    572: 9102541,
+    583: 9100710,
+    587: 9100541,
+    589: 9100528,
+    590: 9100527,
+    595: 9100372,
+    597: 9100359,
+    598: 9100358,
+    601: 9100346,
+    602: 9100345,
+    604: 9100344,
+    611: 9100203,
+    613: 9100190,
+    614: 9100189,
+    617: 9100177,
+    618: 9100176,
+    620: 9100175,
+    625: 9100164,
+    626: 9100163,
+    628: 9100162,
+    632: 9100161,
+    647: 9098513,
+    651: 9098344,
+    653: 9098331,
+    654: 9098330,
+    659: 9098175,
+    661: 9098162,
+    662: 9098161,
+    665: 9098149,
+    666: 9098148,
+    668: 9098147,
+    675: 9098006,
+    677: 9097993,
+    678: 9097992,
+    681: 9097980,
+    682: 9097979,
+    684: 9097978,
+    689: 9097967,
+    690: 9097966,
+    692: 9097965,
+    696: 9097964,
+    707: 9097837,
+    709: 9097824,
+    710: 9097823,
+    713: 9097811,
+    714: 9097810,
+    716: 9097809,
+    721: 9097798,
+    722: 9097797,
+    724: 9097796,
+    728: 9097795,
+    737: 9097785,
+    738: 9097784,
+    740: 9097783,
+    744: 9097782,
+    752: 9097781,
+    775: 9096316,
+    779: 9096147,
+    781: 9096134,
+    782: 9096133,
+    787: 9095978,
+    789: 9095965,
+    790: 9095964,
+    793: 9095952,
+    794: 9095951,
+    796: 9095950,
+    803: 9095809,
+    805: 9095796,
+    806: 9095795,
+    809: 9095783,
+    810: 9095782,
+    812: 9095781,
+    817: 9095770,
+    818: 9095769,
+    820: 9095768,
+    824: 9095767,
+    835: 9095640,
+    837: 9095627,
+    838: 9095626,
+    841: 9095614,
+    842: 9095613,
+    844: 9095612,
+    849: 9095601,
+    850: 9095600,
+    852: 9095599,
+    856: 9095598,
+    865: 9095588,
+    866: 9095587,
+    868: 9095586,
+    872: 9095585,
+    880: 9095584,
+    899: 9095471,
+    901: 9095458,
+    902: 9095457,
+    905: 9095445,
+    906: 9095444,
+    908: 9095443,
+    913: 9095432,
+    914: 9095431,
+    916: 9095430,
+    920: 9095429,
+    929: 9095419,
+    930: 9095418,
+    932: 9095417,
+    936: 9095416,
+    944: 9095415,
+    961: 9095406,
+    962: 9095405,
+    964: 9095404,
+    968: 9095403,
+    976: 9095402,
+    992: 5000003,
+    1039: 9078740,
+    1047: 9076543,
+    1051: 9076374,
+    1053: 9076361,
+    1054: 9076360,
+    1063: 9074346,
+    1067: 9074177,
+    1069: 9074164,
+    1070: 9074163,
+    1075: 9074008,
+    1077: 9073995,
+    1078: 9073994,
+    1081: 9073982,
+    1082: 9073981,
+    1084: 9073980,
+    1095: 9072149,
+    1099: 9071980,
+    1101: 9071967,
+    1102: 9071966,
+    1107: 9071811,
+    1109: 9071798,
+    1110: 9071797,
+    1113: 9071785,
+    1114: 9071784,
+    1116: 9071783,
+    1123: 9071642,
+    1125: 9071629,
+    1126: 9071628,
+    1129: 9071616,
+    1130: 9071615,
+    1132: 9071614,
+    1137: 9071603,
+    1138: 9071602,
+    1140: 9071601,
+    1144: 9071600,
+    1159: 9069952,
+    1163: 9069783,
+    1165: 9069770,
+    1166: 9069769,
+    1171: 9069614,
+    1173: 9069601,
+    1174: 9069600,
+    1177: 9069588,
+    1178: 9069587,
+    1180: 9069586,
+    1187: 9069445,
+    1189: 9069432,
+    1190: 9069431,
+    1193: 9069419,
+    1194: 9069418,
+    1196: 9069417,
+    1201: 9069406,
+    1202: 9069405,
+    1204: 9069404,
+    1208: 9069403,
+    1219: 9069276,
+    1221: 9069263,
+    1222: 9069262,
+    1225: 9069250,
+    1226: 9069249,
+    1228: 9069248,
+    1233: 9069237,
+    1234: 9069236,
+    1236: 9069235,
+    1240: 9069234,
+    1249: 9069224,
+    1250: 9069223,
+    1252: 9069222,
+    1256: 9069221,
+    1264: 9069220,
+    1287: 9067755,
+    1291: 9067586,
+    1293: 9067573,
+    1294: 9067572,
+    1299: 9067417,
+    1301: 9067404,
+    1302: 9067403,
+    1305: 9067391,
+    1306: 9067390,
+    1308: 9067389,
+    1315: 9067248,
+    1317: 9067235,
+    1318: 9067234,
+    1321: 9067222,
+    1322: 9067221,
+    1324: 9067220,
+    1329: 9067209,
+    1330: 9067208,
+    1332: 9067207,
+    1336: 9067206,
+    1347: 9067079,
+    1349: 9067066,
+    1350: 9067065,
+    1353: 9067053,
+    1354: 9067052,
+    1356: 9067051,
+    1361: 9067040,
+    1362: 9067039,
+    1364: 9067038,
+    1368: 9067037,
+    1377: 9067027,
+    1378: 9067026,
+    1380: 9067025,
+    1384: 9067024,
+    1392: 9067023,
+    1411: 9066910,
+    1413: 9066897,
+    1414: 9066896,
+    1417: 9066884,
+    1418: 9066883,
+    1420: 9066882,
+    1425: 9066871,
+    1426: 9066870,
+    1428: 9066869,
+    1432: 9066868,
+    1441: 9066858,
+    1442: 9066857,
+    1444: 9066856,
+    1448: 9066855,
+    1456: 9066854,
+    1473: 9066845,
+    1474: 9066844,
+    1476: 9066843,
+    1480: 9066842,
+    1488: 9066841,
+    1504: 9066840,
+    1543: 9065558,
+    1547: 9065389,
+    1549: 9065376,
+    1550: 9065375,
+    1555: 9065220,
+    1557: 9065207,
+    1558: 9065206,
+    1561: 9065194,
+    1562: 9065193,
+    1564: 9065192,
+    1571: 9065051,
+    1573: 9065038,
+    1574: 9065037,
+    1577: 9065025,
+    1578: 9065024,
+    1580: 9065023,
+    1585: 9065012,
+    1586: 9065011,
+    1588: 9065010,
+    1592: 9065009,
+    1603: 9064882,
+    1605: 9064869,
+    1606: 9064868,
+    1609: 9064856,
+    1610: 9064855,
+    1612: 9064854,
+    1617: 9064843,
+    1618: 9064842,
+    1620: 9064841,
+    1624: 9064840,
+    1633: 9064830,
+    1634: 9064829,
+    1636: 9064828,
+    1640: 9064827,
+    1648: 9064826,
+    1667: 9064713,
+    1669: 9064700,
+    1670: 9064699,
+    1673: 9064687,
+    1674: 9064686,
+    1676: 9064685,
+    1681: 9064674,
+    1682: 9064673,
+    1684: 9064672,
+    1688: 9064671,
+    1697: 9064661,
+    1698: 9064660,
+    1700: 9064659,
+    1704: 9064658,
+    1712: 9064657,
+    1729: 9064648,
+    1730: 9064647,
+    1732: 9064646,
+    1736: 9064645,
+    1744: 9064644,
+    1760: 9064643,
+    1795: 9064544,
+    1797: 9064531,
+    1798: 9064530,
+    1801: 9064518,
+    1802: 9064517,
+    1804: 9064516,
+    1809: 9064505,
+    1810: 9064504,
+    1812: 9064503,
+    1816: 9064502,
+    1825: 9064492,
+    1826: 9064491,
+    1828: 9064490,
+    1832: 9064489,
+    1840: 9064488,
+    1857: 9064479,
+    1858: 9064478,
+    1860: 9064477,
+    1864: 9064476,
+    1872: 9064475,
+    1888: 9064474,
+    1921: 9064466,
+    1922: 9064465,
+    1924: 9064464,
+    1928: 9064463,
+    1936: 9064462,
+    1952: 9064461,
+    1984: 5000002,
+    2063: 9050179,
+    2071: 9047982,
+    2075: 9047813,
+    2077: 9047800,
+    2078: 9047799,
+    2087: 9045785,
+    2091: 9045616,
+    2093: 9045603,
+    2094: 9045602,
+    2099: 9045447,
+    2101: 9045434,
+    2102: 9045433,
+    2105: 9045421,
+    2106: 9045420,
+    2108: 9045419,
+    2119: 9043588,
+    2123: 9043419,
+    2125: 9043406,
+    2126: 9043405,
+    2131: 9043250,
+    2133: 9043237,
+    2134: 9043236,
+    2137: 9043224,
+    2138: 9043223,
+    2140: 9043222,
+    2147: 9043081,
+    2149: 9043068,
+    2150: 9043067,
+    2153: 9043055,
+    2154: 9043054,
+    2156: 9043053,
+    2161: 9043042,
+    2162: 9043041,
+    2164: 9043040,
+    2168: 9043039,
+    2183: 9041391,
+    2187: 9041222,
+    2189: 9041209,
+    2190: 9041208,
+    2195: 9041053,
+    2197: 9041040,
+    2198: 9041039,
+    2201: 9041027,
+    2202: 9041026,
+    2204: 9041025,
+    2211: 9040884,
+    2213: 9040871,
+    2214: 9040870,
+    2217: 9040858,
+    2218: 9040857,
+    2220: 9040856,
+    2225: 9040845,
+    2226: 9040844,
+    2228: 9040843,
+    2232: 9040842,
+    2243: 9040715,
+    2245: 9040702,
+    2246: 9040701,
+    2249: 9040689,
+    2250: 9040688,
+    2252: 9040687,
+    2257: 9040676,
+    2258: 9040675,
+    2260: 9040674,
+    2264: 9040673,
+    2273: 9040663,
+    2274: 9040662,
+    2276: 9040661,
+    2280: 9040660,
+    2288: 9040659,
+    2311: 9039194,
+    2315: 9039025,
+    2317: 9039012,
+    2318: 9039011,
+    2323: 9038856,
+    2325: 9038843,
+    2326: 9038842,
+    2329: 9038830,
+    2330: 9038829,
+    2332: 9038828,
+    2339: 9038687,
+    2341: 9038674,
+    2342: 9038673,
+    2345: 9038661,
+    2346: 9038660,
+    2348: 9038659,
+    2353: 9038648,
+    2354: 9038647,
+    2356: 9038646,
+    2360: 9038645,
+    2371: 9038518,
+    2373: 9038505,
+    2374: 9038504,
+    2377: 9038492,
+    2378: 9038491,
+    2380: 9038490,
+    2385: 9038479,
+    2386: 9038478,
+    2388: 9038477,
+    2392: 9038476,
+    2401: 9038466,
+    2402: 9038465,
+    2404: 9038464,
+    2408: 9038463,
+    2416: 9038462,
+    2435: 9038349,
+    2437: 9038336,
+    2438: 9038335,
+    2441: 9038323,
+    2442: 9038322,
+    2444: 9038321,
+    2449: 9038310,
+    2450: 9038309,
+    2452: 9038308,
+    2456: 9038307,
+    2465: 9038297,
+    2466: 9038296,
+    2468: 9038295,
+    2472: 9038294,
+    2480: 9038293,
+    2497: 9038284,
+    2498: 9038283,
+    2500: 9038282,
+    2504: 9038281,
+    2512: 9038280,
+    2528: 9038279,
+    2567: 9036997,
+    2571: 9036828,
+    2573: 9036815,
+    2574: 9036814,
+    2579: 9036659,
+    2581: 9036646,
+    2582: 9036645,
+    2585: 9036633,
+    2586: 9036632,
+    2588: 9036631,
+    2595: 9036490,
+    2597: 9036477,
+    2598: 9036476,
+    2601: 9036464,
+    2602: 9036463,
+    2604: 9036462,
+    2609: 9036451,
+    2610: 9036450,
+    2612: 9036449,
+    2616: 9036448,
+    2627: 9036321,
+    2629: 9036308,
+    2630: 9036307,
+    2633: 9036295,
+    2634: 9036294,
+    2636: 9036293,
+    2641: 9036282,
+    2642: 9036281,
+    2644: 9036280,
+    2648: 9036279,
+    2657: 9036269,
+    2658: 9036268,
+    2660: 9036267,
+    2664: 9036266,
+    2672: 9036265,
+    2691: 9036152,
+    2693: 9036139,
+    2694: 9036138,
+    2697: 9036126,
+    2698: 9036125,
+    2700: 9036124,
+    2705: 9036113,
+    2706: 9036112,
+    2708: 9036111,
+    2712: 9036110,
+    2721: 9036100,
+    2722: 9036099,
+    2724: 9036098,
+    2728: 9036097,
+    2736: 9036096,
+    2753: 9036087,
+    2754: 9036086,
+    2756: 9036085,
+    2760: 9036084,
+    2768: 9036083,
+    2784: 9036082,
+    2819: 9035983,
+    2821: 9035970,
+    2822: 9035969,
+    2825: 9035957,
+    2826: 9035956,
+    2828: 9035955,
+    2833: 9035944,
+    2834: 9035943,
+    2836: 9035942,
+    2840: 9035941,
+    2849: 9035931,
+    2850: 9035930,
+    2852: 9035929,
+    2856: 9035928,
+    2864: 9035927,
+    2881: 9035918,
+    2882: 9035917,
+    2884: 9035916,
+    2888: 9035915,
+    2896: 9035914,
+    2912: 9035913,
+    2945: 9035905,
+    2946: 9035904,
+    2948: 9035903,
+    2952: 9035902,
+    2960: 9035901,
+    2976: 9035900,
+    3008: 9035899,
+    3079: 9034800,
+    3083: 9034631,
+    3085: 9034618,
+    3086: 9034617,
+    3091: 9034462,
+    3093: 9034449,
+    3094: 9034448,
+    3097: 9034436,
+    3098: 9034435,
+    3100: 9034434,
+    3107: 9034293,
+    3109: 9034280,
+    3110: 9034279,
+    3113: 9034267,
+    3114: 9034266,
+    3116: 9034265,
+    3121: 9034254,
+    3122: 9034253,
+    3124: 9034252,
+    3128: 9034251,
+    3139: 9034124,
+    3141: 9034111,
+    3142: 9034110,
+    3145: 9034098,
+    3146: 9034097,
+    3148: 9034096,
+    3153: 9034085,
+    3154: 9034084,
+    3156: 9034083,
+    3160: 9034082,
+    3169: 9034072,
+    3170: 9034071,
+    3172: 9034070,
+    3176: 9034069,
+    3184: 9034068,
+    3203: 9033955,
+    3205: 9033942,
+    3206: 9033941,
+    3209: 9033929,
+    3210: 9033928,
+    3212: 9033927,
+    3217: 9033916,
+    3218: 9033915,
+    3220: 9033914,
+    3224: 9033913,
+    3233: 9033903,
+    3234: 9033902,
+    3236: 9033901,
+    3240: 9033900,
+    3248: 9033899,
+    3265: 9033890,
+    3266: 9033889,
+    3268: 9033888,
+    3272: 9033887,
+    3280: 9033886,
+    3296: 9033885,
+    3331: 9033786,
+    3333: 9033773,
+    3334: 9033772,
+    3337: 9033760,
+    3338: 9033759,
+    3340: 9033758,
+    3345: 9033747,
+    3346: 9033746,
+    3348: 9033745,
+    3352: 9033744,
+    3361: 9033734,
+    3362: 9033733,
+    3364: 9033732,
+    3368: 9033731,
+    3376: 9033730,
+    3393: 9033721,
+    3394: 9033720,
+    3396: 9033719,
+    3400: 9033718,
+    3408: 9033717,
+    3424: 9033716,
+    3457: 9033708,
+    3458: 9033707,
+    3460: 9033706,
+    3464: 9033705,
+    3472: 9033704,
+    3488: 9033703,
+    3520: 9033702,
+    3587: 9033617,
+    3589: 9033604,
+    3590: 9033603,
+    3593: 9033591,
+    3594: 9033590,
+    3596: 9033589,
+    3601: 9033578,
+    3602: 9033577,
+    3604: 9033576,
+    3608: 9033575,
+    3617: 9033565,
+    3618: 9033564,
+    3620: 9033563,
+    3624: 9033562,
+    3632: 9033561,
+    3649: 9033552,
+    3650: 9033551,
+    3652: 9033550,
+    3656: 9033549,
+    3664: 9033548,
+    3680: 9033547,
+    3713: 9033539,
+    3714: 9033538,
+    3716: 9033537,
+    3720: 9033536,
+    3728: 9033535,
+    3744: 9033534,
+    3776: 9033533,
+    3841: 9033526,
+    3842: 9033525,
+    3844: 9033524,
+    3848: 9033523,
+    3856: 9033522,
+    3872: 9033521,
+    3904: 9033520,
+    3968: 5000001,
+    4111: 5000009,
+    4119: 9019421,
+    4123: 9019252,
+    4125: 9019239,
+    4126: 9019238,
+    4135: 9017224,
+    4139: 9017055,
+    4141: 9017042,
+    4142: 9017041,
+    4147: 9016886,
+    4149: 9016873,
+    4150: 9016872,
+    4153: 9016860,
+    4154: 9016859,
+    4156: 9016858,
+    4167: 9015027,
+    4171: 9014858,
+    4173: 9014845,
+    4174: 9014844,
+    4179: 9014689,
+    4181: 9014676,
+    4182: 9014675,
+    4185: 9014663,
+    4186: 9014662,
+    4188: 9014661,
+    4195: 9014520,
+    4197: 9014507,
+    4198: 9014506,
+    4201: 9014494,
+    4202: 9014493,
+    4204: 9014492,
+    4209: 9014481,
+    4210: 9014480,
+    4212: 9014479,
+    4216: 9014478,
+    4231: 9012830,
+    4235: 9012661,
+    4237: 9012648,
+    4238: 9012647,
+    4243: 9012492,
+    4245: 9012479,
+    4246: 9012478,
+    4249: 9012466,
+    4250: 9012465,
+    4252: 9012464,
+    4259: 9012323,
+    4261: 9012310,
+    4262: 9012309,
+    4265: 9012297,
+    4266: 9012296,
+    4268: 9012295,
+    4273: 9012284,
+    4274: 9012283,
+    4276: 9012282,
+    4280: 9012281,
+    4291: 9012154,
+    4293: 9012141,
+    4294: 9012140,
+    4297: 9012128,
+    4298: 9012127,
+    4300: 9012126,
+    4305: 9012115,
+    4306: 9012114,
+    4308: 9012113,
+    4312: 9012112,
+    4321: 9012102,
+    4322: 9012101,
+    4324: 9012100,
+    4328: 9012099,
+    4336: 9012098,
+    4359: 9010633,
+    4363: 9010464,
+    4365: 9010451,
+    4366: 9010450,
+    4371: 9010295,
+    4373: 9010282,
+    4374: 9010281,
+    4377: 9010269,
+    4378: 9010268,
+    4380: 9010267,
+    4387: 9010126,
+    4389: 9010113,
+    4390: 9010112,
+    4393: 9010100,
+    4394: 9010099,
+    4396: 9010098,
+    4401: 9010087,
+    4402: 9010086,
+    4404: 9010085,
+    4408: 9010084,
+    4419: 9009957,
+    4421: 9009944,
+    4422: 9009943,
+    4425: 9009931,
+    4426: 9009930,
+    4428: 9009929,
+    4433: 9009918,
+    4434: 9009917,
+    4436: 9009916,
+    4440: 9009915,
+    4449: 9009905,
+    4450: 9009904,
+    4452: 9009903,
+    4456: 9009902,
+    4464: 9009901,
+    4483: 9009788,
+    4485: 9009775,
+    4486: 9009774,
+    4489: 9009762,
+    4490: 9009761,
+    4492: 9009760,
+    4497: 9009749,
+    4498: 9009748,
+    4500: 9009747,
+    4504: 9009746,
+    4513: 9009736,
+    4514: 9009735,
+    4516: 9009734,
+    4520: 9009733,
+    4528: 9009732,
+    4545: 9009723,
+    4546: 9009722,
+    4548: 9009721,
+    4552: 9009720,
+    4560: 9009719,
+    4576: 9009718,
+    4615: 9008436,
+    4619: 9008267,
+    4621: 9008254,
+    4622: 9008253,
+    4627: 9008098,
+    4629: 9008085,
+    4630: 9008084,
+    4633: 9008072,
+    4634: 9008071,
+    4636: 9008070,
+    4643: 9007929,
+    4645: 9007916,
+    4646: 9007915,
+    4649: 9007903,
+    4650: 9007902,
+    4652: 9007901,
+    4657: 9007890,
+    4658: 9007889,
+    4660: 9007888,
+    4664: 9007887,
+    4675: 9007760,
+    4677: 9007747,
+    4678: 9007746,
+    4681: 9007734,
+    4682: 9007733,
+    4684: 9007732,
+    4689: 9007721,
+    4690: 9007720,
+    4692: 9007719,
+    4696: 9007718,
+    4705: 9007708,
+    4706: 9007707,
+    4708: 9007706,
+    4712: 9007705,
+    4720: 9007704,
+    4739: 9007591,
+    4741: 9007578,
+    4742: 9007577,
+    4745: 9007565,
+    4746: 9007564,
+    4748: 9007563,
+    4753: 9007552,
+    4754: 9007551,
+    4756: 9007550,
+    4760: 9007549,
+    4769: 9007539,
+    4770: 9007538,
+    4772: 9007537,
+    4776: 9007536,
+    4784: 9007535,
+    4801: 9007526,
+    4802: 9007525,
+    4804: 9007524,
+    4808: 9007523,
+    4816: 9007522,
+    4832: 9007521,
+    4867: 9007422,
+    4869: 9007409,
+    4870: 9007408,
+    4873: 9007396,
+    4874: 9007395,
+    4876: 9007394,
+    4881: 9007383,
+    4882: 9007382,
+    4884: 9007381,
+    4888: 9007380,
+    4897: 9007370,
+    4898: 9007369,
+    4900: 9007368,
+    4904: 9007367,
+    4912: 9007366,
+    4929: 9007357,
+    4930: 9007356,
+    4932: 9007355,
+    4936: 9007354,
+    4944: 9007353,
+    4960: 9007352,
+    4993: 9007344,
+    4994: 9007343,
+    4996: 9007342,
+    5000: 9007341,
+    5008: 9007340,
+    5024: 9007339,
+    5056: 9007338,
+    5127: 9006239,
+    5131: 9006070,
+    5133: 9006057,
+    5134: 9006056,
+    5139: 9005901,
+    5141: 9005888,
+    5142: 9005887,
+    5145: 9005875,
+    5146: 9005874,
+    5148: 9005873,
+    5155: 9005732,
+    5157: 9005719,
+    5158: 9005718,
+    5161: 9005706,
+    5162: 9005705,
+    5164: 9005704,
+    5169: 9005693,
+    5170: 9005692,
+    5172: 9005691,
+    5176: 9005690,
+    5187: 9005563,
+    5189: 9005550,
+    5190: 9005549,
+    5193: 9005537,
+    5194: 9005536,
+    5196: 9005535,
+    5201: 9005524,
+    5202: 9005523,
+    5204: 9005522,
+    5208: 9005521,
+    5217: 9005511,
+    5218: 9005510,
+    5220: 9005509,
+    5224: 9005508,
+    5232: 9005507,
+    5251: 9005394,
+    5253: 9005381,
+    5254: 9005380,
+    5257: 9005368,
+    5258: 9005367,
+    5260: 9005366,
+    5265: 9005355,
+    5266: 9005354,
+    5268: 9005353,
+    5272: 9005352,
+    5281: 9005342,
+    5282: 9005341,
+    5284: 9005340,
+    5288: 9005339,
+    5296: 9005338,
+    5313: 9005329,
+    5314: 9005328,
+    5316: 9005327,
+    5320: 9005326,
+    5328: 9005325,
+    5344: 9005324,
+    5379: 9005225,
+    5381: 9005212,
+    5382: 9005211,
+    5385: 9005199,
+    5386: 9005198,
+    5388: 9005197,
+    5393: 9005186,
+    5394: 9005185,
+    5396: 9005184,
+    5400: 9005183,
+    5409: 9005173,
+    5410: 9005172,
+    5412: 9005171,
+    5416: 9005170,
+    5424: 9005169,
+    5441: 9005160,
+    5442: 9005159,
+    5444: 9005158,
+    5448: 9005157,
+    5456: 9005156,
+    5472: 9005155,
+    5505: 9005147,
+    5506: 9005146,
+    5508: 9005145,
+    5512: 9005144,
+    5520: 9005143,
+    5536: 9005142,
+    5568: 9005141,
+    5635: 9005056,
+    5637: 9005043,
+    5638: 9005042,
+    5641: 9005030,
+    5642: 9005029,
+    5644: 9005028,
+    5649: 9005017,
+    5650: 9005016,
+    5652: 9005015,
+    5656: 9005014,
+    5665: 9005004,
+    5666: 9005003,
+    5668: 9005002,
+    5672: 9005001,
+    5680: 9005000,
+    5697: 9004991,
+    5698: 9004990,
+    5700: 9004989,
+    5704: 9004988,
+    5712: 9004987,
+    5728: 9004986,
+    5761: 9004978,
+    5762: 9004977,
+    5764: 9004976,
+    5768: 9004975,
+    5776: 9004974,
+    5792: 9004973,
+    5824: 9004972,
+    5889: 9004965,
+    5890: 9004964,
+    5892: 9004963,
+    5896: 9004962,
+    5904: 9004961,
+    5920: 9004960,
+    5952: 9004959,
+    6016: 9004958,
+    6151: 9004042,
+    6155: 9003873,
+    6157: 9003860,
+    6158: 9003859,
+    6163: 9003704,
+    6165: 9003691,
+    6166: 9003690,
+    6169: 9003678,
+    6170: 9003677,
+    6172: 9003676,
+    6179: 9003535,
+    6181: 9003522,
+    6182: 9003521,
+    6185: 9003509,
+    6186: 9003508,
+    6188: 9003507,
+    6193: 9003496,
+    6194: 9003495,
+    6196: 9003494,
+    6200: 9003493,
+    6211: 9003366,
+    6213: 9003353,
+    6214: 9003352,
+    6217: 9003340,
+    6218: 9003339,
+    6220: 9003338,
+    6225: 9003327,
+    6226: 9003326,
+    6228: 9003325,
+    6232: 9003324,
+    6241: 9003314,
+    6242: 9003313,
+    6244: 9003312,
+    6248: 9003311,
+    6256: 9003310,
+    6275: 9003197,
+    6277: 9003184,
+    6278: 9003183,
+    6281: 9003171,
+    6282: 9003170,
+    6284: 9003169,
+    6289: 9003158,
+    6290: 9003157,
+    6292: 9003156,
+    6296: 9003155,
+    6305: 9003145,
+    6306: 9003144,
+    6308: 9003143,
+    6312: 9003142,
+    6320: 9003141,
+    6337: 9003132,
+    6338: 9003131,
+    6340: 9003130,
+    6344: 9003129,
+    6352: 9003128,
+    6368: 9003127,
+    6403: 9003028,
+    6405: 9003015,
+    6406: 9003014,
+    6409: 9003002,
+    6410: 9003001,
+    6412: 9003000,
+    6417: 9002989,
+    6418: 9002988,
+    6420: 9002987,
+    6424: 9002986,
+    6433: 9002976,
+    6434: 9002975,
+    6436: 9002974,
+    6440: 9002973,
+    6448: 9002972,
+    6465: 9002963,
+    6466: 9002962,
+    6468: 9002961,
+    6472: 9002960,
+    6480: 9002959,
+    6496: 9002958,
+    6529: 9002950,
+    6530: 9002949,
+    6532: 9002948,
+    6536: 9002947,
+    6544: 9002946,
+    6560: 9002945,
+    6592: 9002944,
+    6659: 9002859,
+    6661: 9002846,
+    6662: 9002845,
+    6665: 9002833,
+    6666: 9002832,
+    6668: 9002831,
+    6673: 9002820,
+    6674: 9002819,
+    6676: 9002818,
+    6680: 9002817,
+    6689: 9002807,
+    6690: 9002806,
+    6692: 9002805,
+    6696: 9002804,
+    6704: 9002803,
+    6721: 9002794,
+    6722: 9002793,
+    6724: 9002792,
+    6728: 9002791,
+    6736: 9002790,
+    6752: 9002789,
+    6785: 9002781,
+    6786: 9002780,
+    6788: 9002779,
+    6792: 9002778,
+    6800: 9002777,
+    6816: 9002776,
+    6848: 9002775,
+    6913: 9002768,
+    6914: 9002767,
+    6916: 9002766,
+    6920: 9002765,
+    6928: 9002764,
+    6944: 9002763,
+    6976: 9002762,
+    7040: 9002761,
+    7171: 9002690,
+    7173: 9002677,
+    7174: 9002676,
+    7177: 9002664,
+    7178: 9002663,
+    7180: 9002662,
+    7185: 9002651,
+    7186: 9002650,
+    7188: 9002649,
+    7192: 9002648,
+    7201: 9002638,
+    7202: 9002637,
+    7204: 9002636,
+    7208: 9002635,
+    7216: 9002634,
+    7233: 9002625,
+    7234: 9002624,
+    7236: 9002623,
+    7240: 9002622,
+    7248: 9002621,
+    7264: 9002620,
+    7297: 9002612,
+    7298: 9002611,
+    7300: 9002610,
+    7304: 9002609,
+    7312: 9002608,
+    7328: 9002607,
+    7360: 9002606,
+    7425: 9002599,
+    7426: 9002598,
+    7428: 9002597,
+    7432: 9002596,
+    7440: 9002595,
+    7456: 9002594,
+    7488: 9002593,
+    7552: 9002592,
+    7681: 9002586,
+    7682: 9002585,
+    7684: 9002584,
+    7688: 9002583,
+    7696: 9002582,
+    7712: 9002581,
+    7744: 9002580,
+    7808: 9002579,
+    7936: 5000000,
+}
+
+# Rank of hands with a repeated rank, by product of rank primes
+PAIRED_RANKS = {
+    48: 2000167,
+    72: 3000167,
+    80: 2000166,
+    108: 3000155,
+    112: 2000165,
+    120: 6002169,
+    162: 2000155,
+    168: 6002156,
+    176: 2000164,
+    180: 7002025,
+    200: 3000166,
+    208: 2000163,
+    252: 7002024,
+    264: 6002143,
+    270: 6002001,
+    272: 2000162,
+    280: 6002155,
+    300: 7001857,
+    304: 2000161,
+    312: 6002130,
+    368: 2000160,
+    378: 6001988,
+    392: 3000165,
+    396: 7002023,
+    405: 2000153,
+    408: 6002117,
+    420: 8028026,
+    440: 6002142,
+    450: 7001845,
+    456: 6002104,
+    464: 2000159,
+    468: 7002022,
+    496: 2000158,
+    500: 3000142,
+    520: 6002129,
+    552: 6002091,
+    567: 2000152,
+    588: 7001688,
+    592: 2000157,
+    594: 6001975,
+    612: 7002021,
+    616: 6002141,
+    630: 8025830,
+    656: 2000156,
+    660: 8027857,
+    675: 3000153,
+    680: 6002116,
+    684: 7002020,
+    696: 6002078,
+    700: 7001855,
+    702: 6001962,
+    728: 6002128,
+    744: 6002065,
+    750: 6001845,
+    760: 6002103,
+    780: 8027688,
+    828: 7002019,
+    882: 7001676,
+    888: 6002052,
+    891: 2000151,
+    918: 6001949,
+    920: 6002090,
+    924: 8027844,
+    945: 6001986,
+    952: 6002115,
+    968: 3000164,
+    980: 7001687,
+    984: 6002039,
+    990: 8025661,
+    1020: 8027519,
+    1026: 6001936,
+    1044: 7002018,
+    1050: 8023646,
+    1053: 2000150,
+    1064: 6002102,
+    1092: 8027675,
+    1100: 7001854,
+    1116: 7002017,
+    1125: 3000141,
+    1140: 8027350,
+    1144: 6002127,
+    1160: 6002077,
+    1170: 8025492,
+    1240: 6002064,
+    1242: 6001923,
+    1250: 2000142,
+    1288: 6002089,
+    1300: 7001853,
+    1323: 3000152,
+    1332: 7002016,
+    1352: 3000163,
+    1372: 3000129,
+    1377: 2000149,
+    1380: 8027181,
+    1386: 8025648,
+    1428: 8027506,
+    1452: 7001519,
+    1470: 8021618,
+    1476: 7002015,
+    1480: 6002051,
+    1485: 6001973,
+    1496: 6002114,
+    1530: 8025323,
+    1539: 2000148,
+    1540: 8027843,
+    1566: 6001910,
+    1575: 7001842,
+    1596: 8027337,
+    1624: 6002076,
+    1638: 8025479,
+    1640: 6002038,
+    1650: 8023477,
+    1672: 6002101,
+    1674: 6001897,
+    1700: 7001852,
+    1710: 8025154,
+    1716: 8027662,
+    1736: 6002063,
+    1740: 8027012,
+    1750: 6001819,
+    1755: 6001960,
+    1768: 6002113,
+    1820: 8027674,
+    1860: 8026843,
+    1863: 2000147,
+    1875: 2000141,
+    1900: 7001851,
+    1932: 8027168,
+    1950: 8023308,
+    1976: 6002100,
+    1998: 6001884,
+    2024: 6002088,
+    2028: 7001350,
+    2058: 6001676,
+    2070: 8024985,
+    2072: 6002050,
+    2079: 6001972,
+    2142: 8025310,
+    2156: 7001685,
+    2178: 7001507,
+    2205: 7001674,
+    2214: 6001871,
+    2220: 8026674,
+    2244: 8027493,
+    2295: 6001947,
+    2296: 6002037,
+    2300: 7001850,
+    2312: 3000162,
+    2349: 2000146,
+    2380: 8027505,
+    2392: 6002087,
+    2394: 8025141,
+    2420: 7001518,
+    2436: 8026999,
+    2450: 7001663,
+    2457: 6001959,
+    2460: 8026505,
+    2475: 7001841,
+    2508: 8027324,
+    2511: 2000145,
+    2548: 7001684,
+    2550: 8023139,
+    2552: 6002075,
+    2565: 6001934,
+    2574: 8025466,
+    2584: 6002099,
+    2604: 8026830,
+    2610: 8024816,
+    2625: 6001818,
+    2652: 8027480,
+    2660: 8027336,
+    2728: 6002062,
+    2750: 6001806,
+    2790: 8024647,
+    2850: 8022970,
+    2860: 8027661,
+    2888: 3000161,
+    2898: 8024972,
+    2900: 7001849,
+    2925: 7001840,
+    2964: 8027311,
+    2997: 2000144,
+    3016: 6002074,
+    3036: 8027155,
+    3042: 7001338,
+    3087: 3000128,
+    3100: 7001848,
+    3105: 6001921,
+    3108: 8026661,
+    3128: 6002086,
+    3213: 6001946,
+    3220: 8027167,
+    3224: 6002061,
+    3234: 8021280,
+    3250: 6001793,
+    3256: 6002049,
+    3267: 3000151,
+    3321: 2000143,
+    3330: 8024478,
+    3332: 7001683,
+    3366: 8025297,
+    3380: 7001349,
+    3388: 7001517,
+    3430: 6001663,
+    3444: 8026492,
+    3450: 8022801,
+    3465: 8025646,
+    3468: 7001181,
+    3496: 6002085,
+    3588: 8027142,
+    3591: 6001933,
+    3608: 6002036,
+    3630: 8019421,
+    3654: 8024803,
+    3675: 7001662,
+    3690: 8024309,
+    3700: 7001847,
+    3724: 7001682,
+    3740: 8027492,
+    3762: 8025128,
+    3822: 8021111,
+    3825: 7001839,
+    3828: 8026986,
+    3848: 6002048,
+    3850: 8023451,
+    3861: 6001958,
+    3876: 8027298,
+    3906: 8024634,
+    3915: 6001908,
+    3944: 6002073,
+    3978: 8025284,
+    4004: 8027660,
+    4060: 8026998,
+    4092: 8026817,
+    4095: 8025477,
+    4100: 7001846,
+    4125: 6001805,
+    4180: 8027323,
+    4185: 6001895,
+    4216: 6002060,
+    4232: 3000160,
+    4250: 6001780,
+    4264: 6002035,
+    4275: 7001838,
+    4332: 7001012,
+    4340: 8026829,
+    4347: 6001920,
+    4350: 8022632,
+    4375: 2000139,
+    4408: 6002072,
+    4420: 8027479,
+    4446: 8025115,
+    4508: 7001681,
+    4524: 8026973,
+    4550: 8023282,
+    4554: 8024959,
+    4563: 3000150,
+    4650: 8022463,
+    4662: 8024465,
+    4692: 8027129,
+    4712: 6002059,
+    4732: 7001348,
+    4750: 6001767,
+    4802: 2000129,
+    4836: 8026804,
+    4851: 7001672,
+    4875: 6001792,
+    4884: 8026648,
+    4940: 8027310,
+    4995: 6001882,
+    4998: 8020942,
+    5032: 6002047,
+    5049: 6001945,
+    5060: 8027154,
+    5070: 8017224,
+    5082: 8019252,
+    5145: 6001662,
+    5166: 8024296,
+    5175: 7001837,
+    5180: 8026660,
+    5202: 7001169,
+    5236: 8027491,
+    5244: 8027116,
+    5324: 3000116,
+    5336: 6002071,
+    5355: 8025308,
+    5382: 8024946,
+    5390: 8021267,
+    5412: 8026479,
+    5445: 7001505,
+    5481: 6001907,
+    5535: 6001869,
+    5550: 8022294,
+    5576: 6002034,
+    5586: 8020773,
+    5624: 6002046,
+    5643: 6001932,
+    5684: 7001680,
+    5704: 6002058,
+    5733: 7001671,
+    5740: 8026491,
+    5742: 8024790,
+    5750: 6001754,
+    5772: 8026635,
+    5775: 8023450,
+    5780: 7001180,
+    5814: 8025102,
+    5852: 8027322,
+    5859: 6001894,
+    5916: 8026960,
+    5950: 8023113,
+    5967: 6001944,
+    5980: 8027141,
+    5985: 8025139,
+    6050: 7001494,
+    6076: 7001679,
+    6125: 3000139,
+    6138: 8024621,
+    6150: 8022125,
+    6188: 8027478,
+    6232: 6002033,
+    6292: 7001515,
+    6324: 8026791,
+    6348: 7000843,
+    6370: 8021098,
+    6375: 6001779,
+    6380: 8026985,
+    6396: 8026466,
+    6435: 8025464,
+    6460: 8027297,
+    6498: 7001000,
+    6525: 7001836,
+    6612: 8026947,
+    6650: 8022944,
+    6669: 6001931,
+    6728: 3000159,
+    6762: 8020604,
+    6786: 8024777,
+    6808: 6002045,
+    6820: 8026816,
+    6825: 8023281,
+    6831: 6001919,
+    6875: 2000138,
+    6916: 8027309,
+    6975: 7001835,
+    6993: 6001881,
+    7038: 8024933,
+    7068: 8026778,
+    7084: 8027153,
+    7098: 8017055,
+    7125: 6001766,
+    7150: 8023269,
+    7192: 6002057,
+    7203: 2000128,
+    7220: 7001011,
+    7245: 8024970,
+    7250: 6001741,
+    7252: 7001678,
+    7254: 8024608,
+    7326: 8024452,
+    7436: 7001347,
+    7497: 7001670,
+    7540: 8026972,
+    7544: 6002032,
+    7546: 6001637,
+    7548: 8026622,
+    7605: 7001336,
+    7623: 7001504,
+    7688: 3000158,
+    7749: 6001868,
+    7750: 6001728,
+    7803: 3000149,
+    7820: 8027128,
+    7866: 8024920,
+    7986: 6001507,
+    8004: 8026934,
+    8036: 7001677,
+    8050: 8022775,
+    8060: 8026803,
+    8073: 6001918,
+    8085: 8021266,
+    8092: 7001179,
+    8118: 8024283,
+    8125: 2000137,
+    8140: 8026647,
+    8228: 7001514,
+    8325: 7001834,
+    8330: 8020929,
+    8364: 8026453,
+    8372: 8027140,
+    8379: 7001669,
+    8415: 8025295,
+    8436: 8026609,
+    8450: 7001325,
+    8470: 8019239,
+    8526: 8020435,
+    8556: 8026765,
+    8575: 3000127,
+    8584: 6002044,
+    8613: 6001906,
+    8625: 6001753,
+    8658: 8024439,
+    8670: 8015027,
+    8721: 6001930,
+    8740: 8027115,
+    8788: 3000103,
+    8874: 8024764,
+    8918: 6001624,
+    8925: 8023112,
+    8932: 8026984,
+    9009: 8025463,
+    9020: 8026478,
+    9044: 8027296,
+    9075: 7001493,
+    9114: 8020266,
+    9135: 8024801,
+    9176: 6002043,
+    9196: 7001513,
+    9207: 6001893,
+    9225: 7001833,
+    9250: 6001715,
+    9310: 8020760,
+    9348: 8026440,
+    9350: 8023100,
+    9405: 8025126,
+    9438: 8018914,
+    9486: 8024595,
+    9512: 6002031,
+    9522: 7000831,
+    9548: 8026815,
+    9555: 8021097,
+    9594: 8024270,
+    9620: 8026634,
+    9625: 6001803,
+    9724: 8027477,
+    9747: 3000148,
+    9765: 8024632,
+    9860: 8026959,
+    9918: 8024751,
+    9945: 8025282,
+    9975: 8022943,
+    10092: 7000674,
+    10108: 7001010,
+    10143: 7001668,
+    10150: 8022606,
+    10168: 6002030,
+    10179: 6001905,
+    10212: 8026596,
+    10250: 6001702,
+    10450: 8022931,
+    10540: 8026790,
+    10556: 8026971,
+    10557: 6001917,
+    10580: 7000842,
+    10602: 8024582,
+    10625: 2000136,
+    10647: 7001335,
+    10660: 8026465,
+    10725: 8023268,
+    10788: 8026752,
+    10830: 8012830,
+    10850: 8022437,
+    10868: 8027308,
+    10875: 6001740,
+    10878: 8020097,
+    10881: 6001892,
+    10948: 8027127,
+    10952: 3000157,
+    10989: 6001880,
+    11020: 8026946,
+    11050: 8023087,
+    11115: 8025113,
+    11132: 7001512,
+    11154: 8016886,
+    11270: 8020591,
+    11284: 8026802,
+    11316: 8026427,
+    11319: 6001636,
+    11322: 8024426,
+    11375: 6001790,
+    11385: 8024957,
+    11396: 8026646,
+    11492: 7001345,
+    11532: 7000505,
+    11625: 6001727,
+    11655: 8024463,
+    11662: 6001611,
+    11780: 8026777,
+    11781: 8025294,
+    11799: 6001916,
+    11830: 8017042,
+    11858: 7001481,
+    11875: 2000135,
+    11979: 3000115,
+    12005: 2000127,
+    12006: 8024738,
+    12054: 8019928,
+    12075: 8022774,
+    12136: 6002029,
+    12138: 8014858,
+    12177: 6001867,
+    12236: 8027114,
+    12342: 8018745,
+    12350: 8022918,
+    12495: 8020928,
+    12546: 8024257,
+    12580: 8026621,
+    12628: 8026477,
+    12650: 8022762,
+    12654: 8024413,
+    12675: 7001324,
+    12705: 8019238,
+    12716: 7001178,
+    12789: 7001667,
+    12834: 8024569,
+    12844: 7001344,
+    12876: 8026583,
+    12915: 8024294,
+    12950: 8022268,
+    12987: 6001879,
+    13005: 7001167,
+    13034: 6001598,
+    13156: 8027139,
+    13167: 8025125,
+    13182: 6001338,
+    13310: 6001494,
+    13311: 6001904,
+    13340: 8026933,
+    13377: 6001623,
+    13448: 3000156,
+    13455: 8024944,
+    13468: 8026633,
+    13475: 7001659,
+    13671: 7001666,
+    13764: 8026570,
+    13794: 8018576,
+    13804: 8026958,
+    13875: 6001714,
+    13923: 8025281,
+    13940: 8026452,
+    13965: 8020759,
+    14014: 8021072,
+    14022: 8024244,
+    14025: 8023099,
+    14036: 7001511,
+    14060: 8026608,
+    14157: 7001502,
+    14210: 8020422,
+    14212: 8027295,
+    14229: 6001891,
+    14260: 8026764,
+    14268: 8026414,
+    14283: 3000147,
+    14350: 8022099,
+    14355: 8024788,
+    14375: 2000134,
+    14391: 6001866,
+    14450: 7001156,
+    14535: 8025100,
+    14756: 8026789,
+    14812: 7000841,
+    14875: 6001777,
+    14877: 6001903,
+    14924: 8026464,
+    14950: 8022749,
+    15004: 7001510,
+    15028: 7001177,
+    15125: 3000138,
+    15138: 7000662,
+    15162: 8012661,
+    15190: 8020253,
+    15225: 8022605,
+    15252: 8026401,
+    15318: 8024400,
+    15345: 8024619,
+    15375: 6001701,
+    15428: 8026945,
+    15548: 7001343,
+    15561: 8025112,
+    15580: 8026439,
+    15675: 8022930,
+    15730: 8018901,
+    15778: 6001585,
+    15870: 8010633,
+    15884: 7001009,
+    15903: 6001890,
+    15925: 7001658,
+    15939: 8024956,
+    15950: 8022593,
+    16150: 8022905,
+    16182: 8024556,
+    16245: 7000998,
+    16275: 8022436,
+    16317: 7001665,
+    16428: 7000336,
+    16492: 8026776,
+    16562: 7001312,
+    16575: 8023086,
+    16588: 8026970,
+    16625: 6001764,
+    16698: 8018407,
+    16731: 7001334,
+    16796: 8027294,
+    16820: 7000673,
+    16905: 8020590,
+    16965: 8024775,
+    16974: 8024231,
+    16983: 6001878,
+    17020: 8026595,
+    17050: 8022424,
+    17204: 8027126,
+    17238: 8016548,
+    17298: 7000493,
+    17493: 6001610,
+    17595: 8024931,
+    17612: 8026620,
+    17732: 8026801,
+    17745: 8017041,
+    17787: 7001480,
+    17875: 6001789,
+    17908: 7001509,
+    17980: 8026751,
+    18009: 6001902,
+    18050: 7000987,
+    18081: 7001664,
+    18125: 2000133,
+    18130: 8020084,
+    18135: 8024606,
+    18204: 8026388,
+    18207: 7001166,
+    18315: 8024450,
+    18326: 8020903,
+    18513: 7001501,
+    18525: 8022917,
+    18590: 8016873,
+    18634: 6001481,
+    18676: 8026932,
+    18772: 7001008,
+    18819: 6001865,
+    18837: 8024943,
+    18850: 8022580,
+    18860: 8026426,
+    18865: 6001635,
+    18975: 8022761,
+    18981: 6001877,
+    19074: 8014689,
+    19220: 7000504,
+    19228: 8027113,
+    19251: 6001889,
+    19266: 8016379,
+    19314: 8024387,
+    19375: 2000132,
+    19425: 8022267,
+    19516: 8026451,
+    19550: 8022736,
+    19551: 6001597,
+    19604: 7001342,
+    19652: 3000090,
+    19665: 8024918,
+    19684: 8026607,
+    19773: 3000102,
+    19844: 7001508,
+    19894: 6001572,
+    19964: 8026763,
+    19965: 6001493,
+    20090: 8019915,
+    20097: 8024787,
+    20125: 6001751,
+    20150: 8022411,
+    20172: 7000167,
+    20230: 8014845,
+    20295: 8024281,
+    20332: 8027125,
+    20349: 8025099,
+    20350: 8022255,
+    20482: 8020734,
+    20570: 8018732,
+    20646: 8024374,
+    20691: 7001500,
+    20825: 7001657,
+    20956: 7001341,
+    21021: 8021071,
+    21033: 6001864,
+    21054: 8018238,
+    21125: 3000137,
+    21164: 8026632,
+    21175: 7001491,
+    21266: 6001559,
+    21315: 8020421,
+    21402: 8024218,
+    21460: 8026582,
+    21483: 8024618,
+    21525: 8022098,
+    21645: 8024437,
+    21658: 8020890,
+    21675: 7001155,
+    21692: 8026957,
+    21812: 8026438,
+    21850: 8022723,
+    21879: 8025280,
+    21964: 7001175,
+    21970: 6001325,
+    22022: 8018888,
+    22185: 8024762,
+    22218: 8010464,
+    22295: 6001622,
+    22425: 8022748,
+    22506: 8018069,
+    22542: 8014520,
+    22550: 8022086,
+    22707: 3000146,
+    22724: 8027112,
+    22743: 7000997,
+    22785: 8020252,
+    22878: 8024205,
+    22940: 8026569,
+    22977: 6001876,
+    22990: 8018563,
+    23125: 2000131,
+    23188: 8026788,
+    23275: 7001656,
+    23276: 7000840,
+    23322: 8016210,
+    23375: 6001776,
+    23452: 8026463,
+    23548: 7000672,
+    23595: 8018900,
+    23667: 6001584,
+    23715: 8024593,
+    23751: 8024774,
+    23780: 8026413,
+    23805: 7000829,
+    23826: 8012492,
+    23828: 8026594,
+    23925: 8022592,
+    23985: 8024268,
+    24050: 8022242,
+    24206: 8020721,
+    24225: 8022904,
+    24244: 8026944,
+    24273: 6001888,
+    24453: 8025111,
+    24548: 7001007,
+    24633: 8024930,
+    24642: 7000324,
+    24650: 8022567,
+    24794: 8020565,
+    24795: 8024749,
+    24843: 7001311,
+    25012: 7001340,
+    25025: 8023266,
+    25047: 7001499,
+    25172: 8026750,
+    25230: 8008436,
+    25270: 8012648,
+    25375: 6001738,
+    25382: 6001546,
+    25389: 8024605,
+    25420: 8026400,
+    25461: 6001863,
+    25575: 8022423,
+    25625: 2000130,
+    25636: 8026956,
+    25641: 8024449,
+    25857: 7001332,
+    25916: 8026775,
+    25947: 3000145,
+    26026: 8016860,
+    26125: 6001763,
+    26350: 8022398,
+    26404: 8026425,
+    26411: 2000125,
+    26450: 7000818,
+    26505: 8024580,
+    26588: 7001174,
+    26650: 8022073,
+    26862: 8017900,
+    26908: 7000503,
+    27075: 7000986,
+    27125: 6001725,
+    27195: 8020083,
+    27306: 8024192,
+    27380: 7000335,
+    27404: 8026787,
+    27436: 3000077,
+    27489: 8020902,
+    27508: 7000839,
+    27531: 8024917,
+    27550: 8022554,
+    27625: 6001775,
+    27676: 8026619,
+    27716: 7001339,
+    27830: 8018394,
+    27885: 8016872,
+    27951: 6001480,
+    28126: 6001533,
+    28158: 8012323,
+    28175: 7001655,
+    28275: 8022579,
+    28305: 8024424,
+    28322: 7001143,
+    28413: 8024280,
+    28611: 7001165,
+    28652: 8026943,
+    28730: 8016535,
+    28798: 8018719,
+    28830: 8006239,
+    28899: 7001331,
+    28971: 6001875,
+    29155: 6001609,
+    29282: 2000116,
+    29302: 8020552,
+    29325: 8022735,
+    29348: 8026931,
+    29406: 8016041,
+    29450: 8022385,
+    29478: 6001169,
+    29575: 7001322,
+    29601: 8024942,
+    29645: 7001479,
+    29716: 8027111,
+    29766: 8017731,
+    29841: 6001571,
+    30015: 8024736,
+    30044: 8026581,
+    30135: 8019914,
+    30225: 8022410,
+    30258: 7000155,
+    30303: 8024436,
+    30340: 8026387,
+    30345: 8014844,
+    30525: 8022254,
+    30628: 8026774,
+    30668: 8026450,
+    30723: 8020733,
+    30758: 6001312,
+    30855: 8018731,
+    30875: 6001762,
+    30932: 8026606,
+    30969: 6001874,
+    31059: 8024761,
+    31213: 2000124,
+    31262: 8020396,
+    31365: 8024255,
+    31372: 8026762,
+    31434: 8015872,
+    31450: 8022229,
+    31581: 7001498,
+    31625: 6001750,
+    31635: 8024411,
+    31654: 8020708,
+    31790: 8014676,
+    31899: 6001558,
+    31977: 8025098,
+    32085: 8024567,
+    32103: 6001862,
+    32110: 8016366,
+    32116: 8026568,
+    32186: 8018550,
+    32375: 6001712,
+    32487: 8020889,
+    32585: 6001596,
+    32708: 8026618,
+    32725: 8023097,
+    32775: 8022722,
+    32946: 8014182,
+    32955: 6001324,
+    33033: 8018887,
+    33201: 8024592,
+    33212: 7001005,
+    33275: 3000114,
+    33292: 8026412,
+    33327: 7000828,
+    33350: 8022541,
+    33418: 8020227,
+    33524: 7001173,
+    33579: 8024267,
+    33620: 7000166,
+    33759: 7001497,
+    33813: 7001164,
+    33825: 8022085,
+    34276: 8026437,
+    34317: 6001861,
+    34485: 8018562,
+    34606: 6001455,
+    34684: 8026930,
+    34713: 8024748,
+    34850: 8022060,
+    34914: 8010295,
+    34983: 7001330,
+    35035: 8021070,
+    35055: 8024242,
+    35090: 8018225,
+    35150: 8022216,
+    35322: 8008267,
+    35378: 7000974,
+    35525: 7001654,
+    35588: 8026399,
+    35650: 8022372,
+    35739: 7000996,
+    35836: 7001172,
+    35875: 6001699,
+    35972: 7000838,
+    36075: 8022241,
+    36125: 3000136,
+    36244: 8026449,
+    36309: 8020720,
+    36556: 8026605,
+    36575: 8022928,
+    36822: 8012154,
+    36946: 8020383,
+    36963: 3000144,
+    36975: 8022566,
+    37004: 7000671,
+    37030: 8010451,
+    37076: 8026761,
+    37107: 8024579,
+    37191: 8020564,
+    37323: 8024773,
+    37375: 6001749,
+    37444: 8026593,
+    37468: 8026942,
+    37510: 8018056,
+    37518: 8015703,
+    37570: 8014507,
+    37791: 8025097,
+    37845: 7000660,
+    37905: 8012647,
+    37975: 7001653,
+    38073: 6001545,
+    38295: 8024398,
+    38318: 8020539,
+    38332: 7000334,
+    38675: 8023084,
+    38709: 8024929,
+    38870: 8016197,
+    38950: 8022047,
+    38962: 8018381,
+    39039: 8016859,
+    39325: 7001489,
+    39445: 6001583,
+    39494: 8020214,
+    39525: 8022397,
+    39556: 8026749,
+    39627: 8024423,
+    39675: 7000817,
+    39710: 8012479,
+    39875: 6001737,
+    39882: 8014013,
+    39886: 8020058,
+    39897: 8024604,
+    39975: 8022072,
+    40052: 8026773,
+    40204: 7000837,
+    40222: 8016522,
+    40293: 7001496,
+    40362: 8006070,
+    40375: 6001761,
+    40455: 8024554,
+    40508: 8026436,
+    40817: 2000123,
+    40898: 7001299,
+    40959: 6001860,
+    41070: 8004042,
+    41154: 6001000,
+    41262: 8010126,
+    41325: 8022553,
+    41405: 7001310,
+    41492: 8026424,
+    41503: 3000125,
+    41574: 8015534,
+    41745: 8018393,
+    41876: 7001004,
+    42021: 8024735,
+    42050: 7000649,
+    42189: 6001532,
+    42237: 7000995,
+    42284: 7000502,
+    42435: 8024229,
+    42476: 8026386,
+    42483: 7001142,
+    42550: 8022203,
+    42625: 6001724,
+    42772: 7001171,
+    42826: 8020526,
+    43095: 8016534,
+    43197: 8018718,
+    43225: 8022915,
+    43245: 7000491,
+    43263: 8024916,
+    43732: 7000670,
+    43911: 8024254,
+    43923: 2000115,
+    43953: 8020551,
+    44109: 7001329,
+    44175: 8022384,
+    44198: 8019889,
+    44217: 3000089,
+    44252: 8026592,
+    44275: 8022759,
+    44289: 8024410,
+    44506: 8014663,
+    44649: 7001495,
+    44764: 7001003,
+    44770: 8017887,
+    44919: 8024566,
+    44950: 8022359,
+    44954: 8016353,
+    45125: 3000135,
+    45254: 6001442,
+    45325: 7001652,
+    45356: 8026929,
+    45387: 3000143,
+    45619: 2000122,
+    45747: 8024928,
+    45815: 8020901,
+    46137: 6001311,
+    46475: 7001321,
+    46585: 6001479,
+    46748: 8026748,
+    46893: 8020395,
+    46930: 8012310,
+    47068: 7000165,
+    47125: 6001736,
+    47138: 8020045,
+    47150: 8022034,
+    47151: 7001328,
+    47175: 8022228,
+    47212: 8026580,
+    47396: 7001170,
+    47481: 8020707,
+    47619: 8024435,
+    47685: 8014675,
+    47804: 8026604,
+    48050: 7000480,
+    48165: 8016365,
+    48279: 8018549,
+    48285: 8024385,
+    48314: 8020370,
+    48334: 6001299,
+    48484: 8026760,
+    48668: 3000064,
+    48807: 8024760,
+    48875: 6001748,
+    49010: 8016028,
+    49036: 8026423,
+    49049: 6001620,
+    49077: 8024241,
+    49126: 8018212,
+    49130: 6001156,
+    49419: 7001162,
+    49610: 8017718,
+    49735: 6001570,
+    49818: 8011816,
+    49972: 7000501,
+    50025: 8022540,
+    50127: 8020226,
+    50225: 7001651,
+    50286: 8013844,
+    50375: 6001723,
+    50430: 8001845,
+    50468: 8026567,
+    50575: 7001153,
+    50578: 6001429,
+    50692: 8026928,
+    50875: 6001711,
+    51129: 8024915,
+    51205: 8020732,
+    51425: 7001488,
+    51615: 8024372,
+    51646: 8020201,
+    51842: 7000805,
+    51909: 6001454,
+    52173: 8024591,
+    52234: 8019876,
+    52275: 8022059,
+    52316: 8026411,
+    52325: 8022746,
+    52371: 7000827,
+    52390: 8015859,
+    52514: 8018043,
+    52598: 8014494,
+    52635: 8018224,
+    52725: 8022215,
+    52767: 8024266,
+    52972: 8026435,
+    52983: 7000659,
+    53067: 7000973,
+    53165: 6001557,
+    53428: 7001002,
+    53475: 8022371,
+    53482: 8018693,
+    53505: 8024216,
+    53613: 8024397,
+    53650: 8022190,
+    53754: 8013675,
+    53958: 8009957,
+    53998: 8020357,
+    54145: 8020888,
+    54188: 8026759,
+    54418: 8016184,
+    54549: 8024747,
+    54625: 6001747,
+    54910: 8014169,
+    54925: 3000101,
+    55055: 8018886,
+    55223: 2000121,
+    55233: 7000994,
+    55419: 8020382,
+    55506: 8008098,
+    55545: 8010450,
+    55594: 8012466,
+    55796: 8026579,
+    55825: 8022590,
+    55924: 8026398,
+    56265: 8018055,
+    56277: 7001327,
+    56355: 8014506,
+    56375: 6001698,
+    56525: 8022902,
+    56637: 8024553,
+    57122: 2000103,
+    57188: 7000669,
+    57195: 8024203,
+    57350: 8022177,
+    57475: 7001487,
+    57477: 8020538,
+    57498: 8003873,
+    57681: 8024759,
+    57722: 8020188,
+    57868: 8026591,
+    57967: 3000124,
+    58190: 8010282,
+    58305: 8016196,
+    58311: 8024578,
+    58425: 8022046,
+    58443: 8018380,
+    58870: 8008254,
+    59204: 7001001,
+    59241: 8020213,
+    59409: 8024228,
+    59450: 8022021,
+    59565: 8012478,
+    59644: 8026566,
+    59675: 8022421,
+    59774: 8018524,
+    59823: 7001161,
+    59829: 8020057,
+    60125: 6001710,
+    60236: 7000333,
+    60306: 8009788,
+    60333: 8016521,
+    60515: 8020719,
+    60543: 7000490,
+    60775: 8023083,
+    61132: 8026747,
+    61226: 6001416,
+    61347: 7001298,
+    61364: 7000835,
+    61370: 8012141,
+    61605: 7000322,
+    61625: 6001735,
+    61642: 8020032,
+    61659: 8024590,
+    61731: 3000076,
+    61828: 8026410,
+    61893: 7000826,
+    61985: 8020563,
+    62271: 8024422,
+    62361: 7001326,
+    62530: 8015690,
+    62678: 8017874,
+    62814: 8011647,
+    63075: 7000648,
+    63175: 7000984,
+    63206: 8016509,
+    63426: 8005901,
+    63455: 6001544,
+    63550: 8022008,
+    63825: 8022202,
+    63916: 7000668,
+    64124: 8026422,
+    64141: 6001607,
+    64158: 8013506,
+    64239: 8020525,
+    64467: 8024746,
+    64676: 8026590,
+    65065: 8016858,
+    65219: 3000113,
+    65348: 7000500,
+    65366: 8020344,
+    65596: 7000834,
+    65598: 8007929,
+    65702: 8012297,
+    65875: 6001722,
+    65975: 8022577,
+    66033: 8024734,
+    66092: 8026397,
+    66125: 3000134,
+    66297: 8019888,
+    66470: 8014000,
+    66625: 6001697,
+    66748: 8026385,
+    66759: 8014662,
+    66861: 8024914,
+    67146: 8011478,
+    67155: 8017886,
+    67270: 8006057,
+    67425: 8022358,
+    67431: 8016352,
+    67599: 8024384,
+    67881: 6001441,
+    67925: 8022914,
+    68265: 8024190,
+    68306: 8019863,
+    68324: 8026746,
+    68425: 8022733,
+    68450: 7000311,
+    68590: 6000987,
+    68614: 8016015,
+    68770: 8010113,
+    68782: 6001143,
+    68875: 6001734,
+    68894: 8020019,
+    68913: 8024577,
+    69003: 8024253,
+    69290: 8015521,
+    69454: 8017705,
+    69575: 7001486,
+    69597: 8024409,
+    69629: 2000120,
+    69874: 8020175,
+    69938: 7001130,
+    70315: 6001531,
+    70395: 8012309,
+    70525: 8022408,
+    70587: 8024565,
+    70602: 8001676,
+    70642: 8016340,
+    70707: 8020044,
+    70725: 8022033,
+    70805: 7001141,
+    71094: 8013337,
+    71188: 7000332,
+    71225: 8022252,
+    71668: 8026421,
+    71687: 6001594,
+    71825: 7001319,
+    71995: 8018717,
+    72075: 7000479,
+    72261: 8024371,
+    72358: 8018355,
+    72471: 8020369,
+    72501: 6001298,
+    72964: 8026578,
+    73002: 6000831,
+    73036: 7000499,
+    73205: 2000114,
+    73255: 8020550,
+    73346: 8015846,
+    73515: 8016027,
+    73593: 8024421,
+    73625: 6001721,
+    73689: 8018211,
+    73695: 6001155,
+    73964: 7000164,
+    74415: 8017717,
+    74431: 2000119,
+    74698: 6001273,
+    74727: 7000992,
+    74907: 8024215,
+    74958: 8005732,
+    75429: 7001160,
+    75645: 7000153,
+    75803: 6001606,
+    75850: 8021995,
+    75867: 6001428,
+    76342: 8019850,
+    76475: 8022720,
+    76874: 8014156,
+    76895: 6001310,
+    77077: 7001476,
+    77121: 8024240,
+    77198: 6001403,
+    77372: 7000667,
+    77469: 8020200,
+    77763: 7000804,
+    77996: 8026565,
+    78039: 8024733,
+    78155: 8020394,
+    78166: 8018511,
+    78292: 7000833,
+    78351: 8019875,
+    78585: 8015858,
+    78625: 6001709,
+    78771: 8018042,
+    78884: 8026384,
+    78897: 8014493,
+    78925: 8022083,
+    79135: 8020706,
+    79475: 7001152,
+    80073: 8024202,
+    80142: 8011309,
+    80223: 8018692,
+    80275: 7001318,
+    80465: 8018548,
+    80475: 8022189,
+    80631: 7001159,
+    80852: 8026409,
+    80937: 7000825,
+    80997: 8020356,
+    81466: 8010269,
+    81548: 8026577,
+    81549: 8024252,
+    81627: 8016183,
+    82225: 8022745,
+    82251: 8024408,
+    82365: 8014168,
+    82418: 7000636,
+    82522: 6001390,
+    82654: 8014481,
+    82708: 8026745,
+    83030: 8011803,
+    83259: 7000658,
+    83375: 6001733,
+    83391: 8012465,
+    83398: 8020006,
+    83421: 8024564,
+    83486: 6001260,
+    83545: 8020225,
+    83810: 8013831,
+    84050: 7000142,
+    84175: 8022239,
+    84249: 8024396,
+    84303: 8024745,
+    84721: 6001593,
+    85514: 8016171,
+    85683: 2000102,
+    85782: 8007760,
+    85918: 8012128,
+    86025: 8022176,
+    86247: 7000321,
+    86275: 8022564,
+    86428: 8026396,
+    86515: 6001453,
+    86583: 8020187,
+    86756: 7000832,
+    86779: 6001581,
+    87125: 6001696,
+    87172: 8026564,
+    87285: 8010281,
+    87362: 7000961,
+    87412: 7000163,
+    87542: 8015677,
+    87725: 7001485,
+    87875: 6001708,
+    88102: 8020162,
+    88305: 8008253,
+    88412: 7000498,
+    88445: 7000972,
+    88806: 8011140,
+    88825: 8022901,
+    88837: 2000118,
+    89001: 8024552,
+    89125: 6001720,
+    89175: 8022020,
+    89590: 8013662,
+    89661: 8018523,
+    89930: 8009944,
+    90117: 8024576,
+    90354: 8003704,
+    90364: 8026408,
+    90459: 7000824,
+    91091: 7001308,
+    91143: 8024239,
+    91234: 8018186,
+    91839: 6001415,
+    92046: 8009450,
+    92055: 8012140,
+    92225: 8022395,
+    92365: 8020381,
+    92414: 8019837,
+    92463: 8020031,
+    92510: 8008085,
+    92575: 7000815,
+    93058: 8013987,
+    93092: 7000331,
+    93275: 8022070,
+    93357: 8024227,
+    93775: 7001484,
+    93795: 8015689,
+    93925: 7001151,
+    94017: 8017873,
+    94178: 7000467,
+    94221: 7000991,
+    94622: 8018342,
+    94809: 8016508,
+    95139: 7000489,
+    95325: 8022007,
+    95571: 8024189,
+    95795: 8020537,
+    95830: 8003860,
+    95874: 8007591,
+    96026: 6000974,
+    96237: 7001158,
+    96278: 8010100,
+    96425: 8022551,
+    96596: 8026395,
+    97006: 8015508,
+    97175: 7001317,
+    97375: 6001695,
+    97405: 8018379,
+    97526: 8018017,
+    97556: 3000051,
+    97682: 7001117,
+    98022: 8005563,
+    98049: 8020343,
+    98394: 8009281,
+    98397: 7000657,
+    98441: 2000117,
+    98494: 6001377,
+    98553: 8012296,
+    98716: 8026576,
+    98735: 8020212,
+    99127: 3000123,
+    99275: 7000983,
+    99567: 8024395,
+    99705: 8013999,
+    99715: 8020056,
+    100510: 8009775,
+    100555: 8016520,
+    100719: 7000990,
+    100793: 7001475,
+    100905: 8006056,
+    101062: 6001247,
+    102051: 8024732,
+    102245: 7001297,
+    102459: 8019862,
+    102487: 2000113,
+    102557: 6001580,
+    102675: 7000310,
+    102885: 6000986,
+    102921: 8016014,
+    103075: 8022382,
+    103155: 8010112,
+    103156: 8026383,
+    103173: 6001142,
+    103246: 8012284,
+    103341: 8020018,
+    103675: 8022576,
+    103935: 8015520,
+    104044: 7000330,
+    104181: 8017704,
+    104284: 7000665,
+    104690: 8011634,
+    104811: 8020174,
+    104907: 7001129,
+    104975: 8022900,
+    105125: 3000133,
+    105154: 8019993,
+    105183: 8024551,
+    105524: 8026563,
+    105710: 8005888,
+    105754: 8018329,
+    105903: 7000152,
+    105963: 8016339,
+    106227: 8024383,
+    106375: 6001707,
+    106641: 7001157,
+    106782: 8003535,
+    106930: 8013493,
+    107065: 8020524,
+    107525: 8022732,
+    107559: 8024407,
+    107653: 3000100,
+    107822: 8016002,
+    108086: 6001130,
+    108537: 8018354,
+    109089: 8024563,
+    109142: 6001364,
+    109174: 8016314,
+    109330: 8007916,
+    109388: 8026407,
+    109417: 6001568,
+    109503: 3000063,
+    109554: 8005394,
+    110019: 8015845,
+    110075: 8022226,
+    110331: 8024226,
+    110495: 8019887,
+    110789: 6001592,
+    110825: 8022407,
+    110946: 8001507,
+    111265: 8014661,
+    111476: 7000497,
+    111910: 8011465,
+    111925: 7001483,
+    112047: 6001272,
+    112375: 6001719,
+    112385: 8016351,
+    112406: 8019980,
+    112437: 7000488,
+    112651: 7001474,
+    113135: 6001440,
+    113553: 8024370,
+    113775: 8021994,
+    114057: 8024731,
+    114308: 7000162,
+    114513: 8019849,
+    115258: 8015833,
+    115292: 8026382,
+    115311: 8014155,
+    115797: 6001402,
+    116058: 8007422,
+    116242: 8011790,
+    116402: 8017848,
+    116522: 8019824,
+    116725: 8022538,
+    116932: 8026394,
+    116963: 6001555,
+    117249: 8018510,
+    117325: 7000982,
+    117334: 8013818,
+    117438: 8009112,
+    117670: 8001663,
+    117711: 8024214,
+    117845: 8020043,
+    117875: 6001694,
+    118490: 8013324,
+    119119: 8020886,
+    119164: 3000038,
+    119187: 8024238,
+    119306: 8018173,
+    120125: 3000132,
+    120175: 8022719,
+    120213: 7000989,
+    120785: 8020368,
+    120802: 8014143,
+    120835: 6001297,
+    121121: 6001452,
+    121670: 6000818,
+    121923: 8024562,
+    121975: 8022057,
+    122018: 7000948,
+    122199: 8010268,
+    122525: 7001316,
+    122815: 8018210,
+    122825: 3000088,
+    123025: 8022213,
+    123627: 7000635,
+    123783: 6001389,
+    123823: 3000122,
+    123981: 8014480,
+    124025: 7001482,
+    124468: 7000664,
+    124545: 8011802,
+    124558: 8019811,
+    124775: 8022369,
+    124930: 8005719,
+    125097: 8020005,
+    125229: 6001259,
+    125426: 8013649,
+    125541: 8024382,
+    125715: 8013830,
+    125829: 8024201,
+    125902: 8009931,
+    125948: 7000329,
+    126075: 7000141,
+    126445: 6001427,
+    127075: 8022731,
+    127426: 6001234,
+    127534: 8018004,
+    127738: 6001117,
+    127756: 7000161,
+    128018: 7000792,
+    128271: 8016170,
+    128673: 7000656,
+    128877: 8012127,
+    128986: 8017679,
+    129115: 8020199,
+    129311: 6001567,
+    129514: 8008072,
+    129605: 7000803,
+    130134: 8008943,
+    130203: 8024394,
+    130585: 8019874,
+    130975: 7001315,
+    131043: 7000960,
+    131118: 8001338,
+    131285: 8018041,
+    131313: 8015676,
+    131495: 8014492,
+    132153: 8020161,
+    132158: 8016145,
+    132275: 8022238,
+    132618: 8005225,
+    133052: 8026562,
+    133133: 8020717,
+    133209: 7000988,
+    133342: 8018160,
+    133570: 8011296,
+    133705: 8018691,
+    134113: 6001579,
+    134125: 6001706,
+    134162: 7000298,
+    134199: 8024369,
+    134385: 8013661,
+    134895: 8009943,
+    134995: 8020355,
+    135014: 8012115,
+    135531: 7000320,
+    135575: 8022563,
+    136045: 8016182,
+    136214: 6001221,
+    136325: 8022044,
+    136367: 7001473,
+    136851: 8018185,
+    137275: 7001149,
+    137547: 8024550,
+    137566: 8015664,
+    137924: 7000663,
+    138069: 7000822,
+    138229: 6001554,
+    138621: 8019836,
+    138765: 8008084,
+    138985: 8012464,
+    139113: 8024213,
+    139564: 8026381,
+    139587: 8013986,
+    139601: 6001542,
+    139638: 8003366,
+    140714: 8009762,
+    140777: 7001306,
+    141267: 7000466,
+    141933: 8018341,
+    142025: 8022718,
+    142228: 7000495,
+    142538: 8017991,
+    142766: 8014130,
+    142805: 2000101,
+    142970: 8007747,
+    143143: 7001296,
+    143375: 6001705,
+    143745: 8003859,
+    143811: 7000655,
+    144039: 6000973,
+    144279: 8024225,
+    144305: 8020186,
+    144417: 8010099,
+    144925: 8022394,
+    145475: 7000814,
+    145509: 8015507,
+    145521: 8024393,
+    146234: 8013974,
+    146289: 8018016,
+    146334: 6000662,
+    146523: 7001116,
+    146566: 8011621,
+    146575: 8022069,
+    147033: 7000487,
+    147175: 7000646,
+    147436: 8026393,
+    147591: 7000821,
+    147706: 8016132,
+    147741: 6001376,
+    147994: 8005875,
+    148010: 8011127,
+    148625: 6001693,
+    148666: 8019798,
+    148707: 8024200,
+    148925: 8022200,
+    149435: 8018522,
+    149702: 8013480,
+    149891: 6001578,
+    150183: 8024188,
+    150590: 8003691,
+    150765: 8009774,
+    150898: 6000961,
+    151294: 8010087,
+    151525: 8022550,
+    151593: 6001246,
+    152218: 8017835,
+    152438: 8015495,
+    153062: 8007903,
+    153065: 6001414,
+    153410: 8009437,
+    153425: 7000981,
+    153729: 8024549,
+    154105: 8020030,
+    154652: 7000160,
+    154693: 6001529,
+    154869: 8012283,
+    155771: 7001139,
+    156066: 8003197,
+    156325: 7001314,
+    156426: 8007084,
+    156674: 8011452,
+    156695: 8017872,
+    157035: 8011633,
+    157325: 8022356,
+    157339: 7001305,
+    157604: 7000494,
+    157731: 8019992,
+    158015: 8016507,
+    158389: 6001439,
+    158565: 8005887,
+    158631: 8018328,
+    158804: 7000328,
+    158875: 6001692,
+    159562: 8012102,
+    159790: 8007578,
+    160173: 7000319,
+    160225: 8022562,
+    160395: 8013492,
+    161161: 8020548,
+    161253: 8024224,
+    161414: 8018147,
+    161733: 8016001,
+    161975: 8022381,
+    162129: 6001129,
+    162578: 6001208,
+    163370: 8005550,
+    163415: 8020342,
+    163713: 6001363,
+    163761: 8016313,
+    163990: 8009268,
+    163995: 8007915,
+    164169: 8024381,
+    164255: 8012295,
+    164331: 7000486,
+    164738: 7000129,
+    164983: 6001541,
+    165025: 8022031,
+    165886: 8013311,
+    166175: 7001148,
+    166419: 7000151,
+    166634: 8015976,
+    167042: 2000090,
+    167214: 8005056,
+    167865: 8011464,
+    168175: 7000477,
+    168609: 8019979,
+    168674: 8017666,
+    169099: 6001566,
+    169169: 6001296,
+    169756: 7000327,
+    170126: 8017822,
+    170338: 6000805,
+    170765: 8019861,
+    171125: 3000131,
+    171275: 8022393,
+    171462: 8001169,
+    171475: 3000075,
+    171535: 8016013,
+    171925: 7000813,
+    171941: 7001472,
+    171955: 6001141,
+    172235: 8020017,
+    172546: 8017978,
+    172822: 8013961,
+    172887: 8015832,
+    172975: 8022225,
+    173225: 7001313,
+    173635: 8017703,
+    174087: 7000654,
+    174097: 8020704,
+    174363: 8011789,
+    174603: 8017847,
+    174685: 8020173,
+    174783: 8019823,
+    174845: 7001128,
+    174902: 8005706,
+    175491: 8024368,
+    175972: 8026380,
+    176001: 8013817,
+    176157: 7000820,
+    176505: 8001662,
+    176605: 8016338,
+    177023: 6001426,
+    177489: 8024187,
+    177735: 8013323,
+    177970: 8003522,
+    178126: 8015807,
+    178334: 6000948,
+    178746: 6000493,
+    178802: 7000779,
+    178959: 8018172,
+    179075: 8022549,
+    180154: 6001195,
+    180761: 6001553,
+    180895: 8018353,
+    181203: 8014142,
+    181447: 3000121,
+    181917: 8024212,
+    182505: 6000817,
+    182590: 8005381,
+    182666: 8011777,
+    182819: 6001528,
+    183027: 7000947,
+    183365: 8015844,
+    183425: 8022537,
+    183483: 8024380,
+    183799: 7001471,
+    184093: 7001138,
+    184382: 8013805,
+    184910: 8001494,
+    185725: 8022717,
+    186093: 8024548,
+    186238: 8015963,
+    186694: 6001091,
+    186702: 8006915,
+    186745: 6001271,
+    186837: 8019810,
+    186998: 8011283,
+    187187: 8018690,
+    187395: 8005718,
+    187775: 8022187,
+    188108: 8026379,
+    188139: 8013648,
+    188518: 8017653,
+    188853: 8009930,
+    188922: 8003028,
+    188993: 6001565,
+    189625: 6001691,
+    190333: 2000111,
+    190463: 7001304,
+    190855: 8019848,
+    191139: 6001233,
+    191301: 8018003,
+    191425: 8022380,
+    191607: 6001116,
+    191634: 8001000,
+    191675: 8022056,
+    192027: 7000791,
+    192185: 8014154,
+    192995: 6001401,
+    193325: 8022212,
+    193430: 8007409,
+    193479: 8017678,
+    194271: 8008071,
+    194463: 8024199,
+    194579: 7000970,
+    194996: 7000159,
+    195201: 7000819,
+    195415: 8018509,
+    195730: 8009099,
+    196075: 8022368,
+    196137: 8024367,
+    196677: 7000150,
+    197098: 8013636,
+    197846: 8009918,
+    198237: 8016144,
+    198927: 7000485,
+    199082: 8015794,
+    199927: 2000100,
+    200013: 8018159,
+    200158: 8007734,
+    200355: 8011295,
+    200725: 8022174,
+    201243: 7000297,
+    202027: 6001552,
+    202521: 8012114,
+    202612: 3000025,
+    203203: 8020379,
+    203319: 8024211,
+    203522: 7000623,
+    203665: 8010267,
+    204321: 6001220,
+    204425: 8022224,
+    205751: 8020703,
+    205942: 8017809,
+    206045: 7000634,
+    206305: 6001388,
+    206349: 8015663,
+    206635: 8014479,
+    206886: 8006746,
+    207214: 8011114,
+    207575: 7000979,
+    208075: 8022018,
+    208444: 7000158,
+    208495: 8020004,
+    208658: 7000935,
+    208715: 6001258,
+    209209: 8018521,
+    209457: 7000318,
+    209525: 7001147,
+    210125: 3000130,
+    210749: 8020535,
+    210826: 8003678,
+    211071: 8009761,
+    212602: 8015638,
+    213342: 8004718,
+    213785: 8016169,
+    213807: 8017990,
+    214149: 8014129,
+    214225: 8022043,
+    214291: 6001413,
+    214455: 8007746,
+    214774: 8009424,
+    214795: 8012126,
+    215747: 6001540,
+    215878: 8011764,
+    216775: 8022536,
+    216890: 8008930,
+    217217: 8020210,
+    217341: 8024198,
+    217558: 8017965,
+    217906: 8013792,
+    218405: 7000959,
+    218530: 8001325,
+    218855: 8015675,
+    219351: 8013973,
+    219373: 7001470,
+    219501: 3000050,
+    219849: 8011620,
+    220255: 8020160,
+    221030: 8005212,
+    221122: 8009749,
+    221221: 8016506,
+    221559: 8016131,
+    221991: 8005874,
+    222015: 8011126,
+    222111: 8024379,
+    222425: 8022005,
+    222999: 8019797,
+    223706: 8007565,
+    223975: 7001146,
+    224516: 7000325,
+    224553: 8013479,
+    224825: 7000812,
+    224939: 3000111,
+    225446: 8015950,
+    225885: 8003690,
+    225998: 6001078,
+    226347: 6000960,
+    226525: 8022055,
+    226941: 8010086,
+    228085: 8018184,
+    228206: 8017640,
+    228327: 8017834,
+    228475: 8022211,
+    228657: 8015494,
+    228718: 8005537,
+    228781: 6001564,
+    229586: 8009255,
+    229593: 8007902,
+    229957: 7000969,
+    230115: 8009436,
+    230318: 8011608,
+    231035: 8019835,
+    231275: 7000645,
+    231725: 8022367,
+    231978: 8000831,
+    232101: 8024186,
+    232562: 7000454,
+    232645: 8013985,
+    232730: 8003353,
+    232934: 8013623,
+    233206: 6000935,
+    233818: 8009905,
+    234025: 8022199,
+    234099: 7000317,
+    234175: 8022548,
+    234639: 7000652,
+    235011: 8011451,
+    235246: 8013467,
+    235445: 7000465,
+    235543: 8020522,
+    235586: 8015469,
+    236406: 8004549,
+    236555: 8018340,
+    237429: 8024366,
+    237614: 8015625,
+    238206: 8002859,
+    239071: 6001527,
+    239343: 8012101,
+    239575: 7000308,
+    239685: 8007577,
+    240065: 6000972,
+    240149: 7001303,
+    240526: 8007890,
+    240695: 8010098,
+    240737: 3000087,
+    240994: 8015781,
+    241129: 6001539,
+    242121: 8018146,
+    242515: 8015506,
+    243089: 7001469,
+    243815: 8018015,
+    243867: 6001207,
+    243890: 6000649,
+    244205: 7001115,
+    244559: 6001551,
+    244783: 7001127,
+    245055: 8005549,
+    245985: 8009267,
+    246123: 8024210,
+    246202: 8011439,
+    246235: 6001375,
+    247107: 7000128,
+    247225: 8022355,
+    247247: 8016337,
+    248788: 7000157,
+    248829: 8013310,
+    248897: 2000110,
+    249067: 8020534,
+    249158: 8003509,
+    249951: 8015975,
+    250325: 8022379,
+    250563: 2000089,
+    250821: 7000484,
+    251275: 7000811,
+    252586: 8013935,
+    252655: 6001245,
+    253011: 8017665,
+    253175: 8022042,
+    253253: 8018352,
+    254634: 8002690,
+    255189: 8017821,
+    255507: 6000804,
+    255626: 8005368,
+    256711: 7001302,
+    257193: 7000149,
+    258115: 8012282,
+    258819: 8017977,
+    258874: 8001481,
+    259233: 8013960,
+    259259: 8020041,
+    259325: 8022030,
+    259407: 8024185,
+    259666: 8017796,
+    260110: 8003184,
+    260642: 2000077,
+    260678: 8013298,
+    260710: 8007071,
+    261326: 8009736,
+    261443: 6001270,
+    261725: 7000978,
+    262353: 8005705,
+    262885: 8019991,
+    263097: 8024197,
+    263302: 8015456,
+    264275: 7000476,
+    264385: 8018327,
+    265475: 8021992,
+    265727: 8020366,
+    265837: 3000099,
+    266955: 8003521,
+    267189: 8015806,
+    267197: 6001526,
+    267325: 7001145,
+    267501: 6000947,
+    267674: 6000792,
+    268119: 3000037,
+    268203: 7000778,
+    269059: 7001136,
+    269555: 8016000,
+    270193: 6001400,
+    270215: 6001128,
+    270231: 6001194,
+    270802: 8007396,
+    272194: 8011595,
+    272855: 6001362,
+    272935: 8016312,
+    273325: 7000644,
+    273581: 8018508,
+    273885: 8005380,
+    273999: 8011776,
+    274022: 8009086,
+    274846: 8005693,
+    275684: 3000012,
+    276573: 8013804,
+    276575: 8022198,
+    277365: 8001493,
+    277574: 8017783,
+    278018: 8013454,
+    278179: 2000109,
+    278369: 8020521,
+    278690: 8005043,
+    279357: 8015962,
+    279775: 7000977,
+    280041: 6001090,
+    280053: 7000651,
+    280497: 8011282,
+    281015: 8019978,
+    282302: 8011751,
+    282777: 8017652,
+    283383: 7000316,
+    283475: 8022535,
+    284053: 8020197,
+    284258: 7000610,
+    284954: 6001065,
+    285131: 7000801,
+    285770: 8001156,
+    287287: 8019872,
+    287451: 7000148,
+    287638: 8015612,
+    287738: 8017627,
+    288145: 8015831,
+    288463: 3000120,
+    288827: 6001387,
+    289289: 8014478,
+    290145: 8007408,
+    290605: 8011788,
+    290966: 8011426,
+    291005: 8017846,
+    291305: 8019822,
+    291893: 6001538,
+    292175: 8022354,
+    292201: 6001257,
+    292494: 8000662,
+    293335: 8013816,
+    293595: 8009098,
+    293854: 8011270,
+    294151: 6001437,
+    294175: 7000139,
+    295075: 8022186,
+    295647: 8013635,
+    296225: 7001144,
+    296769: 8009917,
+    296989: 8020353,
+    297910: 6000480,
+    298265: 8018171,
+    298623: 8015793,
+    298775: 8022210,
+    299299: 8016168,
+    299367: 8024365,
+    300237: 8007733,
+    300713: 7000968,
+    302005: 8014141,
+    303025: 8022366,
+    303646: 8008917,
+    303862: 8015768,
+    303918: 6000324,
+    304175: 3000062,
+    304606: 6001052,
+    305045: 7000946,
+    305283: 7000622,
+    305762: 7000766,
+    305767: 7000958,
+    305942: 8001312,
+    306397: 7001301,
+    306475: 8022029,
+    307582: 8017614,
+    308074: 8013285,
+    308357: 6001550,
+    308913: 8017808,
+    309442: 8005199,
+    310329: 7000650,
+    310821: 8011113,
+    311170: 8006902,
+    311395: 8019809,
+    312325: 7000475,
+    312666: 8000493,
+    312987: 7000934,
+    313565: 8013647,
+    314019: 8024184,
+    314041: 8020365,
+    314171: 2000099,
+    314534: 8007721,
+    314755: 8009929,
+    314870: 8003015,
+    315425: 8022173,
+    315514: 6000909,
+    316239: 8003677,
+    316342: 6000779,
+    316825: 8022534,
+    317471: 8020184,
+    318478: 8013766,
+    318565: 6001232,
+    318734: 8015443,
+    318835: 8018002,
+    318903: 8015637,
+    319319: 8018183,
+    319345: 6001115,
+    319390: 8000987,
+    320013: 7000482,
+    320045: 7000790,
+    322161: 8009423,
+    322465: 8017677,
+    323449: 6001525,
+    323785: 8008070,
+    323817: 8011763,
+    324818: 7000441,
+    325335: 8008929,
+    325622: 8011101,
+    325703: 7001135,
+    325822: 8003340,
+    326337: 8017964,
+    326859: 8013791,
+    326975: 8022017,
+    327795: 8001324,
+    328757: 6001424,
+    329623: 3000119,
+    330395: 8016143,
+    331075: 8022041,
+    331177: 8018339,
+    331298: 7000285,
+    331545: 8005211,
+    331683: 8009748,
+    331731: 8024196,
+    333355: 8018158,
+    333925: 7000976,
+    335405: 7000296,
+    335559: 8007564,
+    335699: 8020196,
+    336091: 3000074,
+    336743: 2000108,
+    336774: 8002352,
+    336973: 7000800,
+    337502: 8009411,
+    337535: 8012113,
+    338169: 8015949,
+    338675: 8022365,
+    338997: 6001077,
+    339031: 8020028,
+    339521: 7001300,
+    340442: 8013597,
+    340535: 6001219,
+    341341: 8018014,
+    341446: 6000636,
+    341734: 8009723,
+    341887: 7001114,
+    342309: 8017639,
+    343077: 8005536,
+    343915: 8015662,
+    344379: 8009254,
+    344729: 6001374,
+    344810: 8006733,
+    345477: 8011607,
+    347282: 8011257,
+    347633: 7001293,
+    347967: 7000147,
+    348725: 8022185,
+    348843: 7000453,
+    349095: 8003352,
+    349401: 8013622,
+    349525: 8022004,
+    349809: 6000934,
+    350727: 8009904,
+    350987: 8020352,
+    351538: 8007552,
+    351785: 8009760,
+    352869: 8013466,
+    353379: 8015468,
+    353717: 6001244,
+    354609: 7000481,
+    355570: 8004705,
+    355946: 8011582,
+    356345: 8017989,
+    356421: 8015624,
+    356915: 8014128,
+    357309: 7000315,
+    357425: 7000643,
+    359414: 8005524,
+    359513: 8020340,
+    360778: 8009242,
+    360789: 8007889,
+    361361: 8012281,
+    361491: 8015780,
+    361675: 8022197,
+    362674: 8015599,
+    363562: 6001039,
+    364021: 8020520,
+    364154: 8003171,
+    364994: 8007058,
+    365585: 8013972,
+    365835: 6000648,
+    366415: 8011619,
+    367114: 8017601,
+    368039: 6001537,
+    369265: 8016130,
+    369303: 8011438,
+    369985: 8005873,
+    370025: 7000975,
+    370139: 8018326,
+    371665: 8019796,
+    371722: 8007708,
+    372775: 8022172,
+    373182: 8000324,
+    373737: 8003508,
+    374255: 8013478,
+    375193: 8020183,
+    375683: 8019859,
+    376475: 7000307,
+    377245: 6000959,
+    377377: 8015999,
+    378235: 8010085,
+    378301: 6001127,
+    378879: 8013934,
+    378917: 8020015,
+    380494: 8011413,
+    380545: 8017833,
+    381095: 8015493,
+    381938: 7000753,
+    381951: 7000314,
+    381997: 6001361,
+    382075: 8022353,
+    382109: 8016311,
+    382655: 8007901,
+    383439: 8005367,
+    383525: 7000809,
+    384307: 8020171,
+    384659: 3000110,
+    384826: 8011088,
+    385526: 8013753,
+    386425: 8022016,
+    386630: 8000818,
+    387686: 8015586,
+    388311: 8001480,
+    388531: 7001292,
+    389499: 8017795,
+    390165: 8003183,
+    390166: 8005030,
+    390963: 2000076,
+    391017: 8013297,
+    391065: 8007070,
+    391534: 8003496,
+    391685: 8011450,
+    391989: 8009735,
+    393421: 6001536,
+    394010: 8004536,
+    394953: 8015455,
+    395937: 8024183,
+    397010: 8002846,
+    397822: 6000896,
+    397969: 6001411,
+    398866: 8009398,
+    398905: 8012100,
+    399475: 7000642,
+    400078: 8001143,
+    400673: 8020027,
+    400775: 8022028,
+    401511: 6000791,
+    401698: 8005355,
+    401882: 8015430,
+    402866: 6001026,
+    403403: 8015830,
+    403535: 8018145,
+    404225: 8022196,
+    406203: 8007395,
+    406334: 8013428,
+    406445: 6001206,
+    406802: 7000116,
+    406847: 7000966,
+    407407: 8017845,
+    407827: 6001524,
+    408291: 8011594,
+    408425: 7000474,
+    409975: 7000808,
+    410669: 7001134,
+    410839: 6001269,
+    411033: 8009085,
+    411845: 7000127,
+    412114: 8013584,
+    412269: 8005692,
+    413075: 8022003,
+    413526: 6000155,
+    413678: 6000766,
+    414715: 8013309,
+    415454: 8007539,
+    416361: 8017782,
+    416585: 8015974,
+    417027: 8013453,
+    417074: 6000467,
+    417175: 8021991,
+    417571: 8018170,
+    417605: 2000088,
+    418035: 8005042,
+    419881: 8019846,
+    421685: 8017664,
+    422807: 8014140,
+    423243: 8024182,
+    423453: 8011750,
+    424390: 8002677,
+    424589: 2000107,
+    424762: 8005511,
+    424879: 8020339,
+    425258: 6000883,
+    425315: 8017820,
+    425546: 8007383,
+    425845: 6000803,
+    426374: 8009229,
+    426387: 7000609,
+    427025: 8022352,
+    427063: 7000945,
+    427431: 6001064,
+    428655: 8001155,
+    429598: 8015417,
+    429913: 6001423,
+    430606: 8009073,
+    431365: 8017976,
+    431457: 8015611,
+    431607: 8017626,
+    432055: 8013959,
+    435638: 8006889,
+    435953: 6001523,
+    436449: 8011425,
+    437255: 8005704,
+    438741: 7000146,
+    438991: 7001133,
+    440657: 7000799,
+    440781: 8011269,
+    440818: 8003002,
+    443989: 8019858,
+    444925: 7000306,
+    445315: 8015805,
+    445835: 6000946,
+    445991: 6001231,
+    446369: 8018001,
+    446865: 6000479,
+    447005: 7000777,
+    447083: 6001114,
+    447146: 8000974,
+    447811: 8020014,
+    447925: 8022027,
+    448063: 7000789,
+    450262: 8013259,
+    450385: 6001193,
+    451451: 8017676,
+    453299: 7000632,
+    453871: 2000106,
+    454138: 8011244,
+    454181: 8020170,
+    454597: 7001125,
+    455469: 8008916,
+    455793: 8015767,
+    455877: 3000024,
+    456025: 8022184,
+    456475: 7000473,
+    456665: 8011775,
+    456909: 6001051,
+    458643: 7000765,
+    458689: 8020002,
+    458913: 8001311,
+    458983: 8020351,
+    459173: 6001256,
+    460955: 8013803,
+    461373: 8017613,
+    462111: 8013284,
+    462275: 7000138,
+    462346: 6000753,
+    462553: 8016142,
+    462722: 7000272,
+    464163: 8005198,
+    465595: 8015961,
+    466697: 8018157,
+    466735: 6001089,
+    466755: 8006901,
+    467495: 8011281,
+    468999: 7000145,
+    469567: 3000118,
+    470327: 7001291,
+    471295: 8017651,
+    471801: 8007720,
+    472305: 8003014,
+    472549: 8012112,
+    473271: 6000908,
+    474513: 6000778,
+    474734: 8005342,
+    476749: 6001218,
+    477158: 8008904,
+    477717: 8013765,
+    478101: 8015442,
+    479085: 8000986,
+    480491: 3000109,
+    480766: 8001299,
+    481481: 8015661,
+    481574: 8011556,
+    482734: 8006720,
+    483575: 7000641,
+    484561: 8020158,
+    485537: 2000097,
+    486098: 7000597,
+    486266: 8005186,
+    487227: 7000440,
+    487475: 8022171,
+    487490: 8000649,
+    488433: 8011100,
+    488733: 8003339,
+    489325: 7000807,
+    490637: 8020182,
+    491878: 8013415,
+    492499: 7000798,
+    492745: 8013634,
+    493025: 8021990,
+    494615: 8009916,
+    496223: 8019845,
+    496947: 7000284,
+    497705: 8015792,
+    497798: 8004692,
+    498883: 8017988,
+    499681: 8014127,
+    500395: 8007732,
+    501787: 6001398,
+    502918: 8007370,
+    503234: 8011075,
+    505161: 7000312,
+    505325: 8022015,
+    506253: 8009410,
+    506530: 6000311,
+    507566: 6000870,
+    508079: 8018506,
+    508277: 8019833,
+    508805: 7000621,
+    508898: 8009060,
+    509675: 8022183,
+    510663: 8013596,
+    511819: 8013971,
+    512006: 8003327,
+    512169: 6000635,
+    512601: 8009722,
+    512746: 8015404,
+    512981: 7000965,
+    514786: 8011387,
+    514855: 8017807,
+    516925: 8022351,
+    516971: 8016129,
+    517215: 8006732,
+    517979: 7000463,
+    518035: 8011112,
+    519622: 8013571,
+    520331: 6001522,
+    520421: 6001410,
+    520923: 8011256,
+    521110: 8000480,
+    521594: 8009385,
+    521645: 7000933,
+    523957: 7001132,
+    527065: 8003676,
+    527307: 8007551,
+    528143: 6000958,
+    529529: 8010084,
+    531505: 8015636,
+    532763: 8017832,
+    533355: 8004704,
+    533533: 8015492,
+    533919: 8011581,
+    535717: 7000631,
+    536393: 6001385,
+    536558: 6000623,
+    536935: 8009422,
+    537251: 7001113,
+    539121: 8005523,
+    539695: 8011762,
+    540175: 8022002,
+    541167: 8009241,
+    541282: 8000805,
+    541717: 2000105,
+    542087: 8020001,
+    542225: 7000806,
+    542659: 2000096,
+    543286: 8007526,
+    543895: 8017963,
+    544011: 8015598,
+    544765: 8013790,
+    544825: 8022170,
+    545054: 8013246,
+    545343: 6001038,
+    546231: 8003170,
+    546325: 7000137,
+    547491: 8007057,
+    548359: 7000964,
+    550671: 8017600,
+    551614: 8004523,
+    552575: 7000472,
+    552805: 8009747,
+    555458: 7000428,
+    555611: 8020338,
+    555814: 8002833,
+    555841: 6001243,
+    557566: 8009216,
+    557583: 8007707,
+    558467: 8012099,
+    559265: 8007563,
+    559682: 2000064,
+    559773: 7000144,
+    561290: 8002339,
+    562438: 6000857,
+    563615: 8015948,
+    563914: 8008891,
+    564775: 8022014,
+    564949: 8018144,
+    564995: 6001076,
+    567853: 7000956,
+    568178: 7000103,
+    569023: 6001205,
+    570515: 8017638,
+    570741: 8011412,
+    571795: 8005535,
+    572242: 8003158,
+    572663: 8020157,
+    572907: 7000752,
+    573562: 8007045,
+    573965: 8009253,
+    574678: 8005173,
+    575795: 8011606,
+    576583: 3000117,
+    577239: 8011087,
+    578289: 8013752,
+    578347: 8019989,
+    579945: 8000817,
+    580601: 7001131,
+    581405: 7000452,
+    581529: 8015585,
+    581647: 6001409,
+    581825: 7000305,
+    582335: 8013621,
+    582958: 8009372,
+    583015: 6000933,
+    583219: 8015973,
+    584545: 8009903,
+    584647: 2000087,
+    585249: 8005029,
+    585599: 8020013,
+    587301: 8003495,
+    588115: 8013465,
+    588965: 8015467,
+    590359: 8017663,
+    591015: 8004535,
+    593021: 7001290,
+    593929: 8020169,
+    594035: 8015623,
+    594146: 8002664,
+    594473: 3000086,
+    595441: 8017819,
+    595515: 8002845,
+    596183: 3000061,
+    596733: 6000895,
+    598299: 8009397,
+    600117: 8001142,
+    600281: 2000104,
+    600457: 8016310,
+    600691: 8019832,
+    601315: 8007888,
+    602485: 8015779,
+    602547: 8005354,
+    602823: 8015429,
+    603725: 8022001,
+    603911: 8017975,
+    604299: 6001025,
+    604877: 8013958,
+    605098: 8003314,
+    607202: 7000584,
+    609501: 8013427,
+    609725: 3000049,
+    610203: 7000115,
+    612157: 7000462,
+    613118: 8005017,
+    614422: 8011218,
+    615043: 8018337,
+    615505: 8011437,
+    616975: 8022182,
+    618171: 8013583,
+    618233: 8019976,
+    620194: 8013402,
+    620289: 3000011,
+    620517: 6000765,
+    620806: 8005329,
+    620977: 8020337,
+    621970: 8000311,
+    622895: 8003507,
+    623162: 8009203,
+    623181: 8007538,
+    623441: 8015804,
+    624169: 6000945,
+    625611: 6000466,
+    625807: 7000776,
+    628694: 8001130,
+    630539: 6001192,
+    631465: 8013933,
+    633919: 7001289,
+    634114: 6000610,
+    634933: 3000097,
+    636585: 8002676,
+    637143: 8005510,
+    637887: 6000882,
+    638319: 8007382,
+    639065: 8005366,
+    639331: 8011774,
+    639561: 8009228,
+    640211: 6001372,
+    640871: 8019820,
+    644397: 8015416,
+    644725: 8021989,
+    645337: 8013802,
+    645909: 8009072,
+    647185: 8001479,
+    648907: 8019844,
+    649078: 8011374,
+    649165: 8017794,
+    650275: 7000304,
+    651605: 2000075,
+    651695: 8013296,
+    651775: 7000639,
+    651833: 8015960,
+    653315: 8009734,
+    653429: 6001088,
+    653457: 8006888,
+    654493: 7000963,
+    655402: 6000454,
+    656183: 6001397,
+    656903: 2000095,
+    657662: 8007357,
+    658255: 8015454,
+    659525: 8022169,
+    659813: 8017650,
+    661227: 8003001,
+    662966: 8013389,
+    663803: 8020168,
+    664411: 7001123,
+    665482: 8009047,
+    669185: 6000790,
+    670719: 8000973,
+    671099: 7000944,
+    675393: 8013258,
+    676286: 8003145,
+    677005: 8007394,
+    677846: 8007032,
+    680485: 8011593,
+    680846: 8011049,
+    681207: 8011243,
+    682486: 8000636,
+    683501: 8019988,
+    683675: 8022013,
+    684574: 8006876,
+    685055: 8009084,
+    685069: 8019807,
+    687115: 8005691,
+    687242: 8013233,
+    687401: 8018324,
+    689210: 6000142,
+    689843: 8013633,
+    692461: 8009915,
+    692714: 8002989,
+    693519: 6000752,
+    693842: 7000415,
+    693935: 8017781,
+    694083: 7000271,
+    695045: 8013452,
+    696725: 7000471,
+    696787: 8015791,
+    700553: 7000630,
+    700843: 6001230,
+    701437: 6001384,
+    702559: 6001113,
+    702658: 8000961,
+    704099: 3000108,
+    705686: 6000727,
+    705755: 8011749,
+    708883: 8020000,
+    709142: 6000298,
+    709423: 6001359,
+    709631: 6001254,
+    710645: 7000608,
+    712101: 8005341,
+    712327: 7000620,
+    712385: 6001063,
+    714425: 7000136,
+    715737: 8008903,
+    719095: 8015610,
+    719345: 8017625,
+    720575: 8021988,
+    720797: 8017806,
+    721149: 8001298,
+    722361: 8011555,
+    724101: 8006719,
+    724594: 8005004,
+    725249: 7000962,
+    726869: 8016141,
+    727415: 8011424,
+    729147: 7000596,
+    729399: 8005185,
+    729554: 8000467,
+    730303: 7000932,
+    730639: 8019975,
+    730825: 8022000,
+    731235: 8000648,
+    733381: 6001396,
+    734635: 8011268,
+    734638: 8013220,
+    735034: 8007344,
+    737426: 8008878,
+    737817: 8013414,
+    737891: 7000294,
+    742577: 7000955,
+    743002: 8001117,
+    743774: 8009034,
+    744107: 8015635,
+    744775: 3000036,
+    746697: 8004691,
+    748867: 8020156,
+    749177: 6001217,
+    751502: 8005160,
+    751709: 7000796,
+    754354: 6000714,
+    754377: 8007369,
+    754851: 8011074,
+    755573: 8011761,
+    756613: 7001288,
+    757393: 8019819,
+    758582: 8006707,
+    759115: 8008915,
+    759655: 8015766,
+    759795: 6000310,
+    761349: 6000869,
+    761453: 8017962,
+    761515: 6001050,
+    762671: 8013789,
+    763347: 8009059,
+    764405: 7000764,
+    764855: 8001310,
+    768009: 8003326,
+    768955: 8017612,
+    769119: 8015403,
+    770185: 8013283,
+    772179: 8011386,
+    773605: 8005197,
+    773927: 8009746,
+    774566: 6000441,
+    774706: 8011205,
+    775489: 8018168,
+    777925: 7000638,
+    779433: 8013570,
+    781665: 8000479,
+    782254: 8004679,
+    782391: 8009384,
+    782971: 7000629,
+    783959: 6001383,
+    785213: 8014126,
+    785519: 8019831,
+    785806: 8002326,
+    786335: 8007719,
+    787175: 7000303,
+    788785: 6000907,
+    789061: 8015947,
+    790855: 6000777,
+    790993: 6001075,
+    791282: 7000259,
+    792281: 8019999,
+    793117: 3000096,
+    796195: 8013764,
+    796835: 8015441,
+    798475: 7000135,
+    798721: 8017637,
+    800513: 7000461,
+    803551: 7000795,
+    804287: 7001122,
+    804837: 6000622,
+    806113: 8011605,
+    809042: 8006863,
+    809627: 8019806,
+    811923: 8000804,
+    812045: 7000439,
+    812383: 8016128,
+    813967: 7000451,
+    814055: 8011099,
+    814555: 8003338,
+    814929: 8007525,
+    815269: 8013620,
+    816221: 6000932,
+    817581: 8013245,
+    817663: 8019794,
+    818363: 8009902,
+    818662: 8002976,
+    823361: 8013464,
+    824182: 8008865,
+    824551: 8015466,
+    827421: 8004522,
+    828134: 8011192,
+    828245: 7000283,
+    828269: 2000094,
+    828971: 8017999,
+    829226: 6000597,
+    829939: 3000073,
+    830297: 3000085,
+    830414: 8000948,
+    831575: 8022168,
+    831649: 8015622,
+    832117: 7000787,
+    833187: 7000427,
+    833721: 8002832,
+    836349: 8009215,
+    836969: 8020155,
+    837199: 6001371,
+    838409: 7001287,
+    839523: 2000063,
+    839914: 8005147,
+    841841: 8007887,
+    841935: 8002338,
+    843479: 8015778,
+    843657: 6000856,
+    843755: 8009409,
+    845871: 8008890,
+    850586: 8000792,
+    851105: 8013595,
+    852267: 7000102,
+    853615: 6000634,
+    854335: 8009721,
+    858363: 8003157,
+    858458: 8011036,
+    859027: 6001241,
+    860343: 8007044,
+    861707: 8011436,
+    862017: 8005172,
+    862025: 7000637,
+    866723: 8018155,
+    866822: 8004510,
+    868205: 8011255,
+    870758: 8000298,
+    872053: 7000293,
+    872275: 8021987,
+    873422: 8002820,
+    874437: 8009371,
+    876826: 8013207,
+    877591: 8012098,
+    877933: 8019830,
+    878845: 8007550,
+    884051: 8013932,
+    884374: 8003132,
+    885391: 2000093,
+    886414: 8007019,
+    887777: 6001395,
+    888925: 7000469,
+    889778: 7000571,
+    889865: 8011580,
+    891219: 8002663,
+    893809: 8019987,
+    894179: 6001204,
+    894691: 7000460,
+    896506: 8006694,
+    898535: 8005522,
+    898909: 8018323,
+    900358: 6000701,
+    901945: 8009240,
+    906059: 7000125,
+    906685: 8015597,
+    907647: 8003313,
+    908831: 8017793,
+    908905: 6001037,
+    910385: 8003169,
+    910803: 7000583,
+    912247: 2000074,
+    912373: 8013295,
+    912485: 8007056,
+    914641: 8009733,
+    916487: 8015972,
+    917662: 8011023,
+    917785: 8017599,
+    918731: 2000086,
+    919677: 8005016,
+    921475: 8021999,
+    921557: 8015453,
+    921633: 8011217,
+    924482: 8004666,
+    926497: 8017986,
+    926782: 6000584,
+    927707: 6001358,
+    927979: 7001110,
+    929305: 8007706,
+    930291: 8013401,
+    931209: 8005328,
+    932955: 8000310,
+    933658: 8002651,
+    934743: 8009202,
+    935693: 6001370,
+    936859: 6000789,
+    943041: 8001129,
+    947546: 8004991,
+    947807: 7000628,
+    949003: 6001382,
+    950521: 8013957,
+    951142: 8009177,
+    951171: 6000609,
+    951235: 8011411,
+    952679: 8011592,
+    954845: 7000751,
+    955451: 8019974,
+    959077: 7000794,
+    960089: 6001240,
+    961961: 8005690,
+    962065: 8011086,
+    963815: 8013751,
+    964894: 6000129,
+    966329: 8019793,
+    966575: 7000134,
+    969215: 8015584,
+    971509: 8017780,
+    971618: 7000090,
+    973063: 8013451,
+    973617: 8011373,
+    975415: 8005028,
+    978835: 8003494,
+    979693: 8015803,
+    980837: 6000944,
+    983103: 6000453,
+    983411: 7000775,
+    985025: 7000468,
+    986493: 8007356,
+    988057: 8011748,
+    988418: 7000246,
+    989417: 8017830,
+    990437: 8019818,
+    990698: 8007006,
+    990847: 6001191,
+    992525: 7000302,
+    994449: 8013388,
+    994555: 6000894,
+    994903: 7000607,
+    997165: 8009396,
+    997339: 6001062,
+    997694: 6000688,
+    998223: 8009046,
+    998963: 8019986,
+    1000195: 8001141,
+    1004245: 8005353,
+    1004663: 7000953,
+    1004705: 8015428,
+    1005238: 8000779,
+    1006733: 8015609,
+    1007083: 8017624,
+    1007165: 6001024,
+    1012894: 6000428,
+    1013173: 8020154,
+    1014101: 7001121,
+    1014429: 8003144,
+    1015835: 8013426,
+    1016738: 7000402,
+    1016769: 8007031,
+    1017005: 7000114,
+    1018381: 8011423,
+    1021269: 8011048,
+    1023729: 8000635,
+    1024309: 8015959,
+    1024426: 8004497,
+    1026817: 6001087,
+    1026861: 8006875,
+    1028489: 8011267,
+    1030285: 8013582,
+    1030863: 8013232,
+    1032226: 8002807,
+    1033815: 6000141,
+    1034195: 6000764,
+    1036849: 6001357,
+    1037153: 7000942,
+    1038635: 8007537,
+    1039071: 8002988,
+    1040763: 7000414,
+    1042685: 6000465,
+    1049191: 8018142,
+    1053987: 8000960,
+    1056757: 2000092,
+    1057978: 8006850,
+    1058529: 6000726,
+    1058743: 8019805,
+    1059022: 8004978,
+    1060975: 7000301,
+    1061905: 8005509,
+    1062761: 7000793,
+    1063145: 6000881,
+    1063517: 8015765,
+    1063713: 6000297,
+    1063865: 8007381,
+    1065935: 8009227,
+    1066121: 6001049,
+    1067857: 8019973,
+    1070167: 7000763,
+    1070558: 8002963,
+    1070797: 7000124,
+    1072478: 8000623,
+    1073995: 8015415,
+    1076515: 8009071,
+    1076537: 8017611,
+    1078259: 8013282,
+    1083047: 7000459,
+    1083121: 6001228,
+    1084039: 7001120,
+    1085773: 2000085,
+    1085926: 8000935,
+    1086891: 8005003,
+    1088153: 7000786,
+    1089095: 8006887,
+    1094331: 8000466,
+    1094951: 8015790,
+    1095274: 8011010,
+    1096381: 8017661,
+    1099825: 8021986,
+    1100869: 8007718,
+    1101957: 8013219,
+    1102045: 8003000,
+    1102551: 8007343,
+    1103414: 8002638,
+    1104299: 6000906,
+    1105819: 8017817,
+    1106139: 8008877,
+    1106959: 8019817,
+    1107197: 6000776,
+    1114366: 6000285,
+    1114503: 8001116,
+    1114673: 8013763,
+    1115569: 8015440,
+    1115661: 8009033,
+    1117865: 8000972,
+    1119371: 3000107,
+    1121549: 8017973,
+    1121894: 6000571,
+    1123343: 7001109,
+    1125655: 8013257,
+    1127253: 8005159,
+    1131531: 6000713,
+    1132058: 6000415,
+    1132681: 6001369,
+    1133407: 8018154,
+    1135234: 8009008,
+    1135345: 8011242,
+    1136863: 7000438,
+    1137873: 8006706,
+    1139677: 8011098,
+    1140377: 7000292,
+    1146442: 8000454,
+    1147619: 7000931,
+    1155865: 6000751,
+    1156805: 7000270,
+    1157819: 6001215,
+    1159171: 3000072,
+    1159543: 7000282,
+    1161849: 6000440,
+    1162059: 8011204,
+    1162213: 3000095,
+    1169311: 8015634,
+    1171001: 2000091,
+    1172354: 8006681,
+    1173381: 8004678,
+    1175675: 8021985,
+    1178709: 8002325,
+    1181257: 8009408,
+    1182446: 8006837,
+    1183301: 8019804,
+    1186835: 8005340,
+    1186923: 7000258,
+    1187329: 8011760,
+    1191547: 8013594,
+    1192895: 8008902,
+    1195061: 3000048,
+    1196069: 8009720,
+    1196506: 8002950,
+    1196569: 6001381,
+    1198483: 8013788,
+    1199266: 8006993,
+    1201915: 8001297,
+    1203935: 8011554,
+    1206835: 8006718,
+    1208938: 8004653,
+    1209271: 8019985,
+    1210547: 6001227,
+    1211573: 8017985,
+    1213511: 6001086,
+    1213526: 8008995,
+    1213563: 8006862,
+    1213682: 7000077,
+    1215245: 7000595,
+    1215487: 8011254,
+    1215665: 8005184,
+    1216171: 7000785,
+    1218725: 7000133,
+    1225367: 8017648,
+    1227993: 8002975,
+    1229695: 8013413,
+    1230383: 8007549,
+    1234838: 8002313,
+    1236273: 8008864,
+    1239953: 8015946,
+    1242201: 8011191,
+    1242989: 6001074,
+    1243839: 6000596,
+    1244495: 8004690,
+    1245621: 8000947,
+    1245811: 8011579,
+    1255133: 6001356,
+    1255501: 8016126,
+    1257295: 8007368,
+    1257949: 8005521,
+    1257962: 8008839,
+    1258085: 8011073,
+    1259871: 8005146,
+    1262723: 8009239,
+    1263661: 8019792,
+    1266325: 3000023,
+    1266749: 7000952,
+    1267474: 8000610,
+    1268915: 6000868,
+    1269359: 8015596,
+    1272245: 8009058,
+    1272467: 6001036,
+    1274539: 7000291,
+    1275879: 8000791,
+    1277479: 7000626,
+    1279091: 3000106,
+    1280015: 8003325,
+    1281137: 8013619,
+    1281865: 8015402,
+    1281974: 8004965,
+    1282633: 6000931,
+    1284899: 8017598,
+    1285999: 8009901,
+    1286965: 8011385,
+    1287687: 8011035,
+    1292669: 8019972,
+    1293853: 7001119,
+    1294033: 6001214,
+    1295723: 8015465,
+    1299055: 8013569,
+    1300233: 8004509,
+    1301027: 8007705,
+    1302775: 7000132,
+    1303985: 8009383,
+    1306137: 8000297,
+    1306877: 8015621,
+    1310133: 8002819,
+    1310278: 8006668,
+    1314542: 8000766,
+    1315239: 8013206,
+    1316978: 6000272,
+    1322893: 7000618,
+    1325467: 8015777,
+    1326561: 8003131,
+    1329621: 8007018,
+    1331729: 8011410,
+    1334667: 7000570,
+    1336783: 7000750,
+    1338623: 8017804,
+    1339634: 8004484,
+    1340003: 8019816,
+    1341395: 6000621,
+    1344718: 8008826,
+    1344759: 8006693,
+    1346891: 8011085,
+    1349341: 8013750,
+    1349834: 8002794,
+    1350537: 6000700,
+    1351166: 8004640,
+    1353205: 8000803,
+    1354111: 7000951,
+    1354886: 8000441,
+    1356277: 7000930,
+    1356901: 8015583,
+    1358215: 8007524,
+    1362635: 8013244,
+    1365581: 7000458,
+    1368334: 8000285,
+    1370369: 8003493,
+    1370386: 6000402,
+    1372019: 8018141,
+    1376493: 8011022,
+    1379035: 8004521,
+    1381913: 6001202,
+    1386723: 8004665,
+    1388645: 7000426,
+    1389223: 8013931,
+    1389535: 8002831,
+    1390173: 6000583,
+    1392377: 6000893,
+    1393915: 8009214,
+    1396031: 8009395,
+    1399205: 2000062,
+    1400273: 7000123,
+    1400487: 8002650,
+    1403207: 7000940,
+    1403225: 7000299,
+    1405943: 8005352,
+    1406095: 6000855,
+    1406587: 8015427,
+    1409785: 8008889,
+    1410031: 6001023,
+    1412327: 8019791,
+    1414127: 8017960,
+    1414562: 2000051,
+    1416389: 7001108,
+    1420445: 7000101,
+    1421319: 8004990,
+    1422169: 8013425,
+    1423807: 7000113,
+    1426713: 8009176,
+    1428163: 6001368,
+    1430605: 8003156,
+    1431382: 8006824,
+    1432417: 8019803,
+    1433531: 2000073,
+    1433729: 7001118,
+    1433905: 8007043,
+    1436695: 8005171,
+    1437293: 8009732,
+    1442399: 8013581,
+    1442926: 8002625,
+    1446071: 8017816,
+    1447341: 6000128,
+    1447873: 6000763,
+    1448161: 8015452,
+    1448402: 7000233,
+    1454089: 8007536,
+    1457395: 8009370,
+    1457427: 7000089,
+    1459354: 8002300,
+    1459759: 3000035,
+    1465399: 6001226,
+    1466641: 8017972,
+    1468987: 6001073,
+    1469194: 8000753,
+    1472207: 3000060,
+    1482627: 7000245,
+    1483339: 8017635,
+    1485365: 8002662,
+    1486047: 8007005,
+    1486667: 8005508,
+    1488403: 6000880,
+    1489411: 8007380,
+    1492309: 8009226,
+    1496541: 6000687,
+    1497067: 8011591,
+    1497238: 8004471,
+    1503593: 8015414,
+    1507121: 8009070,
+    1507857: 8000778,
+    1508638: 8002781,
+    1511653: 7000449,
+    1512118: 6000545,
+    1512745: 8003312,
+    1514071: 7001107,
+    1515839: 6000930,
+    1516262: 6000116,
+    1518005: 7000582,
+    1519341: 6000427,
+    1519817: 7000773,
+    1524733: 7000625,
+    1525107: 7000401,
+    1526657: 6001367,
+    1529099: 8013450,
+    1531309: 6001189,
+    1532795: 8005015,
+    1533433: 8018140,
+    1536055: 8011216,
+    1536639: 8004496,
+    1542863: 7000290,
+    1544491: 6001201,
+    1548339: 8002806,
+    1550485: 8013400,
+    1552015: 8005327,
+    1552661: 8011747,
+    1554925: 7000131,
+    1557905: 8009201,
+    1563419: 7000606,
+    1565011: 7000122,
+    1566461: 6001213,
+    1567247: 6001061,
+    1571735: 8001128,
+    1575917: 8013256,
+    1582009: 8015608,
+    1582559: 6001355,
+    1583023: 8015957,
+    1585285: 6000608,
+    1586126: 8006655,
+    1586899: 2000083,
+    1586967: 8006849,
+    1588533: 8004977,
+    1589483: 8011241,
+    1600313: 8011422,
+    1602403: 8017647,
+    1604986: 8008813,
+    1605837: 8002962,
+    1608717: 8000622,
+    1612682: 8002612,
+    1616197: 7000950,
+    1616402: 7000389,
+    1617122: 8000272,
+    1618211: 6000750,
+    1619527: 7000269,
+    1622695: 8011372,
+    1628889: 8000934,
+    1629887: 8019971,
+    1635622: 8004627,
+    1638505: 6000452,
+    1639187: 8017971,
+    1641809: 8013930,
+    1642911: 8011009,
+    1644155: 8007355,
+    1655121: 8002637,
+    1657415: 8013387,
+    1657466: 8000597,
+    1661569: 8005339,
+    1663705: 8009045,
+    1670053: 8008901,
+    1671241: 8015764,
+    1671549: 6000284,
+    1675333: 6001048,
+    1681691: 7000762,
+    1682681: 8001296,
+    1682841: 6000570,
+    1685509: 8011553,
+    1687829: 8017791,
+    1689569: 7000624,
+    1690715: 8003143,
+    1691701: 6001354,
+    1692197: 8015788,
+    1694173: 2000072,
+    1694407: 8013281,
+    1694615: 8007030,
+    1698087: 6000414,
+    1698619: 7000772,
+    1701343: 7000594,
+    1701931: 8005183,
+    1702115: 8011047,
+    1702851: 8009007,
+    1706215: 8000634,
+    1709659: 8019790,
+    1711435: 8006874,
+    1711463: 6001188,
+    1718105: 8013231,
+    1719663: 8000453,
+    1721573: 8013412,
+    1722202: 6000259,
+    1723025: 3000010,
+    1727878: 6000389,
+    1729937: 7000617,
+    1731785: 8002987,
+    1734605: 7000413,
+    1735327: 6000905,
+    1739881: 6000775,
+    1742293: 7000456,
+    1750507: 8017803,
+    1751629: 8013762,
+    1753037: 8015439,
+    1756645: 8000959,
+    1758531: 8006680,
+    1760213: 8007367,
+    1761319: 8011072,
+    1764215: 6000725,
+    1769261: 7000939,
+    1771774: 8000428,
+    1772855: 6000296,
+    1773593: 3000083,
+    1773669: 8006836,
+    1776481: 6000867,
+    1778498: 7000064,
+    1781143: 8009057,
+    1786499: 7000437,
+    1790921: 7000949,
+    1791946: 6000103,
+    1792021: 8003324,
+    1794611: 8015401,
+    1794759: 8002949,
+    1798899: 8006992,
+    1801751: 8011384,
+    1804231: 8017778,
+    1804786: 6000532,
+    1806091: 8019802,
+    1807117: 7001106,
+    1811485: 8005002,
+    1812446: 8004458,
+    1813407: 8004652,
+    1818677: 8013568,
+    1820289: 8008994,
+    1820523: 7000076,
+    1822139: 3000105,
+    1823885: 8000465,
+    1825579: 8009382,
+    1826246: 8002768,
+    1834963: 8011746,
+    1836595: 8013218,
+    1837585: 8007342,
+    1843565: 8008876,
+    1847042: 2000038,
+    1847677: 3000094,
+    1849243: 8017959,
+    1852201: 6001060,
+    1852257: 8002312,
+    1852462: 8000584,
+    1856261: 7000783,
+    1857505: 8001115,
+    1859435: 8009032,
+    1869647: 6001200,
+    1870297: 8017622,
+    1872431: 8013593,
+    1877953: 6000620,
+    1878755: 8005158,
+    1879537: 8009719,
+    1885885: 6000712,
+    1886943: 8008838,
+    1891279: 7000938,
+    1894487: 7000121,
+    1896455: 8006705,
+    1901211: 8000609,
+    1901501: 8007523,
+    1907689: 8013243,
+    1908386: 8002287,
+    1910051: 8011253,
+    1916291: 8015944,
+    1920983: 2000082,
+    1922961: 8004964,
+    1924814: 6000246,
+    1929254: 8006798,
+    1930649: 7000455,
+    1933459: 7000616,
+    1936415: 6000439,
+    1936765: 8011203,
+    1939751: 8017634,
+    1944103: 7000425,
+    1945349: 7000289,
+    1951481: 8009213,
+    1952194: 8002599,
+    1955635: 8004677,
+    1956449: 8017802,
+    1957703: 8011578,
+    1958887: 2000061,
+    1964515: 8002324,
+    1965417: 8006667,
+    1968533: 6000854,
+    1971813: 8000765,
+    1973699: 8008888,
+    1975103: 6001212,
+    1975467: 6000271,
+    1976777: 7000448,
+    1978205: 7000257,
+    1979939: 6001047,
+    1980218: 8000415,
+    1982251: 3000071,
+    1984279: 7000782,
+    1987453: 7000761,
+    1988623: 7000100,
+    1994707: 8015595,
+    1999283: 8017609,
+    1999591: 6001035,
+    1999898: 6000519,
+    2002481: 7001105,
+    2002847: 8003155,
+    2007467: 8007042,
+    2009451: 8004483,
+    2011373: 8005170,
+    2017077: 8008825,
+    2019127: 6001353,
+    2019719: 8015619,
+    2022605: 8006861,
+    2024751: 8002793,
+    2026749: 8004639,
+    2032329: 8000440,
+    2040353: 8009369,
+    2044471: 8007704,
+    2046655: 8002974,
+    2048449: 8015775,
+    2050841: 6000904,
+    2052501: 8000284,
+    2055579: 6000401,
+    2056223: 3000059,
+    2060455: 8008863,
+    2062306: 8004614,
+    2066801: 8017958,
+    2070107: 8013761,
+    2070335: 8011190,
+    2071771: 6001187,
+    2073065: 6000595,
+    2076035: 8000946,
+    2079511: 7000288,
+    2092717: 8011409,
+    2099785: 8005145,
+    2100659: 7000749,
+    2111317: 3000093,
+    2114698: 8000259,
+    2116543: 8011084,
+    2117843: 8003311,
+    2120393: 8013749,
+    2121843: 2000050,
+    2125207: 7000581,
+    2126465: 8000790,
+    2132273: 8015582,
+    2132902: 8002274,
+    2137822: 8006629,
+    2141737: 8015943,
+    2145913: 8005014,
+    2146145: 8011034,
+    2146981: 6001071,
+    2147073: 8006823,
+    2150477: 8011215,
+    2153437: 7000280,
+    2155657: 8019789,
+    2164389: 8002624,
+    2167055: 8004508,
+    2167957: 8017633,
+    2170679: 8013399,
+    2172603: 7000232,
+    2172821: 8005326,
+    2176895: 8000296,
+    2181067: 8009200,
+    2183555: 8002818,
+    2188021: 6000892,
+    2189031: 8002299,
+    2192065: 8013205,
+    2193763: 8009394,
+    2200429: 8001127,
+    2203791: 8000752,
+    2204534: 6000363,
+    2207161: 8017790,
+    2209339: 7000447,
+    2210351: 8015426,
+    2210935: 8003130,
+    2212873: 8013592,
+    2215457: 2000071,
+    2215763: 6001022,
+    2216035: 8007017,
+    2219399: 6000607,
+    2221271: 8009718,
+    2224445: 7000569,
+    2234837: 8013424,
+    2237411: 3000104,
+    2238067: 8015450,
+    2241265: 8006692,
+    2242454: 8000571,
+    2245857: 8004470,
+    2250895: 6000699,
+    2257333: 7000937,
+    2262957: 8002780,
+    2266627: 8013580,
+    2268177: 6000544,
+    2271773: 8011371,
+    2274393: 6000115,
+    2275229: 6000762,
+    2284997: 8007535,
+    2285258: 8004445,
+    2289443: 8015774,
+    2293907: 6000451,
+    2294155: 8011021,
+    2301817: 8007354,
+    2302658: 7000220,
+    2304323: 8019788,
+    2311205: 8004664,
+    2313649: 8011577,
+    2316955: 6000582,
+    2320381: 8013386,
+    2329187: 8009044,
+    2330038: 6000233,
+    2334145: 8002649,
+    2336191: 8005507,
+    2338919: 6000879,
+    2340503: 7000615,
+    2343314: 6000090,
+    2345057: 8009225,
+    2357381: 6001199,
+    2359379: 8017777,
+    2362789: 8015413,
+    2363153: 6001034,
+    2363486: 8000246,
+    2367001: 8003142,
+    2368333: 7000781,
+    2368865: 8004989,
+    2372461: 8007029,
+    2377855: 8009175,
+    2379189: 8006654,
+    2382961: 8011046,
+    2386241: 8017596,
+    2388701: 7000120,
+    2396009: 8006873,
+    2397106: 8000402,
+    2399567: 7000927,
+    2405347: 8013230,
+    2407479: 8008812,
+    2412235: 6000127,
+    2416193: 7000604,
+    2419023: 8002611,
+    2422109: 2000081,
+    2424499: 8002986,
+    2424603: 7000388,
+    2425683: 8000271,
+    2428447: 7000412,
+    2429045: 7000088,
+    2442862: 6000350,
+    2444923: 8015606,
+    2445773: 8017621,
+    2453433: 8004626,
+    2459303: 8000958,
+    2461462: 8002586,
+    2466827: 8017789,
+    2469901: 6000724,
+    2471045: 7000244,
+    2473211: 8011408,
+    2476441: 8013255,
+    2476745: 8007004,
+    2481997: 3000022,
+    2482597: 7000748,
+    2486199: 8000596,
+    2494235: 6000686,
+    2497759: 8011240,
+    2501369: 7000936,
+    2501917: 8017957,
+    2505919: 8013748,
+    2513095: 8000777,
+    2519959: 6001198,
+    2532235: 6000426,
+    2536079: 8005001,
+    2541845: 7000400,
+    2542903: 6000749,
+    2544971: 7000268,
+    2551594: 8006616,
+    2553439: 7000119,
+    2561065: 8004495,
+    2571233: 8013217,
+    2572619: 8007341,
+    2580565: 8002805,
+    2580991: 8008875,
+    2581934: 8002261,
+    2582827: 8015762,
+    2583303: 6000258,
+    2585843: 6000891,
+    2589151: 2000080,
+    2591817: 6000388,
+    2592629: 7000770,
+    2598977: 3000082,
+    2600507: 8001114,
+    2603209: 8009031,
+    2611037: 8005338,
+    2612233: 6001186,
+    2614447: 8017608,
+    2618629: 6001021,
+    2618998: 6000077,
+    2624369: 7000780,
+    2630257: 8005157,
+    2631218: 7000207,
+    2636953: 8017776,
+    2640239: 6000711,
+    2641171: 8013423,
+    2644213: 7000111,
+    2644945: 8006848,
+    2647555: 8004976,
+    2648657: 8011552,
+    2655037: 8006704,
+    2657661: 8000427,
+    2667747: 7000063,
+    2673539: 7000593,
+    2674463: 7000446,
+    2676395: 8002961,
+    2678741: 8013579,
+    2681195: 8000621,
+    2681869: 6000903,
+    2687919: 6000102,
+    2688907: 6000761,
+    2700451: 7000603,
+    2705329: 8013411,
+    2707063: 6001058,
+    2707179: 6000531,
+    2709239: 8015437,
+    2710981: 6000438,
+    2711471: 8011202,
+    2714815: 8000933,
+    2718669: 8004457,
+    2732561: 8015605,
+    2733511: 8017620,
+    2737889: 8004676,
+    2738185: 8011008,
+    2739369: 8002767,
+    2750321: 7000286,
+    2758535: 8002636,
+    2760953: 7000435,
+    2764177: 6000878,
+    2766049: 8007366,
+    2767787: 8011071,
+    2769487: 7000256,
+    2770563: 2000037,
+    2771431: 7000769,
+    2778693: 8000583,
+    2785915: 6000283,
+    2791613: 6000866,
+    2792387: 6001185,
+    2798939: 8009056,
+    2804735: 6000569,
+    2816033: 7000279,
+    2820103: 8015400,
+    2827442: 7000051,
+    2830145: 6000413,
+    2831323: 8011383,
+    2831647: 8006860,
+    2838085: 8009006,
+    2857921: 8013567,
+    2861062: 8000233,
+    2862579: 8002286,
+    2865317: 8002973,
+    2866105: 8000452,
+    2868767: 8009381,
+    2884637: 8008862,
+    2886689: 8015761,
+    2887221: 6000245,
+    2893757: 6001045,
+    2893881: 8006797,
+    2898469: 8011189,
+    2902291: 6000594,
+    2904739: 7000759,
+    2906449: 8000945,
+    2915674: 8004419,
+    2922029: 8017607,
+    2926703: 8013254,
+    2928291: 8002598,
+    2930885: 8006679,
+    2937874: 6000220,
+    2939699: 8005144,
+    2951069: 3000047,
+    2951897: 8011239,
+    2956115: 8006835,
+    2970327: 8000414,
+    2977051: 8000789,
+    2986159: 8017788,
+    2988073: 8007522,
+    2991265: 8002948,
+    2997383: 2000069,
+    2997797: 8013242,
+    2998165: 8006991,
+    2999847: 6000518,
+    3004603: 8011033,
+    3005249: 6000748,
+    3007693: 3000092,
+    3022345: 8004651,
+    3022438: 8000389,
+    3025541: 7000926,
+    3027973: 8015436,
+    3033815: 8008993,
+    3033877: 8004507,
+    3034205: 7000075,
+    3047653: 7000118,
+    3055019: 7000424,
+    3056977: 8002817,
+    3066613: 8009212,
+    3068891: 8013204,
+    3078251: 2000060,
+    3082729: 8015593,
+    3085771: 7000434,
+    3087095: 8002311,
+    3090277: 2000079,
+    3093409: 6000853,
+    3093459: 8004613,
+    3095309: 8003129,
+    3101527: 8008887,
+    3102449: 8007016,
+    3114223: 7000568,
+    3120469: 8017595,
+    3124979: 7000099,
+    3130231: 8011551,
+    3137771: 8006691,
+    3140486: 6000207,
+    3144905: 8008837,
+    3147331: 7000278,
+    3151253: 6000698,
+    3154591: 7000613,
+    3159637: 7000592,
+    3160729: 8005169,
+    3168685: 8000608,
+    3170366: 6000064,
+    3172047: 8000258,
+    3192101: 8017775,
+    3197207: 8013410,
+    3199353: 8002273,
+    3204935: 8004963,
+    3206269: 8009368,
+    3206733: 8006628,
+    3211817: 8011020,
+    3230882: 7000038,
+    3234199: 7000925,
+    3235687: 8004663,
+    3243737: 6000581,
+    3246473: 7000747,
+    3255482: 8002248,
+    3267803: 8002648,
+    3268967: 7000602,
+    3271021: 8011070,
+    3275695: 8006666,
+    3276971: 6001057,
+    3286355: 8000764,
+    3292445: 6000270,
+    3295331: 8015580,
+    3299179: 6000865,
+    3306801: 6000362,
+    3307837: 7000768,
+    3308987: 8017619,
+    3316411: 8004988,
+    3328039: 8003310,
+    3328997: 8009174,
+    3332849: 6001184,
+    3339611: 7000580,
+    3346109: 8011382,
+    3349085: 8004482,
+    3361795: 8008824,
+    3363681: 8000570,
+    3372149: 7000445,
+    3374585: 8002792,
+    3377129: 3000009,
+    3377543: 8013566,
+    3377915: 8004638,
+    3379321: 8011214,
+    3381487: 6000890,
+    3387215: 8000439,
+    3390361: 8009380,
+    3400663: 7000087,
+    3411067: 8013398,
+    3414433: 8005325,
+    3415997: 8015424,
+    3420835: 8000283,
+    3424361: 2000078,
+    3425965: 6000400,
+    3427391: 8009199,
+    3427887: 8004444,
+    3445403: 8015592,
+    3453839: 6001032,
+    3453987: 7000219,
+    3457817: 7000110,
+    3459463: 7000243,
+    3467443: 8007003,
+    3479998: 8002235,
+    3487583: 8017594,
+    3487627: 6000606,
+    3491929: 6000685,
+    3494413: 8015760,
+    3495057: 6000232,
+    3502969: 6001044,
+    3514971: 6000089,
+    3516263: 3000058,
+    3518333: 8000776,
+    3531359: 8007521,
+    3536405: 2000049,
+    3537193: 8017606,
+    3542851: 8013241,
+    3545129: 6000425,
+    3545229: 8000245,
+    3558583: 7000399,
+    3569929: 8011370,
+    3578455: 8006822,
+    3585491: 8004494,
+    3595659: 8000401,
+    3604711: 3000034,
+    3607315: 8002623,
+    3607426: 8000220,
+    3610477: 7000423,
+    3612791: 8002804,
+    3614693: 6000877,
+    3617141: 8007353,
+    3621005: 7000231,
+    3624179: 8009211,
+    3628411: 3000069,
+    3637933: 2000059,
+    3646313: 8013385,
+    3648385: 8002298,
+    3651583: 8015411,
+    3655847: 6000852,
+    3660151: 8009043,
+    3662497: 8013746,
+    3664293: 6000349,
+    3665441: 7000767,
+    3672985: 8000751,
+    3683017: 8015579,
+    3692193: 8002585,
+    3693157: 3000091,
+    3702923: 8006847,
+    3706577: 8004975,
+    3719573: 8003141,
+    3728153: 8007028,
+    3735407: 7000433,
+    3743095: 8004469,
+    3744653: 8011045,
+    3746953: 8002960,
+    3748322: 2000025,
+    3753673: 8000620,
+    3765157: 7000612,
+    3771595: 8002779,
+    3779309: 2000068,
+    3779831: 8013229,
+    3780295: 6000543,
+    3789227: 8009367,
+    3790655: 6000114,
+    3800741: 8000932,
+    3809927: 7000277,
+    3816131: 7000411,
+    3817879: 8015423,
+    3827227: 6001019,
+    3827391: 8006615,
+    3833459: 8011007,
+    3856214: 8000207,
+    3860173: 7000924,
+    3861949: 8002635,
+    3864619: 7000109,
+    3872901: 8002260,
+    3881273: 6000723,
+    3900281: 6000282,
+    3915083: 8013577,
+    3926629: 6000568,
+    3928497: 6000076,
+    3929941: 6000747,
+    3933137: 7000266,
+    3946813: 7000579,
+    3946827: 7000206,
+    3962203: 6000412,
+    3965315: 8006653,
+    3973319: 8009005,
+    3985267: 8005000,
+    3993743: 8011213,
+    3997418: 6000051,
+    4012465: 8008811,
+    4012547: 8000451,
+    4024823: 8017774,
+    4031261: 8013397,
+    4031705: 8002610,
+    4035239: 8005324,
+    4039951: 2000067,
+    4040509: 8013216,
+    4041005: 7000387,
+    4042687: 8007340,
+    4042805: 8000270,
+    4050553: 8009198,
+    4055843: 8008874,
+    4081181: 8015410,
+    4086511: 8001113,
+    4089055: 8004625,
+    4090757: 8009030,
+    4093379: 8011550,
+    4103239: 8006678,
+    4121741: 3000046,
+    4131833: 3000081,
+    4133261: 8005156,
+    4138561: 8006834,
+    4143665: 8000595,
+    4148947: 6000710,
+    4153546: 6000181,
+    4170751: 8015591,
+    4172201: 7000611,
+    4180963: 6001031,
+    4187771: 8002947,
+    4197431: 8006990,
+    4219007: 8011369,
+    4221811: 8017593,
+    4231283: 8004650,
+    4241163: 7000050,
+    4247341: 8008992,
+    4247887: 7000074,
+    4260113: 6000437,
+    4260883: 8011201,
+    4273102: 6000038,
+    4274803: 8007352,
+    4277489: 7000923,
+    4291593: 8000232,
+    4302397: 7000443,
+    4305505: 6000257,
+    4309279: 8013384,
+    4314311: 6000864,
+    4319695: 6000387,
+    4321933: 8002310,
+    4325633: 8009042,
+    4352051: 7000255,
+    4358341: 8015398,
+    4373511: 8004418,
+    4375681: 8011381,
+    4392287: 3000057,
+    4395859: 7000265,
+    4402867: 8008836,
+    4405999: 7000600,
+    4406811: 6000219,
+    4416787: 6001043,
+    4425499: 8011044,
+    4429435: 8000426,
+    4433549: 7000757,
+    4436159: 8000607,
+    4446245: 7000062,
+    4449731: 8006859,
+    4458389: 8015578,
+    4459939: 8017605,
+    4467073: 8013228,
+    4479865: 6000101,
+    4486909: 8004962,
+    4502641: 8002972,
+    4509973: 7000410,
+    4511965: 6000530,
+    4531115: 8004456,
+    4533001: 8008861,
+    4533657: 8000388,
+    4554737: 8011188,
+    4560743: 6000593,
+    4565615: 8002766,
+    4567277: 8000944,
+    4574953: 6000888,
+    4585973: 8006665,
+    4586959: 6000722,
+    4600897: 8000763,
+    4602578: 7000025,
+    4609423: 6000269,
+    4617605: 2000036,
+    4617931: 7000590,
+    4619527: 8005143,
+    4621643: 8015422,
+    4631155: 8000582,
+    4632959: 6001018,
+    4672841: 8013408,
+    4678223: 7000108,
+    4688719: 8004481,
+    4706513: 8008823,
+    4709861: 7000432,
+    4710729: 6000206,
+    4721393: 3000080,
+    4721519: 8011032,
+    4724419: 8002791,
+    4729081: 8004637,
+    4739311: 7000756,
+    4742101: 8000438,
+    4755549: 6000063,
+    4757297: 2000058,
+    4767521: 7000442,
+    4770965: 8002285,
+    4775147: 8013215,
+    4777721: 8007339,
+    4780723: 6000851,
+    4789169: 8000282,
+    4793269: 8008873,
+    4796351: 6000399,
+    4803821: 7000276,
+    4812035: 6000244,
+    4821877: 2000066,
+    4822543: 8013203,
+    4823135: 8006796,
+    4829513: 7000097,
+    4834531: 8009029,
+    4846323: 7000037,
+    4864057: 8003128,
+    4871087: 8015397,
+    4875277: 8007015,
+    4880485: 8002597,
+    4883223: 8002247,
+    4884763: 8005155,
+    4890467: 6000875,
+    4893779: 7000567,
+    4903301: 6000709,
+    4930783: 8006690,
+    4936409: 8013564,
+    4940377: 8015409,
+    4950545: 8000413,
+    4950967: 2000048,
+    4951969: 6000697,
+    4955143: 8009366,
+    4999745: 6000517,
+    5009837: 8006821,
+    5034679: 3000033,
+    5035589: 8011200,
+    5047141: 8011019,
+    5050241: 8002622,
+    5069407: 7000230,
+    5084651: 8004662,
+    5097301: 6000580,
+    5100154: 6000025,
+    5107739: 8002297,
+    5135119: 7000275,
+    5142179: 8000750,
+    5143333: 7000254,
+    5155765: 8004612,
+    5161217: 7000578,
+    5178013: 8013239,
+    5211503: 8004987,
+    5219997: 8002234,
+    5222587: 8011212,
+    5231281: 8009173,
+    5240333: 8004468,
+    5258773: 7000599,
+    5271649: 6001030,
+    5276851: 7000421,
+    5280233: 8002778,
+    5286745: 8000257,
+    5292413: 6000542,
+    5296877: 8009197,
+    5306917: 6000113,
+    5316979: 2000057,
+    5321303: 7000264,
+    5323153: 8017592,
+    5332255: 8002272,
+    5343161: 2000065,
+    5343899: 7000086,
+    5344555: 8006627,
+    5357183: 8008860,
+    5382871: 8011187,
+    5389969: 6000592,
+    5397691: 7000096,
+    5411139: 8000219,
+    5436299: 7000242,
+    5448839: 8007002,
+    5459441: 8005142,
+    5487317: 6000684,
+    5511335: 6000361,
+    5517163: 8011368,
+    5528809: 8000775,
+    5538101: 7000744,
+    5551441: 8006652,
+    5570917: 6000424,
+    5579977: 8011031,
+    5590127: 7000589,
+    5592059: 7000398,
+    5606135: 8000569,
+    5617451: 8008810,
+    5621447: 8015577,
+    5622483: 2000024,
+    5634343: 8004493,
+    5635211: 6001029,
+    5644387: 8002609,
+    5651522: 2000012,
+    5656597: 7000755,
+    5657407: 7000386,
+    5659927: 8000269,
+    5677243: 8002803,
+    5690267: 8017591,
+    5699369: 8013202,
+    5713145: 8004443,
+    5724677: 8004624,
+    5748431: 8003127,
+    5756645: 7000218,
+    5761691: 8007014,
+    5768419: 3000068,
+    5783557: 7000566,
+    5784321: 8000206,
+    5787191: 8011043,
+    5801131: 8000594,
+    5818879: 8006846,
+    5824621: 8004974,
+    5825095: 6000231,
+    5827289: 7000598,
+    5837009: 6000862,
+    5841557: 6001017,
+    5852327: 6000696,
+    5858285: 6000088,
+    5888069: 8002959,
+    5891843: 8013395,
+    5896579: 8015396,
+    5897657: 7000409,
+    5898629: 7000107,
+    5908715: 8000244,
+    5920039: 7000743,
+    5964803: 8011018,
+    5972593: 8000931,
+    5975653: 8013563,
+    5992765: 8000400,
+    5996127: 6000050,
+    5998331: 6000721,
+    6009133: 7000430,
+    6024007: 8011006,
+    6024083: 6000579,
+    6027707: 6000256,
+    6047573: 6000386,
+    6068777: 8002634,
+    6107155: 6000348,
+    6129013: 3000021,
+    6153655: 8002584,
+    6159049: 8004986,
+    6166241: 6000874,
+    6170417: 6000567,
+    6182423: 8009172,
+    6201209: 8000425,
+    6224743: 7000061,
+    6226319: 6000411,
+    6229171: 8015408,
+    6230319: 6000180,
+    6243787: 8009004,
+    6244423: 6001016,
+    6247789: 8007338,
+    6268121: 7000754,
+    6271811: 6000100,
+    6298177: 8013382,
+    6305431: 7000106,
+    6315517: 7000085,
+    6316751: 6000529,
+    6322079: 8009028,
+    6343561: 8004455,
+    6378985: 8006614,
+    6387767: 7000420,
+    6391861: 8002765,
+    6409653: 6000037,
+    6412009: 6000708,
+    6424717: 7000241,
+    6439537: 8007001,
+    6447947: 8006677,
+    6454835: 8002259,
+    6464647: 2000035,
+    6468037: 6000849,
+    6483617: 8000581,
+    6485011: 6000683,
+    6503453: 8006833,
+    6528799: 8013226,
+    6534047: 7000095,
+    6547495: 6000075,
+    6578045: 7000205,
+    6580783: 8002946,
+    6583811: 6000423,
+    6585001: 8011199,
+    6591499: 3000067,
+    6595963: 8006989,
+    6608797: 7000397,
+    6649159: 8004649,
+    6658769: 7000429,
+    6674393: 8008991,
+    6675251: 7000073,
+    6679351: 8002284,
+    6704017: 6000720,
+    6709469: 7000263,
+    6725897: 3000079,
+    6736849: 6000243,
+    6752389: 8006795,
+    6791609: 7000273,
+    6832679: 8002596,
+    6876857: 8006845,
+    6883643: 8004973,
+    6903867: 7000024,
+    6918791: 8008835,
+    6930763: 8000412,
+    6958627: 8002958,
+    6971107: 8000606,
+    6979061: 8013213,
+    6982823: 7000576,
+    6999643: 6000516,
+    7005547: 8008859,
+    7039139: 8011186,
+    7048421: 3000045,
+    7050857: 8004961,
+    7058519: 8000930,
+    7065853: 7000742,
+    7068605: 7000049,
+    7119281: 8011005,
+    7132231: 8013394,
+    7139269: 8005141,
+    7152655: 8000231,
+    7166363: 6000707,
+    7172191: 7000262,
+    7206529: 8006664,
+    7218071: 8004611,
+    7229981: 8000762,
+    7243379: 6000268,
+    7289185: 8004417,
+    7292311: 6000566,
+    7296893: 8011030,
+    7344685: 6000218,
+    7358377: 6000410,
+    7359707: 6000861,
+    7367987: 8004480,
+    7379021: 8009003,
+    7395949: 8008822,
+    7401443: 8000256,
+    7424087: 8002790,
+    7431413: 8004636,
+    7434817: 8015395,
+    7451873: 8000437,
+    7453021: 6001015,
+    7464397: 8011366,
+    7465157: 8002271,
+    7482377: 8006626,
+    7517179: 7000252,
+    7525837: 7000105,
+    7534519: 7000587,
+    7537123: 6000398,
+    7556095: 8000387,
+    7563113: 7000565,
+    7620301: 8006676,
+    7624109: 8013381,
+    7650231: 6000024,
+    7653043: 6000695,
+    7685899: 8006832,
+    7715869: 6000360,
+    7777289: 8002945,
+    7780091: 2000047,
+    7795229: 8006988,
+    7800127: 8011017,
+    7829729: 7000741,
+    7848589: 8000568,
+    7851215: 6000205,
+    7858097: 8004648,
+    7867273: 6000860,
+    7872601: 8006820,
+    7877647: 6000578,
+    7887919: 8008990,
+    7888933: 7000072,
+    7903283: 8013225,
+    7925915: 6000062,
+    7936093: 8002621,
+    7947563: 8015394,
+    7966211: 7000229,
+    7979183: 7000407,
+    7998403: 8004442,
+    8026447: 8002296,
+    8054141: 7000419,
+    8059303: 7000217,
+    8077205: 7000036,
+    8080567: 8000749,
+    8084707: 8009171,
+    8115389: 2000055,
+    8138705: 8002246,
+    8155133: 6000230,
+    8155351: 6000848,
+    8176753: 8008834,
+    8201599: 6000087,
+    8234809: 8004467,
+    8238581: 7000094,
+    8258753: 3000078,
+    8272201: 8000243,
+    8297509: 8002777,
+    8316649: 6000541,
+    8329847: 8013200,
+    8332831: 8004960,
+    8339441: 3000008,
+    8389871: 8000399,
+    8401553: 7000240,
+    8420933: 8007000,
+    8448337: 8013212,
+    8452891: 7000564,
+    8477283: 2000011,
+    8480399: 6000682,
+    8516807: 8006663,
+    8544523: 8000761,
+    8550017: 6000347,
+    8553401: 6000694,
+    8560357: 3000020,
+    8609599: 3000032,
+    8615117: 8002583,
+    8642273: 7000396,
+    8675071: 2000054,
+    8699995: 8002233,
+    8707621: 8004479,
+    8717789: 6000847,
+    8723693: 8006651,
+    8740667: 8008821,
+    8773921: 8002789,
+    8782579: 8004635,
+    8804429: 3000044,
+    8806759: 7000093,
+    8827423: 8008809,
+    8869751: 8002608,
+    8890211: 7000385,
+    8894171: 8000268,
+    8907509: 6000397,
+    8909119: 8011197,
+    8930579: 8006613,
+    8992813: 7000586,
+    8995921: 8004623,
+    9001687: 8004972,
+    9018565: 8000218,
+    9035849: 8009170,
+    9036769: 8002258,
+    9099743: 7000251,
+    9116063: 8000593,
+    9166493: 6000074,
+    9194653: 2000046,
+    9209263: 7000204,
+    9230371: 7000083,
+    9303983: 8006819,
+    9309829: 8011004,
+    9370805: 2000023,
+    9379019: 8002620,
+    9389971: 3000066,
+    9411631: 7000574,
+    9414613: 7000228,
+    9472111: 6000255,
+    9478093: 6000681,
+    9485801: 7000260,
+    9503329: 6000385,
+    9523541: 8011184,
+    9536099: 6000565,
+    9549761: 8000748,
+    9613007: 8013380,
+    9622493: 6000409,
+    9640535: 8000205,
+    9649489: 8009002,
+    9659011: 7000395,
+    9732047: 8004466,
+    9744757: 8000424,
+    9781739: 7000060,
+    9806147: 8002776,
+    9828767: 6000540,
+    9855703: 6000099,
+    9872267: 8011028,
+    9896047: 7000048,
+    9926323: 6000528,
+    9965009: 7000585,
+    9968453: 8004454,
+    9993545: 6000049,
+    10013717: 8000230,
+    10044353: 8002764,
+    10050791: 8006831,
+    10060709: 7000406,
+    10083499: 8013199,
+    10158731: 2000034,
+    10170301: 8002944,
+    10188541: 8000580,
+    10193761: 8006987,
+    10204859: 8004416,
+    10232447: 3000055,
+    10275973: 7000417,
+    10282559: 6000217,
+    10309819: 8006650,
+    10314971: 8008989,
+    10316297: 7000071,
+    10354117: 2000053,
+    10383865: 6000179,
+    10405103: 6000846,
+    10432409: 8008808,
+    10482433: 8002607,
+    10496123: 8002283,
+    10506613: 7000384,
+    10511293: 7000092,
+    10553113: 8011015,
+    10578533: 8000386,
+    10586477: 6000242,
+    10610897: 8006794,
+    10631543: 8004622,
+    10652251: 8013211,
+    10657993: 6000564,
+    10682755: 6000036,
+    10692677: 8008833,
+    10737067: 8002595,
+    10754551: 3000031,
+    10773529: 8000592,
+    10784723: 8009001,
+    10891199: 8000411,
+    10896779: 8004959,
+    10938133: 6000705,
+    10991701: 6000204,
+    10999439: 6000515,
+    11096281: 6000061,
+    11137363: 8006662,
+    11173607: 7000082,
+    11194313: 6000254,
+    11231207: 6000384,
+    11233237: 7000573,
+    11308087: 7000035,
+    11342683: 8004610,
+    11366807: 7000238,
+    11386889: 7000416,
+    11393027: 8006986,
+    11394187: 8002245,
+    11430103: 8008820,
+    11473481: 2000052,
+    11473589: 7000250,
+    11484911: 8004634,
+    11506445: 7000023,
+    11516531: 8000423,
+    11528497: 8008988,
+    11529979: 3000065,
+    11560237: 7000059,
+    11630839: 8000255,
+    11647649: 3000007,
+    11648281: 6000396,
+    11692487: 3000054,
+    11730961: 8002270,
+    11731109: 6000527,
+    11758021: 8006625,
+    11780899: 8004453,
+    11870599: 8002763,
+    11950639: 8008832,
+    12005773: 2000033,
+    12007943: 8011183,
+    12023777: 2000045,
+    12041003: 8000579,
+    12124937: 6000359,
+    12166747: 8006818,
+    12178753: 8004958,
+    12179993: 8002232,
+    12264871: 7000249,
+    12311417: 7000227,
+    12333497: 8000567,
+    12404509: 8002282,
+    12447641: 7000572,
+    12488149: 8000747,
+    12511291: 6000241,
+    12540151: 8006793,
+    12568919: 8004441,
+    12595651: 8011002,
+    12625991: 8000217,
+    12664619: 7000216,
+    12689261: 8002594,
+    12713977: 8013198,
+    12726523: 8004465,
+    12750385: 6000023,
+    12774821: 8008819,
+    12815209: 6000229,
+    12823423: 8002775,
+    12836077: 7000404,
+    12853003: 6000539,
+    12871417: 8000410,
+    12888227: 6000086,
+    12901781: 3000043,
+    12999173: 8000242,
+    12999337: 6000514,
+    13018667: 6000395,
+    13055191: 6000692,
+    13119127: 2000022,
+    13184083: 8000398,
+    13306099: 8011014,
+    13404989: 8004609,
+    13435741: 6000346,
+    13438339: 2000044,
+    13482071: 8006649,
+    13496749: 8000204,
+    13538041: 8002582,
+    13590803: 8013197,
+    13598129: 8006817,
+    13642381: 8008807,
+    13707797: 8002606,
+    13739417: 7000383,
+    13745537: 8000254,
+    13759819: 7000226,
+    13791559: 7000561,
+    13863863: 8002269,
+    13895843: 8006624,
+    13902787: 8004621,
+    13955549: 6000691,
+    13957343: 7000069,
+    13990963: 6000048,
+    14033767: 8006612,
+    14088461: 7000081,
+    14128805: 2000010,
+    14200637: 8002257,
+    14223761: 7000403,
+    14329471: 6000358,
+    14332061: 7000237,
+    14365121: 6000538,
+    14404489: 6000073,
+    14466563: 6000679,
+    14471699: 7000203,
+    14537411: 6000178,
+    14575951: 8000566,
+    14638717: 3000019,
+    14686963: 6000383,
+    14742701: 7000393,
+    14854177: 8004440,
+    14955857: 6000035,
+    14967277: 7000215,
+    15060079: 7000080,
+    15068197: 8006648,
+    15117233: 7000058,
+    15145247: 6000228,
+    15231541: 6000085,
+    15247367: 8008806,
+    15320479: 7000236,
+    15340681: 6000526,
+    15355819: 7000382,
+    15362659: 8000241,
+    15405791: 8004452,
+    15464257: 6000678,
+    15523091: 8002762,
+    15538409: 8004620,
+    15550931: 7000047,
+    15581189: 8000397,
+    15699857: 2000032,
+    15735841: 8000229,
+    15745927: 8000578,
+    15759439: 3000030,
+    15878603: 6000345,
+    15881473: 8011001,
+    15999503: 8002581,
+    16036207: 8004415,
+    16109023: 7000022,
+    16158307: 6000216,
+    16221281: 7000247,
+    16267463: 2000043,
+    16360919: 6000240,
+    16398659: 8006792,
+    16414841: 6000382,
+    16460893: 7000560,
+    16585361: 8006611,
+    16593649: 8002593,
+    16623409: 8000385,
+    16656623: 3000053,
+    16782571: 8002256,
+    16831853: 8000409,
+    16895731: 7000057,
+    16976747: 8011000,
+    16999133: 6000513,
+    17023487: 6000072,
+    17102917: 7000202,
+    17145467: 6000525,
+    17218237: 8004451,
+    17272673: 6000203,
+    17349337: 8002761,
+    17389357: 6000537,
+    17437013: 6000060,
+    17529601: 8004608,
+    17546899: 2000031,
+    17596127: 8008986,
+    17598389: 7000068,
+    17769851: 7000034,
+    17850539: 6000022,
+    17905151: 8002244,
+    17974933: 7000079,
+    18129667: 8002268,
+    18171487: 8006623,
+    18240449: 7000559,
+    18285733: 3000018,
+    18327913: 8006791,
+    18378373: 7000046,
+    18457339: 6000677,
+    18545843: 8002592,
+    18588623: 7000381,
+    18596903: 8000228,
+    18738539: 6000357,
+    18809653: 7000391,
+    18812071: 7000067,
+    18951881: 8004414,
+    18999031: 6000512,
+    19060859: 8000565,
+    19096181: 6000215,
+    19139989: 8002231,
+    19424693: 8004439,
+    19498411: 8008817,
+    19572593: 7000214,
+    19591907: 8004607,
+    19645847: 8000384,
+    19780327: 2000009,
+    19805323: 6000227,
+    19840843: 8000216,
+    19870597: 6000381,
+    19918169: 3000006,
+    20089631: 8000240,
+    20262569: 7000234,
+    20309309: 8006622,
+    20375401: 8000396,
+    20413159: 6000202,
+    20452727: 3000052,
+    20607379: 6000059,
+    20615771: 2000021,
+    20755039: 6000524,
+    20764327: 6000344,
+    20843129: 7000390,
+    20922427: 8002580,
+    20943073: 6000356,
+    21000733: 7000033,
+    21001829: 7000224,
+    21160633: 8002243,
+    21209177: 8000203,
+    21240983: 2000030,
+    21303313: 8000564,
+    21688549: 8006610,
+    21709951: 8004438,
+    21875251: 7000213,
+    21925711: 2000041,
+    21946439: 8002255,
+    21985799: 6000047,
+    22135361: 6000226,
+    22186421: 8006790,
+    22261483: 6000071,
+    22365353: 7000201,
+    22450231: 7000223,
+    22453117: 7000066,
+    22619987: 8002230,
+    22772507: 8000395,
+    22844503: 6000177,
+    22998827: 6000511,
+    23207189: 6000343,
+    23272297: 8008804,
+    23383889: 8002579,
+    23437829: 3000041,
+    23448269: 8000215,
+    23502061: 6000034,
+    23716519: 8004606,
+    24033257: 7000045,
+    24240143: 8006609,
+    24319027: 8000227,
+    24364093: 2000020,
+    24528373: 8002254,
+    24584953: 8006621,
+    24783229: 8004413,
+    24877283: 8008803,
+    24880481: 3000005,
+    24971929: 6000214,
+    24996571: 7000200,
+    25054231: 3000029,
+    25065391: 8000202,
+    25314179: 7000021,
+    25352141: 6000355,
+    25690723: 8000383,
+    25788221: 7000055,
+    25983217: 6000046,
+    26169397: 2000040,
+    26280467: 8004437,
+    26480567: 7000212,
+    26694131: 6000201,
+    26782109: 2000029,
+    26795437: 3000017,
+    26860699: 7000044,
+    26948111: 6000058,
+    26998049: 6000176,
+    27180089: 8000226,
+    27462497: 7000032,
+    27566719: 7000054,
+    27671597: 8002242,
+    27698903: 8004412,
+    27775163: 6000033,
+    27909803: 6000213,
+    27974183: 6000522,
+    28050847: 6000021,
+    28092913: 6000342,
+    28306813: 8002578,
+    28713161: 8000382,
+    28998521: 2000039,
+    29343331: 8006608,
+    29579983: 8002229,
+    29692241: 7000221,
+    29834617: 6000200,
+    29903437: 7000378,
+    29916757: 7000020,
+    30118477: 6000057,
+    30259007: 7000199,
+    30663121: 8000214,
+    30693379: 7000031,
+    30927079: 8002241,
+    30998419: 6000509,
+    31083371: 2000008,
+    31860737: 2000019,
+    31965743: 6000354,
+    32515583: 7000043,
+    32777819: 8000201,
+    32902213: 7000053,
+    33059981: 8002228,
+    33136241: 7000377,
+    33151001: 6000020,
+    33388541: 3000040,
+    33530251: 8004411,
+    33785551: 6000212,
+    33978053: 6000045,
+    34170277: 2000027,
+    34270547: 8000213,
+    34758037: 8000381,
+    35305141: 6000175,
+    35421499: 6000341,
+    35609059: 2000018,
+    35691199: 7000210,
+    36115589: 6000199,
+    36321367: 6000032,
+    36459209: 3000004,
+    36634033: 8000200,
+    36734893: 2000007,
+    36998113: 6000508,
+    37155143: 7000030,
+    37438043: 8002240,
+    37864361: 2000026,
+    37975471: 6000044,
+    38152661: 7000198,
+    39121913: 7000019,
+    39458687: 6000174,
+    39549707: 8006606,
+    40019977: 8002227,
+    40594469: 6000031,
+    40783879: 3000027,
+    40997909: 3000039,
+    41485399: 8000212,
+    42277273: 8004410,
+    42599173: 3000016,
+    43105703: 2000017,
+    43351309: 6000019,
+    43724491: 7000018,
+    43825351: 7000041,
+    44346461: 8000199,
+    45192947: 6000339,
+    45537047: 6000198,
+    45970307: 6000043,
+    46847789: 7000029,
+    47204489: 7000208,
+    47765779: 6000173,
+    48037937: 2000006,
+    48451463: 6000018,
+    48677533: 3000015,
+    49140673: 6000030,
+    50078671: 3000026,
+    50459971: 8002226,
+    52307677: 7000040,
+    52929647: 7000017,
+    53689459: 2000005,
+    53939969: 7000195,
+    54350669: 2000016,
+    55915103: 8000198,
+    57962561: 3000003,
+    58098991: 2000015,
+    58651771: 6000017,
+    59771317: 7000027,
+    60226417: 6000172,
+    61959979: 6000029,
+    64379963: 6000171,
+    64992503: 2000004,
+    66233081: 3000002,
+    66737381: 7000016,
+    71339959: 7000015,
+    73952233: 6000016,
+    76840601: 2000013,
+    79052387: 6000015,
+    81947069: 2000003,
+    85147693: 3000013,
+    87598591: 2000002,
+    94352849: 3000001,
+    104553157: 2000001,
+}
@@ -13,6 +13,11 @@ from typing import List, Optional, Tuple
 from enum import IntEnum
 
 
+# Default shuffling source for decks created without an explicit rng.
+# Kept as a module attribute so it can be replaced (e.g. per test).
+_rng = random.Random()
+
+
 class Suit(IntEnum):
     """Card suits with integer values for fast comparison."""
     CLUBS = 0     # ♣
@@ -76,6 +81,15 @@ CHAR_TO_SUIT = {v: k for k, v in SUIT_CHARS.items()}
 SYMBOL_TO_SUIT = {v: k for k, v in SUIT_SYMBOLS.items()}
 
 
+# Cactus-Kev card encoding (see Card.ck):
+#   bits 16-28: one bit per rank, bits 12-15: one bit per suit,
+#   bits 8-11: rank index, bits 0-7: prime for the rank
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Shared Card instances keyed by (rank, suit), filled on first use
+_CARD_CACHE: dict = {}
+
+
 class Card:
     """
     A playing card represented as (rank, suit).
@@ -87,14 +101,45 @@ class Card:
     
     The integer encoding is: card_int = rank * 4 + suit
     This allows for fast comparison and evaluation.
-    """
     
-    __slots__ = ("rank", "suit", "_int")
+    Cards are immutable flyweights: each of the 52 cards is created once and
+    Card(rank, suit) returns the shared instance.
+    """
     
-    def __init__(self, rank: Rank, suit: Suit):
-        self.rank = Rank(rank)
-        self.suit = Suit(suit)
-        self._int = int(self.rank) * 4 + int(self.suit)
+    __slots__ = ("rank", "suit", "_int", "_ck")
+    
+    def __new__(cls, rank: Rank, suit: Suit) -> Card:
+        card = _CARD_CACHE.get((rank, suit))
+        if card is None:
+            rank = Rank(rank)
+            suit = Suit(suit)
+            card = object.__new__(cls)
+            # Slots are filled once here; __setattr__ rejects later writes
+            object.__setattr__(card, "rank", rank)
+            object.__setattr__(card, "suit", suit)
+            object.__setattr__(card, "_int", int(rank) * 4 + int(suit))
+            object.__setattr__(card, "_ck", (
+                (1 << (16 + rank)) | (1 << (12 + suit))
+                | (rank << 8) | PRIMES[rank]
+            ))
+            _CARD_CACHE[(rank, suit)] = card
+        return card
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Card is immutable, cannot set {name!r}")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Card is immutable, cannot delete {name!r}")
+    
+    def __reduce__(self):
+        # Unpickle through Card() so the shared instance is reused
+        return (Card, (self.rank, self.suit))
+    
+    def __copy__(self) -> Card:
+        return self
+    
+    def __deepcopy__(self, memo: dict) -> Card:
+        return self
     
     @classmethod
     def from_string(cls, s: str) -> Card:
@@ -132,9 +177,19 @@ class Card:
         """Create a card from integer (0-51)."""
         if not 0 <= card_int <= 51:
             raise ValueError(f"Card int must be 0-51, got {card_int}")
-        rank = Rank(card_int // 4)
-        suit = Suit(card_int % 4)
-        return cls(rank, suit)
+        return _CARDS_BY_INT[card_int]
+    
+    @classmethod
+    def from_ck(cls, ck: int) -> Card:
+        """Create a card from its Cactus-Kev integer encoding (see ck)."""
+        rank = (ck >> 8) & 0xF
+        suit = ((ck >> 12) & 0xF).bit_length() - 1
+        if rank > 12 or suit < 0:
+            raise ValueError(f"Invalid Cactus-Kev card int: {ck:#x}")
+        card = cls(Rank(rank), Suit(suit))
+        if card._ck != ck:
+            raise ValueError(f"Invalid Cactus-Kev card int: {ck:#x}")
+        return card
     
     def to_int(self) -> int:
         """Return the integer representation (0-51)."""
@@ -143,6 +198,11 @@ class Card:
     def __int__(self) -> int:
         return self._int
     
+    @property
+    def ck(self) -> int:
+        """Cactus-Kev integer encoding, as used by the hand evaluator."""
+        return self._ck
+    
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Card):
             return self._int == other._int
@@ -186,6 +246,10 @@ class Card:
         }
 
 
+# All 52 cards in integer order (index = Card.to_int()), i.e. a new deck
+_CARDS_BY_INT: Tuple[Card, ...] = tuple(Card(rank, suit) for rank in Rank for suit in Suit)
+
+
 class Deck:
     """
     A standard 52-card deck.
@@ -197,24 +261,35 @@ class Deck:
         flop = deck.deal(3)
     """
     
-    def __init__(self, shuffle: bool = True):
-        """Initialize a new deck, optionally shuffled."""
+    def __init__(self, shuffle: bool = True, rng: Optional[random.Random] = None):
+        """
+        Initialize a new deck, optionally shuffled.
+        
+        Args:
+            shuffle: Whether to shuffle the deck after creating it
+            rng: Random generator used for shuffling (defaults to the
+                module-level ``_rng``)
+        """
+        self._rng = rng if rng is not None else _rng
         self.reset()
         if shuffle:
             self.shuffle()
     
     def reset(self) -> None:
         """Reset the deck to a full 52 cards in order."""
-        self._cards: List[Card] = [
-            Card(rank, suit)
-            for rank in Rank
-            for suit in Suit
-        ]
-        self._dealt: List[Card] = []
+        # Dealing advances _top instead of removing cards, so _cards[:_top]
+        # are the dealt cards and _cards[_top:] the remaining ones
+        self._cards: List[Card] = list(_CARDS_BY_INT)
+        self._top = 0
     
     def shuffle(self) -> None:
         """Shuffle the remaining cards in the deck."""
-        random.shuffle(self._cards)
+        if self._top == 0:
+            self._rng.shuffle(self._cards)
+        else:
+            remaining = self._cards[self._top:]
+            self._rng.shuffle(remaining)
+            self._cards[self._top:] = remaining
     
     def deal(self, n: int = 1) -> List[Card]:
         """
@@ -223,13 +298,12 @@ class Deck:
         Raises:
             ValueError: If not enough cards remain.
         """
-        if n > len(self._cards):
-            raise ValueError(f"Cannot deal {n} cards, only {len(self._cards)} remain")
+        top = self._top
+        if n > len(self._cards) - top:
+            raise ValueError(f"Cannot deal {n} cards, only {len(self._cards) - top} remain")
         
-        dealt = self._cards[:n]
-        self._cards = self._cards[n:]
-        self._dealt.extend(dealt)
-        return dealt
+        self._top = top + n
+        return self._cards[top:top + n]
     
     def deal_one(self) -> Card:
         """Deal a single card."""
@@ -242,15 +316,15 @@ class Deck:
     @property
     def remaining(self) -> int:
         """Number of cards remaining in the deck."""
-        return len(self._cards)
+        return len(self._cards) - self._top
     
     @property
     def dealt_cards(self) -> List[Card]:
         """List of cards that have been dealt."""
-        return self._dealt.copy()
+        return self._cards[:self._top]
     
     def __len__(self) -> int:
-        return len(self._cards)
+        return len(self._cards) - self._top
     
     def __repr__(self) -> str:
         return f"Deck({self.remaining} cards remaining)"
@@ -13,37 +13,41 @@ Reference: WSOP Official Tournament Rules
 """
 
 from __future__ import annotations
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Sequence, Tuple, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 import logging
+import random
 
 from deeppoker.core.card import Card, Deck
 from deeppoker.core.player import Player, PlayerState
-from deeppoker.core.hand import evaluate_hand, HandRank, get_hand_description
+from deeppoker.core.hand import evaluate_hand, evaluate_ranks, HandRank, describe_hand
 from deeppoker.core.rules import (
     GamePhase, ActionType,
     get_blind_positions, get_first_to_act_preflop, get_first_to_act_postflop,
     calculate_min_raise, is_valid_raise, is_action_reopened,
     DEFAULT_BIG_BLIND, DEFAULT_SMALL_BLIND, DEFAULT_BUY_IN,
-    HOLE_CARDS, FLOP_CARDS, TURN_CARDS, RIVER_CARDS,
+    HOLE_CARDS, FLOP_CARDS, TURN_CARDS, RIVER_CARDS, TOTAL_COMMUNITY_CARDS,
 )
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Pot:
     """Represents a pot (main pot or side pot)."""
     amount: int = 0
     eligible_players: List[str] = field(default_factory=list)
+    # Same players as a seat bitmask (bit i = seat i); 0 when unknown
+    eligible_mask: int = 0
     
     def add(self, amount: int) -> None:
         self.amount += amount
 
 
-@dataclass 
+@dataclass(slots=True)
 class ActionResult:
     """Result of a player action."""
     success: bool
@@ -52,7 +56,7 @@ class ActionResult:
     amount: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionRecord:
     """Records a player action for history tracking and WSOP Rule 96."""
     player_id: str
@@ -63,6 +67,64 @@ class ActionRecord:
     phase: GamePhase
 
 
+@lru_cache(maxsize=4096)
+def _pot_layers(
+    bets: Tuple[int, ...], in_hand_mask: int
+) -> Tuple[Tuple[int, Tuple[int, ...], int], ...]:
+    """
+    Split total contributions into the main pot and side pots.
+    
+    Depends only on what each seat put in and which seats are still in the
+    hand, so repeated bet patterns (e.g. replayed or simulated hands) are
+    served from the cache.
+    
+    Args:
+        bets: Total contribution per seat
+        in_hand_mask: Seat bitmask (bit i = seat i) of players still in the hand
+        
+    Returns:
+        One (amount, eligible seats by contribution, eligible seat mask) per
+        pot, main pot first. Levels nobody in the hand reached are dropped.
+    """
+    contributors = [seat for seat, bet in enumerate(bets) if bet > 0]
+    
+    # Seats still in the hand among the contributors not yet passed
+    eligible_mask = 0
+    for seat in contributors:
+        eligible_mask |= 1 << seat
+    eligible_mask &= in_hand_mask
+    
+    # Usual case: everyone put in the same amount, so there is one level
+    # and a single pot
+    level = bets[contributors[0]]
+    if all(bets[seat] == level for seat in contributors):
+        if not eligible_mask:
+            return ()
+        eligible = tuple(seat for seat in contributors if in_hand_mask >> seat & 1)
+        return ((level * len(contributors), eligible, eligible_mask),)
+    
+    # By contribution; the sort is stable, so ties stay in seat order
+    contributors.sort(key=bets.__getitem__)
+    
+    layers = []
+    prev_level = 0
+    num_contributors = len(contributors)
+    
+    for i, seat in enumerate(contributors):
+        bet_level = bets[seat]
+        if bet_level > prev_level:
+            # Exactly the contributors from index i on put in at least
+            # bet_level, as they are sorted
+            if eligible_mask:
+                eligible = tuple(s for s in contributors[i:] if in_hand_mask >> s & 1)
+                pot_amount = (bet_level - prev_level) * (num_contributors - i)
+                layers.append((pot_amount, eligible, eligible_mask))
+            prev_level = bet_level
+        eligible_mask &= ~(1 << seat)
+    
+    return tuple(layers)
+
+
 class TexasHoldemGame:
     """
     Texas Hold'em game engine implementing a state machine.
@@ -86,6 +148,7 @@ class TexasHoldemGame:
         small_blind: int = DEFAULT_SMALL_BLIND,
         buy_in: int = DEFAULT_BUY_IN,
         player_ids: Optional[List[str]] = None,
+        rng_seed: Optional[int] = None,
     ):
         """
         Initialize a new Texas Hold'em game.
@@ -96,6 +159,8 @@ class TexasHoldemGame:
             small_blind: Small blind amount
             buy_in: Starting stack for each player
             player_ids: Optional list of player IDs
+            rng_seed: Optional seed for deck shuffling, making deals
+                reproducible (re-applied on every reset())
         """
         if num_players < 2 or num_players > 10:
             raise ValueError("Number of players must be 2-10")
@@ -103,6 +168,7 @@ class TexasHoldemGame:
         self.big_blind = big_blind
         self.small_blind = small_blind
         self.buy_in = buy_in
+        self.rng_seed = rng_seed
         
         # Create players
         if player_ids is None:
@@ -113,6 +179,23 @@ class TexasHoldemGame:
             for i, pid in enumerate(player_ids)
         ]
         
+        self.reset()
+    
+    def reset(self) -> None:
+        """
+        Reset the table to its freshly-constructed state.
+        
+        Every player gets their buy-in back and all hand, position and betting
+        state is cleared, so the same game object can be reused instead of
+        building a new one.
+        """
+        for player in self.players:
+            player.stack = self.buy_in
+            player.reset_for_new_hand()
+        
+        # Shuffling source: seeded per game, or the deck's default generator
+        self._rng = random.Random(self.rng_seed) if self.rng_seed is not None else None
+        
         # Game state
         self.deck = Deck(shuffle=False)
         self.community_cards: List[Card] = []
@@ -129,7 +212,7 @@ class TexasHoldemGame:
         self.current_bet = 0  # Current highest bet in the round
         self.last_raise_amount = 0  # Size of the last raise
         self.last_aggressor_index = -1  # Player who made the last raise
-        self.min_raise = big_blind  # Minimum raise amount
+        self.min_raise = self.big_blind  # Minimum raise amount
         
         # Pot tracking
         self.pots: List[Pot] = [Pot()]
@@ -140,11 +223,18 @@ class TexasHoldemGame:
         # Hand history for replay
         self.hand_history: List[Dict[str, Any]] = []
         
+        # Winners of the last finished hand, recorded when it ends
+        self._winners: List[Dict[str, Any]] = []
+        
         # Track actions in current betting round for WSOP Rule 96
         self.round_actions: List[ActionRecord] = []
         
         # Track consecutive all-in raises for WSOP Rule 96
         self._consecutive_allin_raise_sum: int = 0
+        
+        # Legal actions of the current player, reused while the state key matches
+        self._legal_cache_key: Optional[Tuple] = None
+        self._legal_cache_value: List[Dict[str, Any]] = []
     
     @property
     def num_players(self) -> int:
@@ -166,7 +256,26 @@ class TexasHoldemGame:
     @property
     def pot_total(self) -> int:
         """Total amount in all pots."""
-        return sum(pot.amount for pot in self.pots)
+        pots = self.pots
+        # Until a showdown splits it, there is only the main pot
+        if len(pots) == 1:
+            return pots[0].amount
+        return sum(pot.amount for pot in pots)
+    
+    @property
+    def stacks(self) -> List[int]:
+        """Player stacks in seat order."""
+        return [p.stack for p in self.players]
+    
+    @property
+    def stack_total(self) -> int:
+        """Total chips held in player stacks (excludes chips in the pot)."""
+        return sum(self.stacks)
+    
+    @property
+    def num_active_with_chips(self) -> int:
+        """Number of players with a non-empty stack."""
+        return sum(1 for stack in self.stacks if stack > 0)
     
     def is_game_running(self) -> bool:
         """Check if the game can continue (at least 2 players with chips)."""
@@ -191,20 +300,8 @@ class TexasHoldemGame:
         logger.info(f"Starting hand #{self.hand_number}")
         
         # Reset for new hand
-        self.deck = Deck(shuffle=True)
-        self.community_cards = []
-        self.pots = [Pot()]
-        self.current_bet = 0
-        self.last_raise_amount = 0
-        self.last_aggressor_index = -1
-        self.hand_history = []
-        
-        # Reset players
-        for player in self.players:
-            player.reset_for_new_hand()
-        
-        # Move dealer button
-        self._move_dealer_button()
+        self.deck = Deck(shuffle=True, rng=self._rng)
+        self._reset_hand_state()
         
         # Post blinds
         self._post_blinds()
@@ -225,6 +322,56 @@ class TexasHoldemGame:
         
         return True
     
+    def _reset_hand_state(self) -> None:
+        """Clear the board, pots, bets and players and move the button for a new hand."""
+        self.community_cards = []
+        self.pots = [Pot()]
+        self.current_bet = 0
+        self.last_raise_amount = 0
+        self.last_aggressor_index = -1
+        self.hand_history = []
+        self._winners = []
+        
+        # Reset players
+        for player in self.players:
+            player.reset_for_new_hand()
+        
+        # Move dealer button
+        self._move_dealer_button()
+    
+    def _enter_showdown_state(self) -> None:
+        """
+        Start a hand directly on the river, without shuffling, blinds or dealing.
+        
+        A subset of start_hand() for setting up a showdown by hand: the
+        hole cards, board and bets are then assigned directly before the
+        pots are resolved.
+        """
+        self.hand_number += 1
+        self._reset_hand_state()
+        self.phase = GamePhase.RIVER
+    
+    def set_board(self, cards: Sequence[Union[Card, int]]) -> None:
+        """
+        Replace the community cards in place.
+        
+        For setting up boards directly (tests, simulations, replays); card
+        ints map onto the shared Card instances, so nothing is allocated.
+        
+        Args:
+            cards: Up to 5 cards, as Card objects or card ints (0-51, see Card.to_int)
+            
+        Raises:
+            ValueError: If more than 5 cards are given or a card int is out of range
+        """
+        if len(cards) > TOTAL_COMMUNITY_CARDS:
+            raise ValueError(
+                f"A board has at most {TOTAL_COMMUNITY_CARDS} cards, got {len(cards)}"
+            )
+        self.community_cards[:] = [
+            card if isinstance(card, Card) else Card.from_int(card) for card in cards
+        ]
+    
     def _move_dealer_button(self) -> None:
         """Move the dealer button to the next active player."""
         # Find next player with chips
@@ -331,43 +478,60 @@ class TexasHoldemGame:
         Returns:
             True if there's a player to act, False if round is complete
         """
-        # Check if only one player remains
-        if self.num_active_players <= 1:
+        in_hand, can_act, pending = self._seat_masks()
+        
+        # Check if only one player remains (at most one bit set)
+        if in_hand & (in_hand - 1) == 0:
             self._end_hand_early()
             return False
         
         # Check if betting round is complete
-        if self._is_betting_round_complete():
+        if not pending:
             self._end_betting_round()
             return self.is_hand_running()
         
-        # Find next active player
-        start = self.current_player_index
-        for _ in range(self.num_players):
-            self.current_player_index = (self.current_player_index + 1) % self.num_players
-            player = self.players[self.current_player_index]
-            
-            if player.is_active and player.stack > 0:
-                return True
-        
         # No one can act
-        self._end_betting_round()
-        return self.is_hand_running()
+        if not can_act:
+            self._end_betting_round()
+            return self.is_hand_running()
+        
+        # Next player who can act, after the current seat (wrapping around)
+        after = can_act >> (self.current_player_index + 1) << (self.current_player_index + 1)
+        next_seats = after or can_act
+        self.current_player_index = (next_seats & -next_seats).bit_length() - 1
+        return True
     
     def _is_betting_round_complete(self) -> bool:
         """Check if the current betting round is complete."""
-        active_players = [p for p in self.players if p.is_active]
-        
-        # All active players must have:
-        # 1. Acted at least once
-        # 2. Either matched the current bet or gone all-in
-        for player in active_players:
-            if not player.has_acted:
-                return False
-            if player.current_bet < self.current_bet and player.stack > 0:
-                return False
+        return self._seat_masks()[2] == 0
+    
+    def _seat_masks(self) -> Tuple[int, int, int]:
+        """
+        Summarize the players as seat bitmasks (bit i = seat i) in one pass.
         
-        return True
+        Returns:
+            Tuple of:
+            - in_hand: players who have not folded or busted
+            - can_act: active players with chips behind
+            - pending: active players who still owe an action, i.e. have not
+              acted yet or have chips and have not matched the current bet
+        """
+        in_hand = can_act = pending = 0
+        current_bet = self.current_bet
+        for seat, player in enumerate(self.players):
+            state = player.state
+            if state is PlayerState.ACTIVE:
+                bit = 1 << seat
+                in_hand |= bit
+                if player.stack > 0:
+                    can_act |= bit
+                    if player.current_bet < current_bet:
+                        pending |= bit
+                if not player.has_acted:
+                    pending |= bit
+            elif state is PlayerState.ALL_IN:
+                in_hand |= 1 << seat
+        return in_hand, can_act, pending
     
     def _end_betting_round(self) -> None:
         """End the current betting round and advance to next phase."""
@@ -431,12 +595,10 @@ class TexasHoldemGame:
         """Go to showdown and determine winner(s)."""
         self.phase = GamePhase.SHOWDOWN
         self._collect_bets_to_pot()
-        self._calculate_side_pots()
-        
-        winners = self._determine_winners()
-        self._distribute_pots(winners)
+        winners = self._resolve_showdown()
         
         self.phase = GamePhase.HAND_OVER
+        self._winners = winners
         self._log_action("SHOWDOWN", {"winners": winners})
     
     def _end_hand_early(self) -> None:
@@ -447,11 +609,18 @@ class TexasHoldemGame:
         remaining = [p for p in self.players if p.is_in_hand]
         if remaining:
             winner = remaining[0]
-            winner.stack += self.pot_total
+            amount = self.pot_total
+            winner.stack += amount
             
+            self._winners = [{
+                "player_id": winner.player_id,
+                "amount": amount,
+                "hand_type": "WIN_BY_FOLD",
+                "description": "All other players folded"
+            }]
             self._log_action("WIN_BY_FOLD", {
                 "winner": winner.player_id,
-                "amount": self.pot_total
+                "amount": amount
             })
         
         self.phase = GamePhase.HAND_OVER
@@ -469,30 +638,24 @@ class TexasHoldemGame:
     
     def _calculate_side_pots(self) -> None:
         """Calculate side pots for all-in situations."""
-        # Get all players who contributed to the pot
-        contributors = [(p, p.total_bet) for p in self.players if p.total_bet > 0]
-        if not contributors:
+        players = self.players
+        bets = tuple([p.total_bet for p in players])
+        if not any(bets):
             return
         
-        # Sort by contribution amount
-        contributors.sort(key=lambda x: x[1])
-        
-        # Reset pots
-        self.pots = []
-        prev_level = 0
+        in_hand_mask = 0
+        for seat, player in enumerate(players):
+            if player.is_in_hand:
+                in_hand_mask |= 1 << seat
         
-        for player, bet_level in contributors:
-            if bet_level > prev_level:
-                # Create a new pot for this level
-                pot_contribution = bet_level - prev_level
-                eligible = [p.player_id for p, b in contributors 
-                           if b >= bet_level and p.is_in_hand]
-                
-                if eligible:
-                    pot_amount = pot_contribution * len([p for p, b in contributors if b >= bet_level])
-                    self.pots.append(Pot(amount=pot_amount, eligible_players=eligible))
-                
-                prev_level = bet_level
+        self.pots = [
+            Pot(
+                amount=amount,
+                eligible_players=[players[seat].player_id for seat in eligible],
+                eligible_mask=eligible_mask,
+            )
+            for amount, eligible, eligible_mask in _pot_layers(bets, in_hand_mask)
+        ]
     
     def _determine_winners(self) -> List[Dict[str, Any]]:
         """
@@ -503,31 +666,61 @@ class TexasHoldemGame:
         """
         winners = []
         
+        # Winners' hands are fully evaluated once, however many pots they win
+        evaluated: Dict[int, Tuple[int, HandRank, Tuple[Card, ...]]] = {}
+        # Each seat's first entry in winners, which receives its odd chips
+        first_entry: Dict[int, Dict[str, Any]] = {}
+        seats_by_id = {p.player_id: seat for seat, p in enumerate(self.players)}
+        
+        pot_masks = []
+        live_mask = 0
         for pot in self.pots:
-            if not pot.eligible_players:
-                continue
-            
-            # Evaluate hands for eligible players
-            player_hands = []
-            for pid in pot.eligible_players:
-                player = self._get_player_by_id(pid)
-                if player and player.is_in_hand:
-                    all_cards = player.hole_cards + self.community_cards
-                    rank, hand_type, best_cards = evaluate_hand(all_cards)
-                    player_hands.append({
-                        "player": player,
-                        "rank": rank,
-                        "hand_type": hand_type,
-                        "best_cards": best_cards,
-                        "description": get_hand_description(all_cards)
-                    })
+            mask = pot.eligible_mask
+            if not mask:
+                # Pots built without a mask only list the player ids
+                for pid in pot.eligible_players:
+                    seat = seats_by_id.get(pid)
+                    if seat is not None:
+                        mask |= 1 << seat
+            pot_masks.append(mask)
+            live_mask |= mask
+        
+        # Rank every contending hand in one batch; only the winners' best
+        # five cards are needed, so those are worked out afterwards
+        live_seats = [
+            seat for seat, p in enumerate(self.players)
+            if live_mask >> seat & 1 and p.is_in_hand
+        ]
+        board = self.community_cards
+        ranks = dict(zip(live_seats, evaluate_ranks(
+            [self.players[seat].hole_cards + board for seat in live_seats]
+        )))
+        
+        for pot, mask in zip(self.pots, pot_masks):
+            # One pass over the eligible seats keeps the best rank and every
+            # player tied on it, in seat order
+            best_rank = None
+            pot_winners = []
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                seat = low.bit_length() - 1
+                rank = ranks.get(seat)
+                if rank is None:
+                    continue
+                if best_rank is None or rank < best_rank:
+                    best_rank = rank
+                    pot_winners = [seat]
+                elif rank == best_rank:
+                    pot_winners.append(seat)
             
-            if not player_hands:
+            if not pot_winners:
                 continue
             
-            # Find best hand(s)
-            best_rank = min(h["rank"] for h in player_hands)
-            pot_winners = [h for h in player_hands if h["rank"] == best_rank]
+            # List tied winners as the side-pot levels order them: by
+            # contribution, then seat (the sort is stable)
+            if len(pot_winners) > 1:
+                pot_winners.sort(key=lambda seat: self.players[seat].total_bet)
             
             # Split pot among winners
             split_amount = pot.amount // len(pot_winners)
@@ -535,39 +728,58 @@ class TexasHoldemGame:
             
             # WSOP Rule 73: Odd chip goes to the first player clockwise from the button
             # First, give each winner their split amount
-            for winner in pot_winners:
-                winners.append({
-                    "player_id": winner["player"].player_id,
+            winner_mask = 0
+            for seat in pot_winners:
+                winner_mask |= 1 << seat
+                hand = evaluated.get(seat)
+                if hand is None:
+                    hand = evaluate_hand(self.players[seat].hole_cards + board)
+                    evaluated[seat] = hand
+                _, hand_type, best_cards = hand
+                entry = {
+                    "player_id": self.players[seat].player_id,
                     "amount": split_amount,
-                    "hand_type": winner["hand_type"].name,
-                    "description": winner["description"],
-                    "cards": [str(c) for c in winner["best_cards"]]
-                })
+                    "hand_type": hand_type.name,
+                    "description": describe_hand(hand_type, best_cards),
+                    "cards": [str(c) for c in best_cards]
+                }
+                winners.append(entry)
+                first_entry.setdefault(seat, entry)
             
             # Distribute remainder chips according to WSOP Rule 73
             # Odd chips go to players closest to the left of the dealer button
             if remainder > 0:
-                winner_pids = [w["player"].player_id for w in pot_winners]
                 # Find winners in clockwise order from dealer
                 for i in range(self.num_players):
                     pos = (self.dealer_position + 1 + i) % self.num_players
-                    pid = self.players[pos].player_id
-                    if pid in winner_pids:
+                    if winner_mask >> pos & 1:
                         # Give this winner one chip of remainder
-                        for w in winners:
-                            if w["player_id"] == pid:
-                                w["amount"] += 1
-                                break
+                        first_entry[pos]["amount"] += 1
                         remainder -= 1
                         if remainder == 0:
                             break
         
         return winners
     
+    def _resolve_showdown(self) -> List[Dict[str, Any]]:
+        """
+        Split the bets into pots, pick each pot's winners and pay them.
+        
+        Every hand is ranked once for all pots (see _determine_winners).
+        
+        Returns:
+            List of winner info dicts, as from _determine_winners
+        """
+        self._calculate_side_pots()
+        winners = self._determine_winners()
+        self._distribute_pots(winners)
+        return winners
+    
     def _distribute_pots(self, winners: List[Dict[str, Any]]) -> None:
         """Distribute winnings to players."""
+        players_by_id = {p.player_id: p for p in self.players}
         for winner in winners:
-            player = self._get_player_by_id(winner["player_id"])
+            player = players_by_id.get(winner["player_id"])
             if player:
                 player.stack += winner["amount"]
     
@@ -611,6 +823,49 @@ class TexasHoldemGame:
         
         return result
     
+    def fold_all_except_one(self) -> None:
+        """
+        Fold whoever is to act, in turn order, until the hand is over.
+        
+        Equivalent to calling take_action(ActionType.FOLD) until the hand is
+        over, without validating each action (a fold is always legal). Turn
+        order is recomputed after every fold exactly as take_action() does,
+        so if players are all-in the hand can still reach a showdown
+        between them rather than end with one player left.
+        """
+        while self.is_hand_running():
+            self._fold_player(self.players[self.current_player_index])
+            self._advance_to_next_active_player()
+    
+    def batch_fold(self, n: int) -> int:
+        """
+        Fold the next n players to act.
+        
+        Equivalent to calling take_action(ActionType.FOLD) n times, without
+        validating each action. Stops early if the hand ends.
+        
+        Args:
+            n: Number of players to fold
+            
+        Returns:
+            Number of players actually folded
+        """
+        folded = 0
+        while folded < n and self.is_hand_running():
+            self._fold_player(self.players[self.current_player_index])
+            folded += 1
+            self._advance_to_next_active_player()
+        return folded
+    
+    def _fold_player(self, player: Player) -> None:
+        """Fold a player without action validation (internal fast path)."""
+        player.fold()
+        player.has_acted = True
+        self._log_action(ActionType.FOLD.value, {
+            "player": player.player_id,
+            "amount": 0
+        })
+    
     def _execute_action(self, player: Player, action_type: ActionType, amount: int) -> ActionResult:
         """Execute the specified action for the player."""
         chips_to_call = self.current_bet - player.current_bet
@@ -781,6 +1036,9 @@ class TexasHoldemGame:
         """
         Get legal actions for the specified player (or current player).
         
+        The current player's actions are cached while the betting state they
+        depend on is unchanged, so the returned list must not be modified.
+        
         Returns:
             List of action dicts with type and constraints
         """
@@ -790,6 +1048,17 @@ class TexasHoldemGame:
         if player is None or not player.is_active:
             return []
         
+        # Everything the current player's legal actions depend on
+        cache_key = None
+        if player is self.current_player:
+            cache_key = (
+                self.hand_number, self.phase, self.current_player_index,
+                self.current_bet, self.last_raise_amount,
+                player.stack, player.current_bet,
+            )
+            if cache_key == self._legal_cache_key:
+                return self._legal_cache_value
+        
         actions = []
         chips_to_call = max(0, self.current_bet - player.current_bet)
         
@@ -839,6 +1108,9 @@ class TexasHoldemGame:
                 "amount": player.stack + player.current_bet
             })
         
+        if cache_key is not None:
+            self._legal_cache_key = cache_key
+            self._legal_cache_value = actions
         return actions
     
     def get_state(self, for_player_id: Optional[str] = None) -> Dict[str, Any]:
@@ -937,20 +1209,34 @@ class TexasHoldemGame:
         })
     
     def get_winners(self) -> List[Dict[str, Any]]:
-        """Get winner information after hand is complete."""
+        """
+        Get winner information after hand is complete.
+        
+        Winners are recorded when the hand ends, so a hand won by folds
+        returns its sole winner without any hand evaluation or history scan.
+        """
         if self.phase != GamePhase.HAND_OVER:
             return []
-        
-        # Return from history
-        for entry in reversed(self.hand_history):
-            if entry["action"] in ("SHOWDOWN", "WIN_BY_FOLD"):
-                if "winners" in entry:
-                    return entry["winners"]
-                if "winner" in entry:
-                    return [{
-                        "player_id": entry["winner"],
-                        "amount": entry["amount"],
-                        "hand_type": "WIN_BY_FOLD",
-                        "description": "All other players folded"
-                    }]
-        return []
+        return self._winners
+
+
+def play_all_in_or_fold_hand(game: TexasHoldemGame) -> None:
+    """
+    Play out the running hand with an all-in-or-fold policy.
+    
+    Every player to act moves all-in while they have chips and folds
+    otherwise. Legal actions are not built: ALL_IN is legal exactly when the
+    player to act has a stack, so the stack is checked directly.
+    
+    Args:
+        game: Game with a hand in progress (returns at once if none is)
+    """
+    players = game.players
+    take_action = game.take_action
+    is_hand_running = game.is_hand_running
+    
+    while is_hand_running():
+        if players[game.current_player_index].stack > 0:
+            take_action(ActionType.ALL_IN)
+        else:
+            take_action(ActionType.FOLD)
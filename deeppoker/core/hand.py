@@ -18,15 +18,22 @@ Hand Rankings (best to worst):
 10. High Card: No made hand
 
 Note: Ace can be low in A-2-3-4-5 straight (wheel).
+
+Hands are ranked with Cactus-Kev style lookup tables (flushes, five distinct
+ranks, and paired hands keyed by a product of rank primes). The tables are
+loaded from the generated module _hand_tables.py, which
+``python -m deeppoker.core._gen_tables`` regenerates from the reference
+pattern-detection evaluator; if that module cannot be imported, they are
+built from the reference evaluator at import instead.
 """
 
 from __future__ import annotations
-from typing import List, Tuple, Dict, Optional
-from itertools import combinations
+from typing import List, Tuple, Dict, Optional, Iterable, Sequence
+from itertools import combinations, combinations_with_replacement
 from enum import IntEnum
 from collections import Counter
 
-from deeppoker.core.card import Card, Rank, Suit
+from deeppoker.core.card import Card, Rank, Suit, PRIMES
 
 
 class HandRank(IntEnum):
@@ -63,8 +70,11 @@ HAND_RANK_NAMES = {
 # This ensures Royal Flush (10) -> 0*M, High Card (1) -> 9*M
 RANK_MULTIPLIER = 1000000
 
+# Hand type by rank // RANK_MULTIPLIER, so it is read off a rank by index
+_HAND_TYPE_BY_BAND = tuple(HandRank(10 - band) for band in range(10))
+
 
-def evaluate_hand(cards: List[Card]) -> Tuple[int, HandRank, List[Card]]:
+def evaluate_hand(cards: List[Card]) -> Tuple[int, HandRank, Tuple[Card, ...]]:
     """
     Evaluate a poker hand (5-7 cards).
     
@@ -76,7 +86,7 @@ def evaluate_hand(cards: List[Card]) -> Tuple[int, HandRank, List[Card]]:
         - rank: Integer rank from 1 (Royal Flush) to 7462 (worst high card)
                 Lower is better.
         - hand_type: HandRank enum value
-        - best_cards: The 5 cards that make the best hand
+        - best_cards: Tuple of the 5 cards that make the best hand
         
     Raises:
         ValueError: If not 5-7 cards provided
@@ -86,25 +96,222 @@ def evaluate_hand(cards: List[Card]) -> Tuple[int, HandRank, List[Card]]:
     
     # If exactly 5 cards, evaluate directly
     if len(cards) == 5:
-        return _evaluate_5_cards(cards)
+        rank = _lookup_rank(cards)
+        hand_type = _HAND_TYPE_BY_BAND[rank // RANK_MULTIPLIER]
+        return rank, hand_type, tuple(_order_best_cards(cards, hand_type))
+    
+    # For 6-7 cards, rank the whole set at once instead of each 5-card subset
+    rank, best_cards = _evaluate_6_or_7(cards)
+    return rank, _HAND_TYPE_BY_BAND[rank // RANK_MULTIPLIER], best_cards
+
+
+def evaluate_rank(cards: List[Card]) -> int:
+    """
+    Rank a poker hand (5-7 cards) without building the best-five list.
+    
+    Cheaper than evaluate_hand() when only the rank is needed, e.g. to
+    compare hands.
+    
+    Args:
+        cards: List of 5-7 Card objects
+        
+    Returns:
+        Rank as returned by evaluate_hand(); lower is better
+        
+    Raises:
+        ValueError: If not 5-7 cards provided
+    """
+    if len(cards) == 5:
+        return _lookup_rank(cards)
+    if len(cards) < 5 or len(cards) > 7:
+        raise ValueError(f"Need 5-7 cards, got {len(cards)}")
+    return _evaluate_6_or_7(cards, with_cards=False)[0]
+
+
+def evaluate_ranks(hands: Iterable[Sequence[Card]]) -> List[int]:
+    """
+    Rank many hands (5-7 cards each) in one call.
+    
+    Equivalent to [evaluate_rank(h) for h in hands] with the per-hand
+    dispatch inlined, for equity or simulation loops over many boards.
     
-    # For 6-7 cards, find the best 5-card combination
-    best_rank = float('inf')
-    best_hand_type = HandRank.HIGH_CARD
+    Args:
+        hands: Iterable of 5-7 card hands
+        
+    Returns:
+        List of ranks in the same order; lower is better
+        
+    Raises:
+        ValueError: If a hand does not have 5-7 cards
+    """
+    eval5 = _eval5
+    evaluate_6_or_7 = _evaluate_6_or_7
+    ranks = []
+    append = ranks.append
+    for cards in hands:
+        n = len(cards)
+        if n == 5:
+            c0, c1, c2, c3, c4 = cards
+            append(eval5(c0._ck, c1._ck, c2._ck, c3._ck, c4._ck))
+        elif n == 6 or n == 7:
+            append(evaluate_6_or_7(cards, False)[0])
+        else:
+            raise ValueError(f"Need 5-7 cards, got {n}")
+    return ranks
+
+
+def _evaluate_6_or_7(
+    cards: List[Card], with_cards: bool = True
+) -> Tuple[int, Optional[Tuple[Card, ...]]]:
+    """
+    Rank 6 or 7 cards and pick the 5 that make the best hand.
+    
+    With at most 7 cards a flush can never be beaten by quads or a full
+    house (there are not enough off-suit cards), so if one suit has 5+
+    cards only that suit is ranked. Otherwise no subset is a flush and the
+    result depends only on the ranks, memoized by their prime product.
+    
+    Returns:
+        Tuple of (rank, best 5 cards in input order, or None if not with_cards)
+    """
+    # Count suits in one int, 4 bits per suit. Counts are at most 7, so
+    # adding 3 to every nibble sets its top bit exactly when it holds 5+.
+    suit_counts = 0
+    for card in cards:
+        suit_counts += 1 << (card.suit << 2)
+    flush_bits = (suit_counts + 0x3333) & 0x8888
+    
+    if flush_bits:
+        suit_bit = 1 << (12 + (flush_bits.bit_length() >> 2) - 1)
+        rank_bits = 0
+        for card in cards:
+            if card._ck & suit_bit:
+                rank_bits |= card._ck >> 16
+        rank, best_bits = _best_flush(rank_bits)
+        if not with_cards:
+            return rank, None
+        return rank, tuple([
+            c for c in cards if c._ck & suit_bit and (c._ck >> 16) & best_bits
+        ])
+    
+    product = 1
+    for card in cards:
+        product *= card._ck & 0xFF
+    best = _BEST_NON_FLUSH.get(product)
+    if best is None:
+        best = _BEST_NON_FLUSH[product] = _best_non_flush([c._ck for c in cards])
+    rank, best_ranks = best
+    if not with_cards:
+        return rank, None
+    
+    # Take the first card of each needed rank, keeping input order
+    needed = list(best_ranks)
     best_cards = []
+    for card in cards:
+        if card.rank in needed:
+            needed.remove(card.rank)
+            best_cards.append(card)
+    return rank, tuple(best_cards)
+
+
+def _best_flush(rank_bits: int) -> Tuple[int, int]:
+    """Best (rank, 5-bit rank mask) among the 5-card subsets of a suited rank mask."""
+    best = _BEST_FLUSH.get(rank_bits)
+    if best is None:
+        bits = [1 << r for r in range(13) if rank_bits >> r & 1]
+        best = _BEST_FLUSH[rank_bits] = min(
+            (_FLUSH_RANKS[sum(combo)], sum(combo))
+            for combo in combinations(bits, 5)
+        )
+    return best
+
+
+def _best_non_flush(cks: List[int]) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Best (rank, ranks used) among the 5-card subsets of Cactus-Kev cards.
     
-    for combo in combinations(cards, 5):
-        rank, hand_type, _ = _evaluate_5_cards(list(combo))
-        if rank < best_rank:
-            best_rank = rank
-            best_hand_type = hand_type
-            best_cards = list(combo)
+    The cards must not contain 5 of one suit.
+    """
+    best_combo = min(combinations(cks, 5), key=lambda combo: _eval5(*combo))
+    return _eval5(*best_combo), tuple((ck >> 8) & 0xF for ck in best_combo)
+
+
+# Memoized results of _best_flush / _best_non_flush, filled on first use
+_BEST_FLUSH: Dict[int, Tuple[int, int]] = {}
+_BEST_NON_FLUSH: Dict[int, Tuple[int, Tuple[int, ...]]] = {}
+
+
+def _lookup_rank(cards) -> int:
+    """Rank exactly 5 Card objects with the Cactus-Kev lookup tables."""
+    return _eval5(*[c._ck for c in cards])
+
+
+def _eval5(c0: int, c1: int, c2: int, c3: int, c4: int) -> int:
+    """
+    Rank 5 Cactus-Kev encoded cards.
+    
+    Pure integer kernel: flushes are indexed by their rank bits, five
+    distinct ranks by the same bits in a second table, and hands with
+    paired ranks by the product of their rank primes.
+    """
+    rank_bits = (c0 | c1 | c2 | c3 | c4) >> 16
+    if c0 & c1 & c2 & c3 & c4 & 0xF000:
+        return _FLUSH_RANKS[rank_bits]
+    rank = _UNIQUE5_RANKS[rank_bits]
+    if rank is not None:
+        return rank
+    return _PAIRED_RANKS[
+        (c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF)
+    ]
+
+
+# 13-bit rank masks (bit 0 = Two ... bit 12 = Ace) of the 10 straights,
+# best first; the last one is the wheel (A-2-3-4-5)
+STRAIGHT_MASKS = (
+    0x1F00, 0x0F80, 0x07C0, 0x03E0, 0x01F0,
+    0x00F8, 0x007C, 0x003E, 0x001F, 0x100F,
+)
+WHEEL_MASK = STRAIGHT_MASKS[-1]
+
+# Straight mask -> high card rank (Five for the wheel)
+_STRAIGHT_HIGH = {
+    mask: Rank(Rank.ACE - i) if mask != WHEEL_MASK else Rank.FIVE
+    for i, mask in enumerate(STRAIGHT_MASKS)
+}
+
+
+_PAIRED_HAND_TYPES = frozenset({
+    HandRank.FOUR_OF_A_KIND, HandRank.FULL_HOUSE, HandRank.THREE_OF_A_KIND,
+    HandRank.TWO_PAIR, HandRank.ONE_PAIR,
+})
+
+
+def _order_best_cards(cards: List[Card], hand_type: HandRank) -> List[Card]:
+    """Order 5 cards for display: grouped ranks first, then by rank descending."""
+    if hand_type in _PAIRED_HAND_TYPES:
+        rank_counts = Counter(c.rank for c in cards)
+        return _sort_by_count(cards, rank_counts)
     
-    return best_rank, best_hand_type, best_cards
+    sorted_cards = sorted(cards, key=lambda c: c.rank, reverse=True)
+    if hand_type == HandRank.STRAIGHT and _rank_bits(cards) == WHEEL_MASK:
+        sorted_cards = _reorder_wheel(sorted_cards)
+    return sorted_cards
+
+
+def _rank_bits(cards: List[Card]) -> int:
+    """13-bit mask of the ranks present in the cards."""
+    rank_bits = 0
+    for card in cards:
+        rank_bits |= card._ck >> 16
+    return rank_bits
 
 
 def _evaluate_5_cards(cards: List[Card]) -> Tuple[int, HandRank, List[Card]]:
-    """Evaluate exactly 5 cards."""
+    """
+    Evaluate exactly 5 cards by pattern detection.
+    
+    Reference implementation: only used to build the lookup tables.
+    """
     assert len(cards) == 5
     
     # Sort by rank descending
@@ -195,24 +402,16 @@ def _evaluate_5_cards(cards: List[Card]) -> Tuple[int, HandRank, List[Card]]:
 
 def _check_straight(ranks: List[Rank]) -> Tuple[bool, Optional[Rank]]:
     """
-    Check if sorted ranks form a straight.
+    Check if 5 ranks form a straight.
     
     Returns:
         Tuple of (is_straight, high_card_rank)
     """
-    unique_ranks = sorted(set(ranks), reverse=True)
-    if len(unique_ranks) != 5:
-        return False, None
-    
-    # Check regular straight
-    if unique_ranks[0] - unique_ranks[4] == 4:
-        return True, unique_ranks[0]
-    
-    # Check wheel (A-2-3-4-5)
-    if unique_ranks == [Rank.ACE, Rank.FIVE, Rank.FOUR, Rank.THREE, Rank.TWO]:
-        return True, Rank.FIVE  # 5-high straight
-    
-    return False, None
+    rank_bits = 0
+    for rank in ranks:
+        rank_bits |= 1 << rank
+    high = _STRAIGHT_HIGH.get(rank_bits)
+    return high is not None, high
 
 
 def _get_rank_with_count(rank_counts: Counter, count: int) -> Rank:
@@ -272,15 +471,11 @@ def compare_hands(cards1: List[Card], cards2: List[Card]) -> int:
     Returns:
         -1 if cards1 wins, 1 if cards2 wins, 0 if tie
     """
-    rank1, _, _ = evaluate_hand(cards1)
-    rank2, _, _ = evaluate_hand(cards2)
+    rank1 = evaluate_rank(cards1)
+    rank2 = evaluate_rank(cards2)
     
-    if rank1 < rank2:
-        return -1  # cards1 wins (lower rank = better)
-    elif rank1 > rank2:
-        return 1   # cards2 wins
-    else:
-        return 0   # tie
+    # Lower rank = better hand, so the sign of rank1 - rank2 is the result
+    return (rank1 > rank2) - (rank1 < rank2)
 
 
 def hand_rank_to_string(rank: int) -> str:
@@ -302,8 +497,17 @@ def get_hand_description(cards: List[Card]) -> str:
         return "Incomplete hand"
     
     rank, hand_type, best_cards = evaluate_hand(cards)
-    base_name = HAND_RANK_NAMES[hand_type]
+    return describe_hand(hand_type, best_cards)
+
+
+def describe_hand(hand_type: HandRank, best_cards: Sequence[Card]) -> str:
+    """
+    Describe an already evaluated hand.
     
+    Args:
+        hand_type: Hand type from evaluate_hand()
+        best_cards: The best 5 cards from evaluate_hand()
+    """
     # Add detail based on hand type
     if hand_type == HandRank.ROYAL_FLUSH:
         return "Royal Flush"
@@ -322,11 +526,9 @@ def get_hand_description(cards: List[Card]) -> str:
         high = max(c.rank for c in best_cards)
         return f"Flush, {_rank_name(high)} high"
     elif hand_type == HandRank.STRAIGHT:
-        # Handle wheel
-        ranks = [c.rank for c in best_cards]
-        if Rank.ACE in ranks and Rank.TWO in ranks:
+        high = _STRAIGHT_HIGH[_rank_bits(best_cards)]
+        if high == Rank.FIVE:
             return "Straight, Five high (Wheel)"
-        high = max(ranks)
         return f"Straight, {_rank_name(high)} high"
     elif hand_type == HandRank.THREE_OF_A_KIND:
         trips_rank = _get_most_common_rank(best_cards)
@@ -359,3 +561,64 @@ def _rank_name(rank: Rank) -> str:
         Rank.ACE: "Ace"
     }
     return names[rank]
+
+
+def _build_lookup_tables() -> Tuple[list, list, Dict[int, int]]:
+    """
+    Build the Cactus-Kev tables from the reference evaluator.
+    
+    Returns:
+        Tuple of:
+        - flush ranks indexed by 13-bit rank mask
+        - non-flush five-distinct-rank ranks indexed by rank mask (None if unused)
+        - ranks of hands with a repeated rank, keyed by rank-prime product
+    """
+    flush_ranks: list = [None] * 8192
+    unique5_ranks: list = [None] * 8192
+    paired_ranks: Dict[int, int] = {}
+    
+    for ranks in combinations_with_replacement(range(13), 5):
+        counts = Counter(ranks)
+        if max(counts.values()) == 5:
+            continue
+        
+        if len(counts) == 5:
+            mask = sum(1 << r for r in ranks)
+            flush = [Card(r, Suit.CLUBS) for r in ranks]
+            offsuit = flush[:4] + [Card(ranks[4], Suit.HEARTS)]
+            flush_ranks[mask] = _evaluate_5_cards(flush)[0]
+            unique5_ranks[mask] = _evaluate_5_cards(offsuit)[0]
+        else:
+            # Spread repeated ranks over different suits: never a flush
+            cards = [Card(r, Suit(i % 4)) for i, r in enumerate(ranks)]
+            product = 1
+            for r in ranks:
+                product *= PRIMES[r]
+            paired_ranks[product] = _evaluate_5_cards(cards)[0]
+    
+    return flush_ranks, unique5_ranks, paired_ranks
+
+
+def _load_lookup_tables() -> Tuple[list, list, Dict[int, int]]:
+    """
+    Load the generated lookup tables, building them if they are missing.
+    
+    The tables are generated into _hand_tables.py by
+    ``python -m deeppoker.core._gen_tables``, which saves rebuilding them
+    from the reference evaluator on every import.
+    """
+    try:
+        from deeppoker.core import _hand_tables
+    except ImportError:
+        return _build_lookup_tables()
+    
+    flush_ranks: list = [None] * 8192
+    unique5_ranks: list = [None] * 8192
+    for mask, rank in _hand_tables.FLUSH_RANKS.items():
+        flush_ranks[mask] = rank
+    for mask, rank in _hand_tables.UNIQUE5_RANKS.items():
+        unique5_ranks[mask] = rank
+    return flush_ranks, unique5_ranks, _hand_tables.PAIRED_RANKS
+
+
+_FLUSH_RANKS, _UNIQUE5_RANKS, _PAIRED_RANKS = _load_lookup_tables()
@@ -25,7 +25,7 @@ class PlayerState(Enum):
     SITTING_OUT = auto()  # Temporarily sitting out
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """
     A player in the Texas Hold'em game.
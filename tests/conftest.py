@@ -2,12 +2,25 @@
 Pytest configuration and shared fixtures for DeepPoker tests.
 """
 
+import random
+
 import pytest
 from deeppoker.core.card import Card, Deck, Rank, Suit
 from deeppoker.core.player import Player
 from deeppoker.core.game import TexasHoldemGame
 
 
+@pytest.fixture(autouse=True)
+def _isolated_rng(monkeypatch):
+    """
+    Give every test its own seeded deck RNG.
+    
+    Tests stay independent under pytest -n auto, and every run deals the
+    same cards, so a failure reproduces.
+    """
+    monkeypatch.setattr("deeppoker.core.card._rng", random.Random(0xBEEF))
+
+
 @pytest.fixture
 def deck():
     """Create a fresh shuffled deck."""
@@ -48,6 +61,24 @@ def six_player_game():
     )
 
 
+@pytest.fixture
+def game_factory():
+    """
+    Build games on demand: game_factory(num_players, start=False, **kwargs).
+    
+    Constructing a game is cheaper than deep-copying a prebuilt template,
+    so every call builds a new one. With start=True the first hand is
+    already dealt.
+    """
+    def make(num_players: int, start: bool = False, **kwargs) -> TexasHoldemGame:
+        game = TexasHoldemGame(num_players=num_players, **kwargs)
+        if start:
+            game.start_hand()
+        return game
+    
+    return make
+
+
 @pytest.fixture
 def sample_hand():
     """Create a sample 5-card hand (pair of aces)."""
@@ -2,6 +2,9 @@
 Tests for Card and Deck classes.
 """
 
+import copy
+import pickle
+
 import pytest
 from deeppoker.core.card import Card, Deck, Rank, Suit, parse_cards
 
@@ -90,6 +93,49 @@ class TestCard:
         
         card_set = {card1}
         assert card2 in card_set
+    
+    def test_card_ck_encoding(self):
+        """Test the Cactus-Kev encoding: rank bit, suit bit, rank index, prime."""
+        card = Card(Rank.KING, Suit.DIAMONDS)
+        
+        assert card.ck >> 16 == 1 << Rank.KING
+        assert (card.ck >> 12) & 0xF == 1 << Suit.DIAMONDS
+        assert (card.ck >> 8) & 0xF == Rank.KING
+        assert card.ck & 0xFF == 37
+    
+    def test_card_from_ck(self):
+        """Test decoding Cactus-Kev ints back to the shared card objects."""
+        for i in range(52):
+            card = Card.from_int(i)
+            assert Card.from_ck(card.ck) is card
+        
+        with pytest.raises(ValueError):
+            Card.from_ck(0)
+        with pytest.raises(ValueError):
+            Card.from_ck(Card(Rank.ACE, Suit.SPADES).ck ^ 1)
+    
+    def test_card_instances_are_shared(self):
+        """Test that equal cards are the same object, also after copy/pickle."""
+        card = Card(Rank.ACE, Suit.SPADES)
+        
+        assert Card(12, 3) is card
+        assert Card.from_string("As") is card
+        assert Card.from_int(51) is card
+        assert copy.deepcopy(card) is card
+        assert pickle.loads(pickle.dumps(card)) is card
+    
+    def test_card_is_immutable(self):
+        """Test that a shared card rejects attribute writes and deletes."""
+        card = Card(Rank.ACE, Suit.SPADES)
+        
+        with pytest.raises(AttributeError):
+            card.rank = Rank.TWO
+        with pytest.raises(AttributeError):
+            card._ck = 0
+        with pytest.raises(AttributeError):
+            del card.suit
+        assert Card.from_int(51).rank == Rank.ACE
+        assert card.short_str == "As"
 
 
 class TestDeck:
@@ -148,6 +194,16 @@ class TestDeck:
         """Test that dealt cards are tracked."""
         dealt = deck.deal(3)
         assert deck.dealt_cards == dealt
+    
+    def test_deck_shuffle_keeps_dealt_cards(self, deck):
+        """Reshuffling mid-deal only reorders the cards not yet dealt."""
+        dealt = deck.deal(5)
+        deck.shuffle()
+        assert deck.dealt_cards == dealt
+        assert deck.remaining == 47
+        
+        rest = deck.deal(47)
+        assert len(set(dealt + rest)) == 52
 
 
 class TestParseCards:
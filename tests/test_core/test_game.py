@@ -33,6 +33,44 @@ class TestGameInitialization:
         assert two_player_game.phase == GamePhase.WAITING
         assert not two_player_game.is_hand_running()
         assert two_player_game.is_game_running()
+    
+    def test_reset_restores_initial_state(self, two_player_game):
+        """Test that reset() returns a played game to its initial state."""
+        two_player_game.start_hand()
+        two_player_game.take_action(ActionType.FOLD)
+        
+        two_player_game.reset()
+        
+        assert two_player_game.phase == GamePhase.WAITING
+        assert two_player_game.hand_number == 0
+        assert two_player_game.dealer_position == 0
+        assert two_player_game.pot_total == 0
+        for player in two_player_game.players:
+            assert player.stack == 1000
+            assert player.hole_cards == []
+            assert player.state == PlayerState.ACTIVE
+    
+    def test_rng_seed_makes_deals_reproducible(self):
+        """Test that rng_seed fixes the deal, including after reset()."""
+        game = TexasHoldemGame(num_players=2, rng_seed=7)
+        game.start_hand()
+        first_deal = [p.hole_cards for p in game.players]
+        
+        game.reset()
+        game.start_hand()
+        assert [p.hole_cards for p in game.players] == first_deal
+        
+        other = TexasHoldemGame(num_players=2, rng_seed=7)
+        other.start_hand()
+        assert [p.hole_cards for p in other.players] == first_deal
+    
+    def test_stack_views(self, six_player_game):
+        """Test stacks, stack_total and num_active_with_chips."""
+        six_player_game.players[2].stack = 0
+        
+        assert six_player_game.stacks == [1000, 1000, 0, 1000, 1000, 1000]
+        assert six_player_game.stack_total == 5000
+        assert six_player_game.num_active_with_chips == 5
 
 
 class TestStartHand:
@@ -65,6 +103,36 @@ class TestStartHand:
         
         # Check current bet is big blind
         assert two_player_game.current_bet == 20
+    
+    def test_enter_showdown_state(self, six_player_game):
+        """Test the showdown setup skips blinds and dealing but moves the button."""
+        six_player_game._enter_showdown_state()
+        
+        assert six_player_game.phase == GamePhase.RIVER
+        assert six_player_game.hand_number == 1
+        assert six_player_game.dealer_position == 1
+        assert six_player_game.community_cards == []
+        for player in six_player_game.players:
+            assert player.hole_cards == []
+            assert player.current_bet == 0
+            assert player.state == PlayerState.ACTIVE
+    
+    def test_set_board(self, two_player_game):
+        """Test boards can be set from card ints or Cards, in place."""
+        two_player_game._enter_showdown_state()
+        board = two_player_game.community_cards
+        
+        two_player_game.set_board([51, 47, 43, 39, 35])
+        assert two_player_game.community_cards is board
+        assert [c.short_str for c in board] == ["As", "Ks", "Qs", "Js", "Ts"]
+        
+        two_player_game.set_board([board[0], 0])
+        assert [c.short_str for c in board] == ["As", "2c"]
+        
+        with pytest.raises(ValueError):
+            two_player_game.set_board(range(6))
+        with pytest.raises(ValueError):
+            two_player_game.set_board([52])
 
 
 class TestHeadsUpRules:
@@ -105,6 +173,52 @@ class TestActions:
         # Hand should be over
         assert not two_player_game.is_hand_running()
     
+    def test_action_records_use_slots(self, two_player_game):
+        """Test action results, records and pots carry no per-instance dict."""
+        two_player_game.start_hand()
+        
+        result = two_player_game.take_action(ActionType.RAISE, 60)
+        record = two_player_game.round_actions[-1]
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(record, "__dict__")
+        assert record.action_type == ActionType.RAISE
+        assert not hasattr(two_player_game.pots[0], "__dict__")
+    
+    def test_batch_fold_stops_when_hand_ends(self, six_player_game):
+        """Test batch_fold folds in turn order and stops at hand end."""
+        six_player_game.start_hand()
+        
+        assert six_player_game.batch_fold(2) == 2
+        assert six_player_game.num_active_players == 4
+        
+        assert six_player_game.batch_fold(10) == 3
+        assert not six_player_game.is_hand_running()
+        assert len(six_player_game.get_winners()) == 1
+    
+    @pytest.mark.parametrize("seed", range(4))
+    def test_fold_all_except_one_matches_fold_loop(self, seed):
+        """Test fold_all_except_one ends the hand like repeated FOLD actions when a player is all-in."""
+        games = [TexasHoldemGame(num_players=3, buy_in=1000, rng_seed=seed) for _ in range(2)]
+        for game in games:
+            game.start_hand()
+            # Short-stacked button shoves, small blind calls, big blind to act
+            game.current_player.stack = 80
+            assert game.take_action(ActionType.ALL_IN).success
+            assert game.take_action(ActionType.CALL).success
+        fold_loop, fast = games
+        
+        while fold_loop.is_hand_running():
+            assert fold_loop.take_action(ActionType.FOLD).success
+        fast.fold_all_except_one()
+        
+        # The big blind's fold closes the betting, so the small blind is
+        # never asked to act again and the board runs out to a showdown
+        assert len(fold_loop.community_cards) == 5
+        assert fast.phase == fold_loop.phase == GamePhase.HAND_OVER
+        assert fast.get_winners() == fold_loop.get_winners()
+        assert fast.stacks == fold_loop.stacks
+        assert fast.community_cards == fold_loop.community_cards
+    
     def test_call_action(self, two_player_game):
         """Test call action."""
         two_player_game.start_hand()
@@ -155,6 +269,24 @@ class TestActions:
 class TestBettingRounds:
     """Tests for betting round progression."""
     
+    def test_seat_masks_track_round_state(self, six_player_game):
+        """Test the in-hand / can-act / pending seat bitmasks."""
+        game = six_player_game
+        game.start_hand()
+        in_hand, can_act, pending = game._seat_masks()
+        assert in_hand == can_act == pending == 0b111111
+        
+        folder = game.current_player_index
+        game.take_action(ActionType.FOLD)
+        game.current_player.stack = 0
+        game.current_player.state = PlayerState.ALL_IN
+        
+        in_hand, can_act, pending = game._seat_masks()
+        assert not in_hand >> folder & 1
+        assert in_hand >> game.current_player_index & 1
+        assert not can_act >> game.current_player_index & 1
+        assert not pending >> folder & 1
+    
     def test_preflop_to_flop(self, two_player_game):
         """Test progression from preflop to flop."""
         two_player_game.start_hand()
@@ -220,6 +352,21 @@ class TestLegalActions:
         action_types = [a["type"] for a in actions]
         
         assert "CHECK" in action_types
+    
+    def test_legal_actions_cached_until_state_changes(self, two_player_game):
+        """Test that legal actions are reused until the betting state changes."""
+        two_player_game.start_hand()
+        
+        actions = two_player_game.get_legal_actions()
+        assert two_player_game.get_legal_actions() is actions
+        
+        two_player_game.current_player.stack = 15  # Can no longer raise
+        short_actions = two_player_game.get_legal_actions()
+        assert short_actions is not actions
+        assert "RAISE" not in [a["type"] for a in short_actions]
+        
+        two_player_game.take_action(ActionType.CALL)
+        assert two_player_game.get_legal_actions() is not short_actions
 
 
 class TestMinRaise:
@@ -447,6 +594,24 @@ class TestWinnerDetermination:
         winners = two_player_game.get_winners()
         assert len(winners) == 1
     
+    def test_winner_by_fold_details(self, two_player_game):
+        """A fold win reports the survivor and the pot without a showdown."""
+        two_player_game.start_hand()
+        folder = two_player_game.current_player.player_id
+        
+        two_player_game.take_action(ActionType.FOLD)
+        
+        winner = next(p for p in two_player_game.players if p.player_id != folder)
+        assert two_player_game.get_winners() == [{
+            "player_id": winner.player_id,
+            "amount": 30,
+            "hand_type": "WIN_BY_FOLD",
+            "description": "All other players folded",
+        }]
+        
+        two_player_game.start_hand()
+        assert two_player_game.get_winners() == []
+    
     def test_pot_awarded_to_winner(self, two_player_game):
         """Test that pot is awarded to winner."""
         two_player_game.start_hand()
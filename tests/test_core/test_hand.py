@@ -2,11 +2,15 @@
 Tests for hand evaluation.
 """
 
+from itertools import combinations
+
 import pytest
-from deeppoker.core.card import Card, Rank, Suit
+from deeppoker.core.card import Card, Rank, Suit, parse_cards
 from deeppoker.core.hand import (
-    evaluate_hand, compare_hands, HandRank,
-    get_hand_description
+    evaluate_hand, evaluate_rank, evaluate_ranks, compare_hands, HandRank,
+    get_hand_description, describe_hand,
+    _evaluate_5_cards, _lookup_rank, _build_lookup_tables,
+    _FLUSH_RANKS, _UNIQUE5_RANKS, _PAIRED_RANKS,
 )
 
 
@@ -82,6 +86,18 @@ class TestHandRanking:
         desc = get_hand_description(wheel_straight)
         assert "Five high" in desc or "Wheel" in desc
     
+    @pytest.mark.parametrize("high", list(Rank)[3:])
+    def test_every_straight_high_card(self, high):
+        """Each of the 10 straights is found with the right high card."""
+        ranks = [Rank.ACE, Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE]
+        if high != Rank.FIVE:
+            ranks = [Rank(high - i) for i in range(5)]
+        hand = [Card(r, Suit(i % 2)) for i, r in enumerate(ranks)]
+        
+        rank, hand_type, _ = evaluate_hand(hand)
+        assert hand_type == HandRank.STRAIGHT
+        assert get_hand_description(hand).startswith(f"Straight, {high.name.title()} high")
+    
     def test_three_of_a_kind(self):
         """Test three of a kind recognition."""
         hand = [
@@ -127,6 +143,24 @@ class TestHandRanking:
 class TestHandComparison:
     """Tests for comparing hands."""
     
+    def test_evaluate_rank_matches_evaluate_hand(self, royal_flush, sample_hand):
+        """evaluate_rank returns the same rank without the best cards."""
+        assert evaluate_rank(royal_flush) == evaluate_hand(royal_flush)[0]
+        assert evaluate_rank(sample_hand) == evaluate_hand(sample_hand)[0]
+        
+        with pytest.raises(ValueError):
+            evaluate_rank(royal_flush[:4])
+    
+    def test_evaluate_ranks_batch(self, royal_flush, straight_flush, sample_hand):
+        """evaluate_ranks ranks a batch of 5-7 card hands in order."""
+        seven = parse_cards("As Ks Qs Js 9s 2s 3h")
+        hands = [royal_flush, sample_hand, seven, seven[:6], straight_flush]
+        
+        assert evaluate_ranks(hands) == [evaluate_rank(h) for h in hands]
+        assert evaluate_ranks([]) == []
+        with pytest.raises(ValueError):
+            evaluate_ranks([royal_flush[:4]])
+    
     def test_royal_flush_beats_straight_flush(self, royal_flush, straight_flush):
         """Royal flush beats straight flush."""
         result = compare_hands(royal_flush, straight_flush)
@@ -227,6 +261,7 @@ class TestSevenCardEvaluation:
         ]
         rank, hand_type, best_cards = evaluate_hand(cards)
         assert hand_type == HandRank.FULL_HOUSE
+        assert isinstance(best_cards, tuple)
         assert len(best_cards) == 5
     
     def test_flush_from_six_suited(self):
@@ -242,11 +277,62 @@ class TestSevenCardEvaluation:
         ]
         rank, hand_type, _ = evaluate_hand(cards)
         assert hand_type == HandRank.FLUSH
+    
+    @pytest.mark.parametrize("cards", [
+        "As Ks Qs Js 9s 2s 3h",  # Flush from 6 suited
+        "5d 6d 7d 8d 9d Td 2c",  # Straight flush inside a longer flush
+        "2h 5h 9h Jh Kh Ac Ad",  # Heart flush over a pair
+        "3c 4c 8c Tc Qc 2d 2s",  # Club flush
+        "Ah Ad Ac Kh Ks 2d 2c",  # Full house, two pair choices
+        "Ah 2d 3c 4s 5h 9c 9d",  # Wheel plus pair
+        "Kh Kd Kc Ks 2h 3d 4c",  # Quads
+        "Ah Kd 9c 7s 5h 3c 2d",  # High card
+    ])
+    def test_seven_cards_match_best_subset(self, cards):
+        """Direct 6/7-card evaluation equals the best 5-card subset."""
+        cards = parse_cards(cards)
+        rank, hand_type, best_cards = evaluate_hand(cards)
+        
+        assert evaluate_rank(cards) == rank
+        assert rank == min(evaluate_hand(list(c))[0] for c in combinations(cards, 5))
+        assert evaluate_hand(best_cards)[0] == rank
+        
+        rank6, _, _ = evaluate_hand(cards[:6])
+        assert rank6 == min(evaluate_hand(list(c))[0] for c in combinations(cards[:6], 5))
+
+
+class TestLookupTables:
+    """Tests for the Cactus-Kev lookup tables."""
+    
+    def test_tables_cover_all_distinct_hands(self):
+        """There are exactly 7462 distinct 5-card hand ranks."""
+        ranks = set(_PAIRED_RANKS.values())
+        ranks.update(r for r in _UNIQUE5_RANKS if r is not None)
+        ranks.update(r for r in _FLUSH_RANKS if r is not None)
+        assert len(ranks) == 7462
+        assert min(ranks) == 0  # Royal flush
+    
+    def test_lookup_matches_reference_evaluator(self):
+        """Table lookup agrees with pattern detection over a 13-card sample."""
+        cards = [Card.from_int(i) for i in range(0, 52, 4)]  # All clubs
+        cards[1:4] = [Card.from_int(i) for i in (5, 9, 14)]  # Some offsuit
+        for combo in combinations(cards, 5):
+            assert _lookup_rank(combo) == _evaluate_5_cards(list(combo))[0]
+    
+    def test_generated_tables_are_current(self):
+        """The checked-in tables match a fresh build from the reference evaluator."""
+        assert (_FLUSH_RANKS, _UNIQUE5_RANKS, _PAIRED_RANKS) == _build_lookup_tables()
 
 
 class TestHandDescription:
     """Tests for hand description."""
     
+    def test_describe_hand_matches_get_hand_description(self, royal_flush, sample_hand):
+        """Describing an evaluated hand gives the same text as describing the cards."""
+        for cards in (royal_flush, sample_hand, parse_cards("As Ad Kh Kc 2s 2d 7h")):
+            _, hand_type, best_cards = evaluate_hand(cards)
+            assert describe_hand(hand_type, best_cards) == get_hand_description(cards)
+    
     def test_royal_flush_description(self, royal_flush):
         """Test royal flush description."""
         desc = get_hand_description(royal_flush)
@@ -9,368 +9,286 @@ These tests verify:
 - Different winners for different pots (side pots)
 """
 
+from collections import defaultdict
+from operator import itemgetter
+
 import pytest
-from deeppoker.core.game import TexasHoldemGame, ActionType
+from deeppoker.core.game import TexasHoldemGame, ActionType, Pot
 from deeppoker.core.player import PlayerState
+from deeppoker.core.rules import GamePhase
 from deeppoker.core.card import Card, Rank, Suit
 from deeppoker.core.hand import evaluate_hand, compare_hands, HandRank
 
 
+# All 52 cards by short string ("As", "Td"), built once for the module
+CARDS = {card.short_str: card for card in (Card(r, s) for r in Rank for s in Suit)}
+
+
+def C(s: str) -> Card:
+    """Look up a card by short string, e.g. C("As")."""
+    return CARDS[s]
+
+
+def set_hole(game: TexasHoldemGame, seat: int, cards: str) -> None:
+    """Give a player hole cards by string, e.g. set_hole(game, 0, "As Ah")."""
+    game.players[seat].hole_cards = [CARDS[s] for s in cards.split()]
+
+
+# Boards shared by several tests (copied into the game, which owns a list)
+DRY_BOARD = tuple(C(s) for s in ("2d", "3c", "4d", "5c", "7h"))  # No flush or straight
+ROYAL_CLUBS_BOARD = tuple(C(s) for s in ("Ac", "Kc", "Qc", "Jc", "Tc"))  # Everyone plays it
+
+# Player ids clockwise from the seat left of the button, by (dealer, num_players)
+PIDS_FROM_BUTTON = {
+    (dealer, n): tuple(str((dealer + 1 + i) % n) for i in range(n))
+    for n in range(2, 7)
+    for dealer in range(n)
+}
+
+
+def by_pid(winners: list) -> dict:
+    """Total winnings per player_id, over all pots."""
+    totals = defaultdict(int)
+    for w in winners:
+        totals[w["player_id"]] += w["amount"]
+    return dict(totals)
+
+
+def set_single_pot(game: TexasHoldemGame, amount: int, pids: list) -> None:
+    """Give the game one pot, as _calculate_side_pots() would for equal bets."""
+    game.pots = [Pot(amount=amount, eligible_players=pids)]
+
+
+def check_call_to_showdown(game: TexasHoldemGame, max_actions: int = 50) -> int:
+    """Play a started hand checking/calling on every street; return the action count."""
+    actions = 0
+    while game.is_hand_running() and actions < max_actions:
+        action_types = {a["type"] for a in game.get_legal_actions()}
+        if "CHECK" in action_types:
+            game.take_action(ActionType.CHECK)
+        elif "CALL" in action_types:
+            game.take_action(ActionType.CALL)
+        else:
+            break
+        actions += 1
+    return actions
+
+
+@pytest.fixture
+def showdown_game(game_factory):
+    """
+    Build games for showdown tests: showdown_game(num_players).
+    
+    Tests set the hole cards, board and bets by hand and then resolve the
+    showdown directly, so the game skips the shuffle, blinds and deal.
+    """
+    def make(num_players: int) -> TexasHoldemGame:
+        game = game_factory(num_players, buy_in=1000)
+        game._enter_showdown_state()
+        return game
+    
+    return make
+
+
 class TestShowdownBasics:
     """Basic showdown tests."""
     
-    def test_two_player_showdown_winner(self):
+    def test_two_player_showdown_winner(self, showdown_game):
         """Test basic 2-player showdown determines correct winner."""
-        game = TexasHoldemGame(num_players=2, buy_in=1000)
-        game.start_hand()
+        game = showdown_game(2)
         
         # Set up hands
         # Player 0: Pair of Aces
-        game.players[0].hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.ACE, Suit.HEARTS),
-        ]
+        set_hole(game, 0, "As Ah")
         # Player 1: Pair of Kings
-        game.players[1].hole_cards = [
-            Card(Rank.KING, Suit.SPADES),
-            Card(Rank.KING, Suit.HEARTS),
-        ]
+        set_hole(game, 1, "Ks Kh")
         
         # Set community cards
-        game.community_cards = [
-            Card(Rank.TWO, Suit.DIAMONDS),
-            Card(Rank.THREE, Suit.CLUBS),
-            Card(Rank.FOUR, Suit.DIAMONDS),
-            Card(Rank.FIVE, Suit.CLUBS),
-            Card(Rank.SEVEN, Suit.HEARTS),
-        ]
-        
-        # Set up bets for showdown
-        game.players[0].total_bet = 100
-        game.players[1].total_bet = 100
+        game.community_cards = list(DRY_BOARD)
         
-        game._calculate_side_pots()
+        # Each player bet 100: one pot, no side pots
+        set_single_pot(game, 200, ["0", "1"])
         winners = game._determine_winners()
         
         # Player 0 (Aces) should win
-        assert len(winners) == 1
-        assert winners[0]["player_id"] == "0"
-        assert winners[0]["amount"] == 200
+        assert by_pid(winners) == {"0": 200}
         
-    def test_three_player_showdown(self):
+    def test_three_player_showdown(self, showdown_game):
         """Test 3-player showdown determines correct winner."""
-        game = TexasHoldemGame(num_players=3, buy_in=1000)
-        game.start_hand()
+        game = showdown_game(3)
         
         # Player 0: Flush
-        game.players[0].hole_cards = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.KING, Suit.HEARTS),
-        ]
+        set_hole(game, 0, "Ah Kh")
         # Player 1: Straight
-        game.players[1].hole_cards = [
-            Card(Rank.SIX, Suit.SPADES),
-            Card(Rank.SEVEN, Suit.CLUBS),
-        ]
+        set_hole(game, 1, "6s 7c")
         # Player 2: Two Pair
-        game.players[2].hole_cards = [
-            Card(Rank.EIGHT, Suit.DIAMONDS),
-            Card(Rank.EIGHT, Suit.CLUBS),
-        ]
+        set_hole(game, 2, "8d 8c")
         
         # Board gives potential flush and straight
         game.community_cards = [
-            Card(Rank.TWO, Suit.HEARTS),
-            Card(Rank.THREE, Suit.HEARTS),
-            Card(Rank.FOUR, Suit.HEARTS),
-            Card(Rank.FIVE, Suit.SPADES),
-            Card(Rank.NINE, Suit.DIAMONDS),
+            C("2h"),
+            C("3h"),
+            C("4h"),
+            C("5s"),
+            C("9d"),
         ]
         
-        # All players bet same amount
-        for i, p in enumerate(game.players):
-            p.total_bet = 100
-            
-        game._calculate_side_pots()
+        # Each player bet 100: one pot, no side pots
+        set_single_pot(game, 300, ["0", "1", "2"])
         winners = game._determine_winners()
         
         # Player 0 (Flush) should win
-        assert len(winners) == 1
-        assert winners[0]["player_id"] == "0"
+        assert by_pid(winners) == {"0": 300}
         
 
 class TestBestFiveFromSeven:
     """Tests for selecting best 5 cards from 7."""
     
-    def test_best_five_uses_both_hole_cards(self):
-        """Test when best hand uses both hole cards."""
-        game = TexasHoldemGame(num_players=2, buy_in=1000)
-        game.start_hand()
-        
-        # Player 0: Pocket pair that becomes trips with board
-        game.players[0].hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.ACE, Suit.HEARTS),
-        ]
-        game.players[1].hole_cards = [
-            Card(Rank.KING, Suit.SPADES),
-            Card(Rank.QUEEN, Suit.HEARTS),
-        ]
-        
-        # Board that doesn't form a straight
-        game.community_cards = [
-            Card(Rank.ACE, Suit.DIAMONDS),  # Gives player 0 trips
-            Card(Rank.TWO, Suit.CLUBS),
-            Card(Rank.SEVEN, Suit.DIAMONDS),
-            Card(Rank.NINE, Suit.CLUBS),
-            Card(Rank.JACK, Suit.HEARTS),
-        ]
-        
-        # Evaluate player 0's hand
-        all_cards = game.players[0].hole_cards + game.community_cards
-        rank, hand_type, best_five = evaluate_hand(all_cards)
-        
-        # Should be three of a kind (Aces)
-        assert hand_type == HandRank.THREE_OF_A_KIND
-        # Best five should include both hole cards (AA) and board A
-        ace_count = sum(1 for c in best_five if c.rank == Rank.ACE)
-        assert ace_count == 3
-        
-    def test_best_five_uses_one_hole_card(self):
-        """Test when best hand uses only one hole card."""
-        # Player has A♠2♦, board is K♠Q♠J♠T♠3♥
-        # Best hand is K-high straight (K-Q-J-T-9 would need 9)
-        # Actually best is flush: K♠Q♠J♠T♠A♠ (using A♠)
-        hole = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.TWO, Suit.DIAMONDS),
-        ]
-        board = [
-            Card(Rank.KING, Suit.SPADES),
-            Card(Rank.QUEEN, Suit.SPADES),
-            Card(Rank.JACK, Suit.SPADES),
-            Card(Rank.TEN, Suit.SPADES),
-            Card(Rank.THREE, Suit.HEARTS),
-        ]
-        
-        all_cards = hole + board
-        rank, hand_type, best_five = evaluate_hand(all_cards)
-        
-        # Should be Royal Flush!
-        assert hand_type == HandRank.ROYAL_FLUSH
-        
-    def test_best_five_uses_zero_hole_cards(self):
-        """Test when best hand uses no hole cards (plays the board)."""
-        hole = [
-            Card(Rank.TWO, Suit.DIAMONDS),
-            Card(Rank.THREE, Suit.CLUBS),
-        ]
-        # Board is a straight flush
-        board = [
-            Card(Rank.FIVE, Suit.HEARTS),
-            Card(Rank.SIX, Suit.HEARTS),
-            Card(Rank.SEVEN, Suit.HEARTS),
-            Card(Rank.EIGHT, Suit.HEARTS),
-            Card(Rank.NINE, Suit.HEARTS),
-        ]
-        
-        all_cards = hole + board
-        rank, hand_type, best_five = evaluate_hand(all_cards)
-        
-        # Best hand is straight flush on board
-        assert hand_type == HandRank.STRAIGHT_FLUSH
+    @pytest.mark.parametrize("hole,board,expected_type,hole_cards_used", [
+        # Pocket aces make trips with the board ace
+        (("As", "Ah"), ("Ad", "2c", "7d", "9c", "Jh"), HandRank.THREE_OF_A_KIND, 2),
+        # A♠ completes the royal flush with the board
+        (("As", "2d"), ("Ks", "Qs", "Js", "Ts", "3h"), HandRank.ROYAL_FLUSH, 1),
+        # The board is a straight flush (plays the board)
+        (("2d", "3c"), ("5h", "6h", "7h", "8h", "9h"), HandRank.STRAIGHT_FLUSH, 0),
+    ])
+    def test_best_five(self, hole, board, expected_type, hole_cards_used):
+        """Best five cards may use two, one or none of the hole cards."""
+        hole_cards = [C(s) for s in hole]
+        rank, hand_type, best_five = evaluate_hand(hole_cards + [C(s) for s in board])
+        
+        assert hand_type == expected_type
+        assert len(best_five) == 5
+        assert sum(c in hole_cards for c in best_five) == hole_cards_used
 
 
 class TestTieHandling:
     """Tests for tie handling at showdown."""
     
-    def test_exact_tie_splits_pot(self):
+    def test_exact_tie_splits_pot(self, showdown_game):
         """Test that exact ties split the pot evenly."""
-        game = TexasHoldemGame(num_players=2, buy_in=1000)
-        game.start_hand()
+        game = showdown_game(2)
         
         # Both players have same hand (straight)
-        game.players[0].hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.TWO, Suit.HEARTS),
-        ]
-        game.players[1].hole_cards = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.TWO, Suit.SPADES),
-        ]
+        set_hole(game, 0, "As 2h")
+        set_hole(game, 1, "Ah 2s")
         
         # Board completes the same straight for both
         game.community_cards = [
-            Card(Rank.THREE, Suit.DIAMONDS),
-            Card(Rank.FOUR, Suit.CLUBS),
-            Card(Rank.FIVE, Suit.DIAMONDS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.HEARTS),
+            C("3d"),
+            C("4c"),
+            C("5d"),
+            C("Kc"),
+            C("Qh"),
         ]
         
-        game.players[0].total_bet = 100
-        game.players[1].total_bet = 100
-        
-        game._calculate_side_pots()
+        # Each player bet 100: one pot, no side pots
+        set_single_pot(game, 200, ["0", "1"])
         winners = game._determine_winners()
         
-        # Both should win
-        assert len(winners) == 2
-        # Each gets half
-        total_won = sum(w["amount"] for w in winners)
-        assert total_won == 200
+        # Both should win, each getting half
+        assert by_pid(winners) == {"0": 100, "1": 100}
         
-    def test_three_way_tie(self):
+    def test_three_way_tie(self, showdown_game):
         """Test three-way tie splits pot."""
-        game = TexasHoldemGame(num_players=3, buy_in=1000)
-        game.start_hand()
+        game = showdown_game(3)
         
         # All players play the board
-        game.players[0].hole_cards = [Card(Rank.TWO, Suit.SPADES), Card(Rank.THREE, Suit.SPADES)]
-        game.players[1].hole_cards = [Card(Rank.TWO, Suit.HEARTS), Card(Rank.THREE, Suit.HEARTS)]
-        game.players[2].hole_cards = [Card(Rank.TWO, Suit.DIAMONDS), Card(Rank.THREE, Suit.DIAMONDS)]
+        set_hole(game, 0, "2s 3s")
+        set_hole(game, 1, "2h 3h")
+        set_hole(game, 2, "2d 3d")
         
         # Board is the best hand for all
-        game.community_cards = [
-            Card(Rank.ACE, Suit.CLUBS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.CLUBS),
-            Card(Rank.JACK, Suit.CLUBS),
-            Card(Rank.TEN, Suit.CLUBS),
-        ]
+        game.community_cards = list(ROYAL_CLUBS_BOARD)
         
-        for p in game.players:
-            p.total_bet = 100
-            
-        game._calculate_side_pots()
+        # Each player bet 100: one pot, no side pots
+        set_single_pot(game, 300, ["0", "1", "2"])
         winners = game._determine_winners()
         
-        # All three should win
-        assert len(winners) == 3
-        # Total distributed should equal pot
-        total_won = sum(w["amount"] for w in winners)
-        assert total_won == 300
+        # All three should win, splitting the pot evenly
+        assert by_pid(winners) == {"0": 100, "1": 100, "2": 100}
         
-    def test_kicker_breaks_tie(self):
+    def test_kicker_breaks_tie(self, showdown_game):
         """Test that kicker breaks a tie."""
-        game = TexasHoldemGame(num_players=2, buy_in=1000)
-        game.start_hand()
+        game = showdown_game(2)
         
         # Player 0: Pair of Aces with King kicker
-        game.players[0].hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.KING, Suit.HEARTS),
-        ]
+        set_hole(game, 0, "As Kh")
         # Player 1: Pair of Aces with Queen kicker
-        game.players[1].hole_cards = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.QUEEN, Suit.SPADES),
-        ]
+        set_hole(game, 1, "Ah Qs")
         
         # Board without straight possibility
         game.community_cards = [
-            Card(Rank.ACE, Suit.DIAMONDS),
-            Card(Rank.TWO, Suit.CLUBS),
-            Card(Rank.SEVEN, Suit.DIAMONDS),
-            Card(Rank.NINE, Suit.CLUBS),
-            Card(Rank.JACK, Suit.HEARTS),
+            C("Ad"),
+            C("2c"),
+            C("7d"),
+            C("9c"),
+            C("Jh"),
         ]
         
-        game.players[0].total_bet = 100
-        game.players[1].total_bet = 100
-        
-        game._calculate_side_pots()
+        # Each player bet 100: one pot, no side pots
+        set_single_pot(game, 200, ["0", "1"])
         winners = game._determine_winners()
         
         # Player 0 should win (King kicker beats Queen)
-        assert len(winners) == 1
-        assert winners[0]["player_id"] == "0"
+        assert by_pid(winners) == {"0": 200}
 
 
 class TestMultiplePotWinners:
     """Tests for different winners in main pot vs side pots."""
     
-    def test_different_winner_per_pot(self):
+    def test_different_winner_per_pot(self, showdown_game):
         """Test that different players can win different pots."""
-        game = TexasHoldemGame(num_players=3, buy_in=1000)
-        game.start_hand()
+        game = showdown_game(3)
         
         # Player 0: Best hand, but shortest stack (only in main pot)
-        game.players[0].hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.ACE, Suit.HEARTS),
-        ]
+        set_hole(game, 0, "As Ah")
         game.players[0].total_bet = 100
         game.players[0].state = PlayerState.ALL_IN
         
         # Player 1: Second best hand, medium stack
-        game.players[1].hole_cards = [
-            Card(Rank.KING, Suit.SPADES),
-            Card(Rank.KING, Suit.HEARTS),
-        ]
+        set_hole(game, 1, "Ks Kh")
         game.players[1].total_bet = 300
         game.players[1].state = PlayerState.ALL_IN
         
         # Player 2: Worst hand, largest stack
-        game.players[2].hole_cards = [
-            Card(Rank.QUEEN, Suit.SPADES),
-            Card(Rank.QUEEN, Suit.HEARTS),
-        ]
+        set_hole(game, 2, "Qs Qh")
         game.players[2].total_bet = 300
         game.players[2].state = PlayerState.ACTIVE
         
         # Board doesn't improve anyone
-        game.community_cards = [
-            Card(Rank.TWO, Suit.DIAMONDS),
-            Card(Rank.THREE, Suit.CLUBS),
-            Card(Rank.FOUR, Suit.DIAMONDS),
-            Card(Rank.FIVE, Suit.CLUBS),
-            Card(Rank.SEVEN, Suit.HEARTS),
-        ]
+        game.community_cards = list(DRY_BOARD)
         
         game._calculate_side_pots()
         winners = game._determine_winners()
         
         # Player 0 wins main pot (100*3 = 300)
         # Player 1 wins side pot (200*2 = 400)
-        player_0_winnings = sum(w["amount"] for w in winners if w["player_id"] == "0")
-        player_1_winnings = sum(w["amount"] for w in winners if w["player_id"] == "1")
-        
-        assert player_0_winnings == 300
-        assert player_1_winnings == 400
+        assert by_pid(winners) == {"0": 300, "1": 400}
 
 
 class TestShowdownHandDescriptions:
     """Tests for hand description at showdown."""
     
-    def test_winner_hand_description(self):
+    def test_winner_hand_description(self, showdown_game):
         """Test that winner's hand is correctly described."""
-        game = TexasHoldemGame(num_players=2, buy_in=1000)
-        game.start_hand()
+        game = showdown_game(2)
         
         # Player 0: Full house
-        game.players[0].hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.ACE, Suit.HEARTS),
-        ]
-        game.players[1].hole_cards = [
-            Card(Rank.KING, Suit.SPADES),
-            Card(Rank.QUEEN, Suit.HEARTS),
-        ]
+        set_hole(game, 0, "As Ah")
+        set_hole(game, 1, "Ks Qh")
         
         # Board gives player 0 full house (Aces full of twos)
         game.community_cards = [
-            Card(Rank.ACE, Suit.DIAMONDS),
-            Card(Rank.TWO, Suit.CLUBS),
-            Card(Rank.TWO, Suit.DIAMONDS),
-            Card(Rank.FIVE, Suit.CLUBS),
-            Card(Rank.SEVEN, Suit.HEARTS),
+            C("Ad"),
+            C("2c"),
+            C("2d"),
+            C("5c"),
+            C("7h"),
         ]
         
-        game.players[0].total_bet = 100
-        game.players[1].total_bet = 100
-        
-        game._calculate_side_pots()
+        # Each player bet 100: one pot, no side pots
+        set_single_pot(game, 200, ["0", "1"])
         winners = game._determine_winners()
         
         assert len(winners) == 1
@@ -380,119 +298,63 @@ class TestShowdownHandDescriptions:
 class TestFoldedPlayersExcluded:
     """Tests that folded players are excluded from showdown."""
     
-    def test_folded_player_not_in_showdown(self):
+    def test_folded_player_not_in_showdown(self, showdown_game):
         """Folded players should not participate in showdown."""
-        game = TexasHoldemGame(num_players=3, buy_in=1000)
-        game.start_hand()
+        game = showdown_game(3)
         
         # Player 0 has best hand but folded
-        game.players[0].hole_cards = [
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.ACE, Suit.HEARTS),
-        ]
+        set_hole(game, 0, "As Ah")
         game.players[0].total_bet = 50
         game.players[0].state = PlayerState.FOLDED
         
         # Player 1 has medium hand
-        game.players[1].hole_cards = [
-            Card(Rank.KING, Suit.SPADES),
-            Card(Rank.KING, Suit.HEARTS),
-        ]
+        set_hole(game, 1, "Ks Kh")
         game.players[1].total_bet = 100
         
         # Player 2 has worst hand
-        game.players[2].hole_cards = [
-            Card(Rank.QUEEN, Suit.SPADES),
-            Card(Rank.QUEEN, Suit.HEARTS),
-        ]
+        set_hole(game, 2, "Qs Qh")
         game.players[2].total_bet = 100
         
-        game.community_cards = [
-            Card(Rank.TWO, Suit.DIAMONDS),
-            Card(Rank.THREE, Suit.CLUBS),
-            Card(Rank.FOUR, Suit.DIAMONDS),
-            Card(Rank.FIVE, Suit.CLUBS),
-            Card(Rank.SEVEN, Suit.HEARTS),
-        ]
+        game.community_cards = list(DRY_BOARD)
         
         game._calculate_side_pots()
         winners = game._determine_winners()
         
         # Player 0 should NOT win even though they have best hand
-        # Player 1 should win
-        assert all(w["player_id"] != "0" for w in winners)
-        assert any(w["player_id"] == "1" for w in winners)
+        # Player 1 should win both pots, including player 0's 50
+        assert by_pid(winners) == {"1": 250}
 
 
 class TestWSOP73OddChipRule:
     """Tests for WSOP Rule 73: Odd chip distribution."""
     
-    def test_odd_chip_to_first_player_from_button(self):
-        """Odd chip should go to first winner clockwise from the button."""
-        from deeppoker.core.game import Pot
-        
-        game = TexasHoldemGame(num_players=3, buy_in=1000)
-        game.start_hand()
+    @pytest.mark.parametrize("pot_amount,odd_chips", [
+        (100, 1),  # 100 / 3 = 33 remainder 1
+        (101, 2),  # 101 / 3 = 33 remainder 2
+    ])
+    def test_odd_chip(self, showdown_game, pot_amount, odd_chips):
+        """Odd chips go one each to the first winners clockwise from the button."""
+        game = showdown_game(3)
         
         # All players have same hand (play the board)
-        game.players[0].hole_cards = [Card(Rank.TWO, Suit.SPADES), Card(Rank.THREE, Suit.HEARTS)]
-        game.players[1].hole_cards = [Card(Rank.TWO, Suit.HEARTS), Card(Rank.THREE, Suit.SPADES)]
-        game.players[2].hole_cards = [Card(Rank.TWO, Suit.DIAMONDS), Card(Rank.THREE, Suit.CLUBS)]
+        set_hole(game, 0, "2s 3h")
+        set_hole(game, 1, "2h 3s")
+        set_hole(game, 2, "2d 3c")
         
         # Board is Royal Flush - everyone ties
-        game.community_cards = [
-            Card(Rank.ACE, Suit.CLUBS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.CLUBS),
-            Card(Rank.JACK, Suit.CLUBS),
-            Card(Rank.TEN, Suit.CLUBS),
-        ]
+        game.community_cards = list(ROYAL_CLUBS_BOARD)
         
-        # Set up pot with odd amount (100 / 3 = 33 remainder 1)
-        game.pots = [Pot(amount=100, eligible_players=['0', '1', '2'])]
+        set_single_pot(game, pot_amount, ["0", "1", "2"])
         
         winners = game._determine_winners()
+        amounts = by_pid(winners)
         
-        # Find who gets the extra chip
-        dealer = game.dealer_position
-        first_winner_pos = (dealer + 1) % 3
-        first_winner_pid = str(first_winner_pos)
-        
-        # The first winner clockwise from button should get 34
-        for w in winners:
-            if w["player_id"] == first_winner_pid:
-                assert w["amount"] == 34, f"Player {first_winner_pid} should get odd chip"
-            else:
-                assert w["amount"] == 33
-                
-    def test_odd_chip_with_two_remainder(self):
-        """When remainder is 2, first two winners get extra chips."""
-        from deeppoker.core.game import Pot
-        
-        game = TexasHoldemGame(num_players=3, buy_in=1000)
-        game.start_hand()
-        
-        # All players tie
-        game.players[0].hole_cards = [Card(Rank.TWO, Suit.SPADES), Card(Rank.THREE, Suit.HEARTS)]
-        game.players[1].hole_cards = [Card(Rank.TWO, Suit.HEARTS), Card(Rank.THREE, Suit.SPADES)]
-        game.players[2].hole_cards = [Card(Rank.TWO, Suit.DIAMONDS), Card(Rank.THREE, Suit.CLUBS)]
+        # Total should be the whole pot
+        assert sum(map(itemgetter("amount"), winners)) == pot_amount
         
-        game.community_cards = [
-            Card(Rank.ACE, Suit.CLUBS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.CLUBS),
-            Card(Rank.JACK, Suit.CLUBS),
-            Card(Rank.TEN, Suit.CLUBS),
-        ]
-        
-        # 101 / 3 = 33 remainder 2
-        game.pots = [Pot(amount=101, eligible_players=['0', '1', '2'])]
-        
-        winners = game._determine_winners()
-        
-        # Total should be 101
-        total = sum(w["amount"] for w in winners)
-        assert total == 101
+        # The first winners clockwise from the button get 34, the rest 33
+        for i, pid in enumerate(PIDS_FROM_BUTTON[(game.dealer_position, 3)]):
+            assert amounts[pid] == (34 if i < odd_chips else 33), f"Player {pid}"
 
 
 class TestShowdownIntegration:
@@ -500,32 +362,28 @@ class TestShowdownIntegration:
     
     def test_full_hand_to_showdown(self):
         """Test complete hand from start to showdown."""
-        game = TexasHoldemGame(num_players=3, buy_in=1000)
+        game = TexasHoldemGame(num_players=3, buy_in=1000, rng_seed=0)
         game.start_hand()
         
-        # Play through all streets checking/calling
-        max_actions = 50
-        actions = 0
+        # Preflop: UTG and SB call, BB checks; then three checks per street
+        assert check_call_to_showdown(game) == 12
         
-        while game.is_hand_running() and actions < max_actions:
-            legal = game.get_legal_actions()
-            action_types = [a["type"] for a in legal]
-            
-            if "CHECK" in action_types:
-                game.take_action(ActionType.CHECK)
-            elif "CALL" in action_types:
-                game.take_action(ActionType.CALL)
-            else:
-                break
-            actions += 1
-            
         # Game should have completed
-        from deeppoker.core.rules import GamePhase
         assert game.phase == GamePhase.HAND_OVER
         
-        # There should be winner(s)
+        # There should be winner(s), sharing the whole pot (3 x big blind)
         winners = game.get_winners()
         assert len(winners) >= 1
-        
-        # Total won should equal pot
-        # (Pot = all bets collected)
+        assert sum(map(itemgetter("amount"), winners)) == 60
+    
+    @pytest.mark.slow
+    def test_full_hands_to_showdown_many_deals(self):
+        """Every seeded deal checked/called down ends in a showdown that pays the pot."""
+        for seed in range(500):
+            game = TexasHoldemGame(num_players=3, buy_in=1000, rng_seed=seed)
+            game.start_hand()
+            
+            assert check_call_to_showdown(game) == 12, seed
+            assert game.phase == GamePhase.HAND_OVER, seed
+            assert sum(map(itemgetter("amount"), game.get_winners())) == 60, seed
+            assert game.stack_total == 3000, seed
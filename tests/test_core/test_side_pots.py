@@ -91,6 +91,10 @@ class TestSidePotCalculation:
         assert len(game.pots[1].eligible_players) == 2
         assert game.players[0].player_id not in game.pots[1].eligible_players
         
+        # Seat bitmasks name the same players
+        assert game.pots[0].eligible_mask == 0b111
+        assert game.pots[1].eligible_mask == 0b110
+        
     def test_calculate_side_pots_three_levels(self):
         """
         Test: A(100), B(200), C(500) all go all-in
@@ -150,6 +154,7 @@ class TestSidePotCalculation:
         # Folded player should not be eligible in any pot
         for pot in game.pots:
             assert game.players[0].player_id not in pot.eligible_players
+            assert not pot.eligible_mask & 1
             
     def test_no_side_pot_when_equal_stacks(self):
         """No side pot needed when all players bet the same amount."""
@@ -167,6 +172,42 @@ class TestSidePotCalculation:
         assert len(game.pots) == 1
         assert game.pots[0].amount == 300
         assert len(game.pots[0].eligible_players) == 3
+        
+    def test_repeated_bet_pattern_builds_fresh_pots(self):
+        """Side pots for a repeated bet pattern are new objects, unaffected by earlier edits."""
+        game = TexasHoldemGame(num_players=3, buy_in=1000)
+        game.start_hand()
+        
+        for player, bet in zip(game.players, (100, 300, 300)):
+            player.total_bet = bet
+            player.state = PlayerState.ALL_IN
+        
+        game._calculate_side_pots()
+        first = game.pots
+        first[0].amount = 0
+        first[0].eligible_players.clear()
+        
+        game._calculate_side_pots()
+        assert game.pots[0] is not first[0]
+        assert [pot.amount for pot in game.pots] == [300, 400]
+        assert game.pots[0].eligible_players == ["0", "1", "2"]
+        
+    def test_single_pot_excludes_folded_equal_bet(self):
+        """A player who matched the bet and then folded stays out of the single pot."""
+        game = TexasHoldemGame(num_players=3, buy_in=1000)
+        game.start_hand()
+        
+        for player in game.players:
+            player.total_bet = 100
+            player.state = PlayerState.ACTIVE
+        game.players[0].state = PlayerState.FOLDED
+        
+        game._calculate_side_pots()
+        
+        assert len(game.pots) == 1
+        assert game.pots[0].amount == 300
+        assert game.pots[0].eligible_players == ["1", "2"]
+        assert game.pots[0].eligible_mask == 0b110
 
 
 class TestSidePotDistribution:
@@ -239,6 +280,71 @@ class TestSidePotDistribution:
         assert player_a_winnings == 300  # Main pot
         assert player_b_winnings == 400  # Side pot
         
+    def test_resolve_showdown_pays_winners(self):
+        """_resolve_showdown builds the pots, picks the winners and credits their stacks."""
+        game = TexasHoldemGame(num_players=3, buy_in=1000)
+        game.start_hand()
+        
+        for player, bet in zip(game.players, (100, 300, 300)):
+            player.total_bet = bet
+            player.state = PlayerState.ALL_IN
+        game.players[0].hole_cards = [Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.SPADES)]
+        game.players[1].hole_cards = [Card(Rank.KING, Suit.HEARTS), Card(Rank.KING, Suit.DIAMONDS)]
+        game.players[2].hole_cards = [Card(Rank.TWO, Suit.CLUBS), Card(Rank.THREE, Suit.CLUBS)]
+        game.community_cards = [
+            Card(Rank.QUEEN, Suit.SPADES),
+            Card(Rank.JACK, Suit.SPADES),
+            Card(Rank.TEN, Suit.SPADES),
+            Card(Rank.KING, Suit.CLUBS),
+            Card(Rank.QUEEN, Suit.DIAMONDS),
+        ]
+        stacks_before = game.stacks
+        
+        winners = game._resolve_showdown()
+        
+        assert [pot.amount for pot in game.pots] == [300, 400]
+        assert [(w["player_id"], w["amount"]) for w in winners] == [("0", 300), ("1", 400)]
+        assert game.stacks == [stacks_before[0] + 300, stacks_before[1] + 400, stacks_before[2]]
+        
+    def test_each_hand_evaluated_once(self, monkeypatch):
+        """Hands are ranked in one batch; only winners' best cards are worked out, once each."""
+        import deeppoker.core.game as game_module
+        
+        game = TexasHoldemGame(num_players=3, buy_in=1000)
+        game.start_hand()
+        
+        # Three all-in levels: every player is in the main pot, two in the side pot
+        for player, bet in zip(game.players, (100, 200, 300)):
+            player.total_bet = bet
+            player.state = PlayerState.ALL_IN
+        game.community_cards = [
+            Card(Rank.TWO, Suit.CLUBS),
+            Card(Rank.SEVEN, Suit.DIAMONDS),
+            Card(Rank.NINE, Suit.HEARTS),
+            Card(Rank.JACK, Suit.SPADES),
+            Card(Rank.KING, Suit.CLUBS),
+        ]
+        game._calculate_side_pots()
+        assert len(game.pots) == 3
+        
+        calls = []
+        batches = []
+        evaluate_hand = game_module.evaluate_hand
+        evaluate_ranks = game_module.evaluate_ranks
+        monkeypatch.setattr(
+            game_module, "evaluate_hand",
+            lambda cards: calls.append(cards) or evaluate_hand(cards),
+        )
+        monkeypatch.setattr(
+            game_module, "evaluate_ranks",
+            lambda hands: batches.append(hands) or evaluate_ranks(hands),
+        )
+        winners = game._determine_winners()
+        
+        assert [len(hands) for hands in batches] == [3]
+        assert len(calls) == len({w["player_id"] for w in winners})
+        assert sum(w["amount"] for w in winners) == 600
+        
     def test_split_pot_with_remainder(self):
         """Test split pot distribution when amount doesn't divide evenly."""
         game = TexasHoldemGame(num_players=2, buy_in=1000)